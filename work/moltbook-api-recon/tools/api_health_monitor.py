@@ -11,13 +11,13 @@ Date: 2026-02-05
 
 import sys
 import os
-import json
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Optional, Dict, List, Any
 
 # Add tools directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_cassette
 
 
 # Undocumented endpoints to monitor
@@ -54,7 +54,7 @@ class HealthCheckResult:
 
     def __init__(self, endpoint_info: Dict[str, Any]):
         self.info = endpoint_info
-        self.status = None  # 'ok', 'failed', 'degraded'
+        self.status = None  # 'ok', 'failed', 'degraded', 'timeout'
         self.response_time = None
         self.error = None
         self.data = None
@@ -103,6 +103,10 @@ def check_endpoint(client: moltbook_sdk.MoltbookClient, endpoint_info: Dict[str,
             result.status = 'degraded'
             result.error = "Response indicates failure"
 
+    except moltbook_sdk.MoltbookTimeoutError as e:
+        result.status = 'timeout'
+        result.error = str(e)
+
     except moltbook_sdk.MoltbookAPIError as e:
         result.status = 'failed'
         result.error = str(e)
@@ -114,13 +118,16 @@ def check_endpoint(client: moltbook_sdk.MoltbookClient, endpoint_info: Dict[str,
     return result
 
 
-def run_health_check(api_key: str = None, save_to_file: bool = True) -> List[HealthCheckResult]:
+def run_health_check(api_key: str = None, save_to_file: bool = True,
+                     deadline: Optional[float] = 60.0) -> List[HealthCheckResult]:
     """
     Run health checks on all monitored endpoints.
 
     Args:
         api_key: Optional API key
         save_to_file: Whether to save results to JSON file
+        deadline: Seconds the whole check may take (None = no limit);
+            endpoints not reached in time are reported as 'timeout'
 
     Returns:
         List of HealthCheckResult objects
@@ -133,15 +140,18 @@ def run_health_check(api_key: str = None, save_to_file: bool = True) -> List[Hea
     client = moltbook_sdk.MoltbookClient(api_key=api_key)
     results = []
 
-    for endpoint_info in MONITORED_ENDPOINTS:
-        result = check_endpoint(client, endpoint_info)
-        results.append(result)
+    with moltbook_sdk.deadline(deadline):
+        for endpoint_info in MONITORED_ENDPOINTS:
+            results.append(check_endpoint(client, endpoint_info))
+
+    for result in results:
 
         # Display result
         status_icon = {
             'ok': '✅',
             'degraded': '⚠️',
-            'failed': '❌'
+            'failed': '❌',
+            'timeout': '⏱️'
         }.get(result.status, '❓')
 
         print(f"{status_icon} {result.info['name']}")
@@ -173,15 +183,17 @@ def run_health_check(api_key: str = None, save_to_file: bool = True) -> List[Hea
     ok_count = sum(1 for r in results if r.status == 'ok')
     failed_count = sum(1 for r in results if r.status == 'failed')
     degraded_count = sum(1 for r in results if r.status == 'degraded')
+    timeout_count = sum(1 for r in results if r.status == 'timeout')
 
     print(f"✅ OK: {ok_count}/{len(results)}")
     print(f"❌ Failed: {failed_count}/{len(results)}")
     print(f"⚠️  Degraded: {degraded_count}/{len(results)}")
+    print(f"⏱️  Timed out: {timeout_count}/{len(results)}")
 
     # Critical failures
     critical_failures = [
         r for r in results
-        if r.status in ['failed', 'degraded'] and r.info['critical']
+        if r.status in ['failed', 'degraded', 'timeout'] and r.info['critical']
     ]
 
     if critical_failures:
@@ -209,17 +221,17 @@ def save_results(results: List[HealthCheckResult]):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f'health_check_{timestamp}.json')
 
-    with open(log_file, 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'results': [r.to_dict() for r in results],
-            'summary': {
-                'total': len(results),
-                'ok': sum(1 for r in results if r.status == 'ok'),
-                'failed': sum(1 for r in results if r.status == 'failed'),
-                'degraded': sum(1 for r in results if r.status == 'degraded')
-            }
-        }, f, indent=2)
+    moltbook_sdk.save_json(log_file, {
+        'timestamp': datetime.now().isoformat(),
+        'results': [r.to_dict() for r in results],
+        'summary': {
+            'total': len(results),
+            'ok': sum(1 for r in results if r.status == 'ok'),
+            'failed': sum(1 for r in results if r.status == 'failed'),
+            'degraded': sum(1 for r in results if r.status == 'degraded'),
+            'timeout': sum(1 for r in results if r.status == 'timeout')
+        }
+    })
 
     print(f"\n📝 Results saved to: {log_file}")
 
@@ -248,8 +260,7 @@ def compare_with_previous(current_results: List[HealthCheckResult]) -> bool:
     previous_file = os.path.join(log_dir, log_files[1])
 
     try:
-        with open(previous_file, 'r') as f:
-            previous_data = json.load(f)
+        previous_data = moltbook_sdk.load_json(previous_file)
 
         # Compare statuses
         previous_statuses = {
@@ -280,13 +291,15 @@ def compare_with_previous(current_results: List[HealthCheckResult]) -> bool:
         return False
 
 
-def continuous_monitor(interval_minutes: int = 30, api_key: str = None):
+def continuous_monitor(interval_minutes: int = 30, api_key: str = None,
+                       deadline: Optional[float] = 60.0):
     """
     Run continuous monitoring with specified interval.
 
     Args:
         interval_minutes: Minutes between checks
         api_key: Optional API key
+        deadline: Seconds each check may take
     """
     import time
 
@@ -295,7 +308,7 @@ def continuous_monitor(interval_minutes: int = 30, api_key: str = None):
 
     try:
         while True:
-            run_health_check(api_key=api_key, save_to_file=True)
+            run_health_check(api_key=api_key, save_to_file=True, deadline=deadline)
 
             print(f"\n⏰ Next check in {interval_minutes} minutes...")
             print("Press Ctrl+C to stop\n")
@@ -334,13 +347,23 @@ def main():
         type=int,
         default=30
     )
+    parser.add_argument(
+        '--deadline',
+        help='Seconds a whole health check may take (default: 60)',
+        type=float,
+        default=60.0
+    )
+
+    moltbook_cassette.add_arguments(parser)
 
     args = parser.parse_args()
+    moltbook_cassette.install(args)
 
     if args.continuous:
-        continuous_monitor(args.interval, args.api_key)
+        continuous_monitor(args.interval, args.api_key, args.deadline)
     else:
-        run_health_check(api_key=args.api_key, save_to_file=not args.no_save)
+        run_health_check(api_key=args.api_key, save_to_file=not args.no_save,
+                         deadline=args.deadline)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,7 @@ Date: 2026-02-05
 
 import sys
 import os
-import json
+import glob
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
@@ -22,30 +22,46 @@ from collections import defaultdict
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_ratelimit
+import moltbook_actions
+import moltbook_store
+import moltbook_cassette
 
 
-# Rate limits (from SKILL.md)
+# Rate limits (from SKILL.md, enforced across processes by moltbook_ratelimit)
 RATE_LIMITS = {
-    'post_interval': 30 * 60,  # 30 minutes between posts
-    'comment_interval': 20,    # 20 seconds between comments
-    'max_comments_per_day': 100
+    'post_interval': moltbook_ratelimit.POST_INTERVAL,        # 30 minutes between posts
+    'comment_interval': moltbook_ratelimit.COMMENT_INTERVAL,  # 20 seconds between comments
+    'max_comments_per_day': moltbook_ratelimit.MAX_COMMENTS_PER_DAY
 }
 
 
+# Post ids upvoted by any campaign run, kept next to the daily state files
+UPVOTES_FILE = "campaign_upvotes.json"
+
+
 class CampaignState:
     """Track campaign state and progress"""
 
-    def __init__(self, campaign_file: str = None):
+    def __init__(self, campaign_file: str = None, upvotes_file: str = None):
+        """
+        Args:
+            campaign_file: Daily state file (default: campaign_state_YYYYMMDD.json)
+            upvotes_file: Upvoted post ids across all days (default:
+                UPVOTES_FILE in the state file's directory)
+        """
         self.campaign_file = campaign_file or f"campaign_state_{datetime.now().strftime('%Y%m%d')}.json"
+        self.upvotes_file = upvotes_file or os.path.join(os.path.dirname(self.campaign_file),
+                                                         UPVOTES_FILE)
         self.state = self._load_state()
+        self.upvoted = self._load_upvoted()
 
     def _load_state(self) -> Dict:
         """Load campaign state from file"""
         try:
             if os.path.exists(self.campaign_file):
-                with open(self.campaign_file, 'r') as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError):
+                return moltbook_sdk.load_json(self.campaign_file)
+        except (ValueError, IOError):
             pass
 
         # Default state
@@ -65,10 +81,33 @@ class CampaignState:
             }
         }
 
+    def _load_upvoted(self) -> set:
+        """
+        Post ids upvoted in earlier runs. The daily state file rotates, so
+        they live in `upvotes_file`; when it does not exist yet, it is
+        seeded from every campaign_state_*.json next to it.
+        """
+        try:
+            if os.path.exists(self.upvotes_file):
+                return set(moltbook_sdk.load_json(self.upvotes_file))
+        except (ValueError, IOError):
+            pass
+
+        upvoted = set()
+        pattern = os.path.join(os.path.dirname(self.upvotes_file), 'campaign_state_*.json')
+        for path in sorted(set(glob.glob(pattern)) | {self.campaign_file}):
+            try:
+                state = moltbook_sdk.load_json(path) if os.path.exists(path) else {}
+            except (ValueError, IOError):
+                continue
+            upvoted.update(action['target_id'] for action in state.get('completed_actions', [])
+                           if action.get('type') == 'upvote' and action.get('success'))
+        return upvoted
+
     def save_state(self):
-        """Save campaign state to file"""
-        with open(self.campaign_file, 'w') as f:
-            json.dump(self.state, f, indent=2)
+        """Save campaign state (and the upvoted post ids) to file"""
+        moltbook_sdk.save_json(self.campaign_file, self.state)
+        moltbook_sdk.save_json(self.upvotes_file, sorted(self.upvoted))
 
     def can_post(self) -> Tuple[bool, Optional[str]]:
         """Check if we can post (respects rate limits)"""
@@ -130,6 +169,7 @@ class CampaignState:
 
             elif action_type == 'upvote':
                 self.state['stats']['total_upvotes_given'] += 1
+                self.upvoted.add(target_id)
         else:
             self.state['failed_actions'].append(action)
 
@@ -143,7 +183,8 @@ class ContentRecommender:
         self.client = client
 
     def get_recommendations(self, agent_name: str,
-                           strategy: str = "balanced") -> List[Dict]:
+                           strategy: str = "balanced",
+                           profile: Optional[Dict] = None) -> List[Dict]:
         """
         Get engagement recommendations for an agent.
 
@@ -152,12 +193,16 @@ class ContentRecommender:
         - engagement: Focus on posts with high engagement
         - recent: Focus on recent posts
         - balanced: Mix of all factors
+
+        `profile` skips the request when the profile is already fetched.
         """
-        profile = self.client.get_agent_profile(agent_name)
+        if profile is None:
+            profile = self.client.get_agent_profile(agent_name)
         posts_data = profile.get('recentPosts', [])
         posts = [moltbook_sdk.Post.from_dict(p) for p in posts_data]
 
         recommendations = []
+        now = time.time()
 
         for post in posts:
             # Calculate priority score
@@ -175,17 +220,13 @@ class ContentRecommender:
                 score += post.upvotes * 0.5
                 score += post.comment_count * 2
 
-            if strategy in ['recent', 'balanced']:
+            if strategy in ['recent', 'balanced'] and post.created_ts:
                 # Recency bonus
-                try:
-                    post_time = datetime.fromisoformat(post.created_at.replace('+00:00', ''))
-                    hours_old = (datetime.now() - post_time).total_seconds() / 3600
-                    if hours_old < 24:
-                        score += 10
-                    elif hours_old < 48:
-                        score += 5
-                except (ValueError, AttributeError):
-                    pass
+                age = now - post.created_ts
+                if age < 24 * 3600:
+                    score += 10
+                elif age < 48 * 3600:
+                    score += 5
 
             recommendations.append({
                 'post': post,
@@ -216,19 +257,33 @@ class ContentRecommender:
 class EngagementCampaign:
     """Manage an intelligent engagement campaign"""
 
-    def __init__(self, api_key: str, state_file: str = None):
-        self.client = moltbook_sdk.MoltbookClient(api_key=api_key)
+    def __init__(self, api_key: str, state_file: str = None,
+                 store: Optional[moltbook_store.MoltbookStore] = None, offline: bool = False):
+        """
+        Args:
+            api_key: Moltbook API key
+            state_file: Campaign state file path
+            store: Optional MoltbookStore mirroring every fetched profile
+            offline: Read target profiles from `store` instead of the API
+                (votes are still sent when live)
+        """
+        self.client = moltbook_sdk.MoltbookClient(
+            api_key=api_key, rate_limiter=moltbook_ratelimit.RateLimiter(),
+            listeners=[store] if store is not None else None
+        )
+        self.source = store if offline else self.client
         self.state = CampaignState(state_file)
-        self.recommender = ContentRecommender(self.client)
+        self.recommender = ContentRecommender(self.source)
 
-    def analyze_target(self, agent_name: str) -> Dict:
-        """Analyze a target agent and generate engagement plan"""
+    def analyze_target(self, agent_name: str, profile: Optional[Dict] = None) -> Dict:
+        """Analyze a target agent (fetched unless `profile` is given) and generate engagement plan"""
         print(f"\n🎯 Analyzing target: {agent_name}")
 
-        profile = self.client.get_agent_profile(agent_name)
+        if profile is None:
+            profile = self.source.get_agent_profile(agent_name)
         agent = profile.get('agent', {})
 
-        recommendations = self.recommender.get_recommendations(agent_name)
+        recommendations = self.recommender.get_recommendations(agent_name, profile=profile)
 
         plan = {
             'agent': agent,
@@ -241,14 +296,20 @@ class EngagementCampaign:
 
     def execute_campaign(self, targets: List[str],
                         max_actions: int = 20,
-                        dry_run: bool = True) -> Dict:
+                        dry_run: bool = True,
+                        deadline: Optional[float] = None) -> Dict:
         """
         Execute an engagement campaign across multiple targets.
 
+        Upvotes are queued on a moltbook_actions.ActionQueue and sent in
+        the background while the remaining targets are analyzed.
+
         Args:
             targets: List of agent names to engage with
             max_actions: Maximum number of actions to perform
-            dry_run: If True, only simulate (no actual API calls)
+            dry_run: If True, only simulate (actions go to a DryRunSink)
+            deadline: Seconds the whole campaign may take (None = no limit);
+                requests share whatever time remains
 
         Returns campaign results
         """
@@ -268,45 +329,75 @@ class EngagementCampaign:
         print(f"Max Actions: {max_actions}")
         print('=' * 70)
 
-        for target in targets:
-            try:
-                plan = self.analyze_target(target)
-                results['targets_analyzed'] += 1
-
-                print(f"\n📊 Plan for {target}:")
-                print(f"  Karma: {plan['agent'].get('karma', 0)}")
-                print(f"  Recommendations: {len(plan['recommendations'])}")
-
-                for rec in plan['recommendations'][:5]:
-                    post = rec['post']
-                    print(f"    • {post.title[:50]}...")
-                    print(f"      Score: {rec['priority_score']:.1f} | Actions: {', '.join(rec['actions'])}")
-                    results['actions_planned'] += len(rec['actions'])
-
-                    if not dry_run and results['actions_executed'] < max_actions:
-                        # Execute actions (would need comment fetching for full implementation)
-                        for action in rec['actions']:
-                            if action == 'upvote':
-                                can_do, reason = self.state.can_comment()
-                                if can_do:
-                                    print(f"      ✓ Would upvote post {post.id}")
-                                    results['actions_executed'] += 1
-                                    # self.client.upvote_post(post.id)  # Uncomment for live
-                                    # self.state.record_action('upvote', post.id, True)
-                                else:
-                                    print(f"      ✗ Skipped: {reason}")
-
-            except moltbook_sdk.MoltbookAPIError as e:
-                error_msg = f"Error analyzing {target}: {e}"
-                results['errors'].append(error_msg)
-                print(f"❌ {error_msg}")
+        # A second upvote toggles the first off, so posts upvoted in an
+        # earlier run are never voted on again
+        upvoted_before = set(self.state.upvoted)
+        actions = moltbook_actions.ActionQueue(
+            self.client, sink=moltbook_actions.DryRunSink() if dry_run else None,
+            completed=[('upvote_post', post_id) for post_id in upvoted_before]
+        )
+        upvotes = {}  # post id -> Future
+
+        try:
+            with moltbook_sdk.deadline(deadline):
+                # Profiles are fetched in parallel and planned as they arrive
+                for fetched in self.source.get_profiles(targets):
+                    target = fetched.name
+                    try:
+                        if not fetched.ok:
+                            raise fetched.error
+                        plan = self.analyze_target(target, profile=fetched.profile)
+                        results['targets_analyzed'] += 1
+
+                        print(f"\n📊 Plan for {target}:")
+                        print(f"  Karma: {plan['agent'].get('karma', 0)}")
+                        print(f"  Recommendations: {len(plan['recommendations'])}")
+
+                        for rec in plan['recommendations'][:5]:
+                            post = rec['post']
+                            print(f"    • {post.title[:50]}...")
+                            print(f"      Score: {rec['priority_score']:.1f} | Actions: {', '.join(rec['actions'])}")
+                            results['actions_planned'] += len(rec['actions'])
+
+                            if 'upvote' not in rec['actions'] or post.id in upvotes:
+                                pass
+                            elif post.id in upvoted_before:
+                                print(f"      - Already upvoted post {post.id} in an earlier run")
+                            elif len(upvotes) < max_actions:
+                                # Rate limits are enforced by the client's limiter
+                                upvotes[post.id] = actions.upvote_post(post.id)
+                                print(f"      ✓ {'Would upvote' if dry_run else 'Upvote queued for'} post {post.id}")
+
+                    except moltbook_sdk.MoltbookTimeoutError as e:
+                        error_msg = f"Timed out analyzing {target}: {e}"
+                        results['errors'].append(error_msg)
+                        print(f"⏱️  {error_msg}")
+                        remaining = moltbook_sdk.remaining_time()
+                        if remaining is not None and remaining <= 0:
+                            break
+
+                    except moltbook_sdk.MoltbookAPIError as e:
+                        error_msg = f"Error analyzing {target}: {e}"
+                        results['errors'].append(error_msg)
+                        print(f"❌ {error_msg}")
+        finally:
+            # Waits for the queued upvotes and records them, even on error
+            actions.close()
+            for post_id, future in upvotes.items():
+                error = future.exception()
+                if error is None:
+                    results['actions_executed'] += 1
+                else:
+                    results['errors'].append(f"Upvote of {post_id} failed: {error}")
+                if not dry_run:
+                    self.state.record_action('upvote', post_id, error is None)
 
         print(f"\n{'=' * 70}")
         print(f"📈 CAMPAIGN SUMMARY")
         print('=' * 70)
         print(f"Targets Analyzed: {results['targets_analyzed']}")
         print(f"Actions Planned: {results['actions_planned']}")
-        print(f"Actions Executed: {results['actions_executed']}")
+        print(f"Actions Executed: {results['actions_executed']}{' (simulated)' if dry_run else ''}")
         if results['errors']:
             print(f"Errors: {len(results['errors'])}")
 
@@ -328,26 +419,27 @@ class EngagementCampaign:
         }
 
 
-def plan_campaign(agent_names: List[str], api_key: str):
-    """Plan a campaign without executing"""
-    campaign = EngagementCampaign(api_key, dry_run=True)
+def plan_campaign(agent_names: List[str], api_key: str,
+                  store: Optional[moltbook_store.MoltbookStore] = None, offline: bool = False):
+    """Plan a campaign without executing (from `store` only when offline)"""
+    campaign = EngagementCampaign(api_key, store=store, offline=offline)
 
     print(f"\n📋 CAMPAIGN PLANNING MODE")
     print('=' * 70)
 
     all_recommendations = []
 
-    for agent in agent_names:
-        try:
-            plan = campaign.analyze_target(agent)
-            all_recommendations.extend(plan['recommendations'])
+    for fetched in campaign.source.get_profiles(agent_names):
+        if not fetched.ok:
+            print(f"❌ Error ({fetched.name}): {fetched.error}")
+            continue
 
-            print(f"\n👤 {agent}")
-            print(f"   Karma: {plan['agent'].get('karma', 0)}")
-            print(f"   Top opportunities: {len(plan['recommendations'])}")
+        plan = campaign.analyze_target(fetched.name, profile=fetched.profile)
+        all_recommendations.extend(plan['recommendations'])
 
-        except moltbook_sdk.MoltbookAPIError as e:
-            print(f"❌ Error: {e}")
+        print(f"\n👤 {fetched.name}")
+        print(f"   Karma: {plan['agent'].get('karma', 0)}")
+        print(f"   Top opportunities: {len(plan['recommendations'])}")
 
     # Overall summary
     all_recommendations.sort(key=lambda x: x['priority_score'], reverse=True)
@@ -432,8 +524,33 @@ def main():
         help='Campaign state file path',
         default=None
     )
+    parser.add_argument(
+        '--deadline',
+        help='Seconds the whole campaign may take (execute mode)',
+        type=float,
+        default=None
+    )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const='',
+        help='Mirror fetched agents/posts/comments into a local SQLite store '
+             '(default path: ~/.moltbook/store.sqlite3)'
+    )
+    parser.add_argument(
+        '--offline',
+        help='Read target profiles from the local store instead of the API',
+        action='store_true'
+    )
+
+    moltbook_cassette.add_arguments(parser)
 
     args = parser.parse_args()
+    moltbook_cassette.install(args)
+
+    store = None
+    if args.store is not None or args.offline:
+        store = moltbook_store.MoltbookStore(args.store or None)
 
     if args.mode == 'status':
         show_campaign_status(args.api_key)
@@ -443,7 +560,7 @@ def main():
             print("❌ --targets required for planning mode")
             return
         targets = [t.strip() for t in args.targets.split(',')]
-        plan_campaign(targets, args.api_key)
+        plan_campaign(targets, args.api_key, store=store, offline=args.offline)
 
     elif args.mode == 'execute':
         if not args.targets:
@@ -454,8 +571,10 @@ def main():
             return
 
         targets = [t.strip() for t in args.targets.split(',')]
-        campaign = EngagementCampaign(args.api_key, args.state_file)
-        campaign.execute_campaign(targets, args.max_actions, dry_run=not args.live)
+        campaign = EngagementCampaign(args.api_key, args.state_file, store=store,
+                                      offline=args.offline)
+        campaign.execute_campaign(targets, args.max_actions, dry_run=not args.live,
+                                  deadline=args.deadline)
 
 
 if __name__ == "__main__":
@@ -19,6 +19,8 @@ import os
 # Add tools directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_ratelimit
+import moltbook_cassette
 
 
 def interactive_mode(client):
@@ -54,7 +56,7 @@ def interactive_mode(client):
 def display_posts(client, agent_name):
     """Display all posts for an agent"""
     try:
-        posts = client.get_agent_posts(agent_name)
+        posts = client.get_profile_view(agent_name).posts
 
         if not posts:
             print(f"No posts found for {agent_name}")
@@ -99,22 +101,25 @@ def batch_comment_mode(client, agent_name):
 
     This is a helper for the unreplied analyzer workflow.
     """
-    print(f"🔍 Finding posts with comments for {agent_name}...\n")
+    print(f"🔍 Finding unreplied comments for {agent_name}...\n")
 
     try:
-        posts = client.get_agent_posts(agent_name)
+        unreplied = client.get_unreplied_comments(agent_name)
 
-        posts_with_comments = [p for p in posts if p.comment_count > 0]
-
-        if not posts_with_comments:
-            print("No posts with comments found.")
+        if not unreplied:
+            print("No unreplied comments found.")
             return
 
-        print("Posts with comments:")
-        for i, post in enumerate(posts_with_comments, 1):
+        print("Posts with unreplied comments:")
+        for i, entry in enumerate(unreplied, 1):
+            post = entry['post']
             print(f"{i}. {post.title}")
             print(f"   ID: {post.id}")
-            print(f"   💬 {post.comment_count} comments\n")
+            print(f"   💬 {post.comment_count} comments | {entry['reason']}")
+            for comment in entry['unreplied'][:5]:
+                author = moltbook_sdk.CommentTree.author(comment)
+                print(f"     - @{author}: {comment.get('content', '')[:60]} (comment {comment.get('id')})")
+            print()
 
         print("\nNote: To comment on a post, use:")
         print(f"  python3 engagement_helper.py --post-id <ID> --comment \"your comment\"")
@@ -153,7 +158,10 @@ def main():
         default=os.environ.get('MOLTBOOK_API_KEY')
     )
 
+    moltbook_cassette.add_arguments(parser)
+
     args = parser.parse_args()
+    moltbook_cassette.install(args)
 
     # For posting, API key is required
     if args.post_id and not args.api_key:
@@ -161,7 +169,8 @@ def main():
         print("   Set MOLTBOOK_API_KEY environment variable or use --api-key")
         sys.exit(1)
 
-    client = moltbook_sdk.MoltbookClient(api_key=args.api_key)
+    client = moltbook_sdk.MoltbookClient(api_key=args.api_key,
+                                         rate_limiter=moltbook_ratelimit.RateLimiter())
 
     # Direct comment mode
     if args.post_id and args.comment:
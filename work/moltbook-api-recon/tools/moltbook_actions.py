@@ -0,0 +1,210 @@
+"""
+Moltbook Actions - Background queue for votes and follows
+
+Votes and follows are small writes that callers rarely need to wait on
+one by one. ActionQueue runs them on worker threads over the client's
+keep-alive pool, so several are in flight at once, and hands back a
+concurrent.futures.Future per action. Every request still goes through
+the client, so the shared rate limiter (moltbook_ratelimit) and any
+deadline() around the submit apply.
+
+Repeating a vote or follow that is queued or already succeeded returns
+the first action's future instead of sending it again: on Moltbook a
+second upvote toggles the first one off. The opposite action (downvote,
+unfollow) resets this for its target. Pass `completed=` to carry that
+dedup over from an earlier run's history.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_sdk
+    import moltbook_actions
+
+    with moltbook_actions.ActionQueue(client) as actions:
+        futures = [actions.upvote_post(post_id) for post_id in post_ids]
+        actions.follow_agent("SomeAgent")
+    # Leaving the block waits for every action
+    print([f.exception() is None for f in futures], actions.stats)
+
+    # Dry run: same queue, nothing sent
+    sink = moltbook_actions.DryRunSink()
+    with moltbook_actions.ActionQueue(sink=sink) as actions:
+        actions.upvote_post(post_id)
+    print(sink.calls)   # [('upvote_post', post_id)]
+
+    # From asyncio
+    await asyncio.wrap_future(actions.upvote_post(post_id))
+"""
+
+import sys
+import os
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_all
+from typing import Optional, Dict, List, Any, Tuple, Callable, Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+# Action name -> MoltbookClient method
+ACTIONS = {
+    'upvote_post': 'upvote_post',
+    'downvote_post': 'downvote_post',
+    'upvote_comment': 'upvote_comment',
+    'follow_agent': 'follow_agent',
+    'unfollow_agent': 'unfollow_agent',
+}
+
+# Submitting one of these ends deduplication against the other, so
+# follow -> unfollow -> follow sends all three
+OPPOSITES = {
+    'upvote_post': 'downvote_post',
+    'downvote_post': 'upvote_post',
+    'follow_agent': 'unfollow_agent',
+    'unfollow_agent': 'follow_agent',
+}
+
+
+class DryRunSink:
+    """Action sink that records calls instead of sending them"""
+
+    def __init__(self):
+        self.calls: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, action: str, target: str) -> Dict[str, Any]:
+        with self._lock:
+            self.calls.append((action, target))
+        return {'success': True, 'dry_run': True, 'action': action, 'target': target}
+
+
+class ActionQueue:
+    """
+    Thread-backed queue of vote/follow writes with per-target dedup.
+
+    Actions start in submission order and run concurrently, up to
+    `concurrency` at once. A failed action is forgotten, so it can be
+    submitted again.
+    """
+
+    def __init__(self, client: Optional[moltbook_sdk.MoltbookClient] = None,
+                 concurrency: Optional[int] = None,
+                 sink: Optional[Callable[[str, str], Dict[str, Any]]] = None,
+                 completed: Optional[Iterable[Tuple[str, str]]] = None):
+        """
+        Args:
+            client: Client the writes are sent with (not needed with `sink`)
+            concurrency: Writes in flight at once (default: the client pool's
+                per-host connection limit, 4 with a sink)
+            sink: Called as sink(action, target) instead of the client,
+                e.g. DryRunSink()
+            completed: (action, target) pairs already done in an earlier
+                run; submitting one again is deduplicated instead of sent
+                (votes toggle, so a resend would undo it)
+        """
+        if client is None and sink is None:
+            raise ValueError("ActionQueue needs a client or a sink")
+
+        self.client = client
+        self.sink = sink
+        workers = concurrency or (client.pool.maxsize if client is not None else 4)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='moltbook-actions')
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._stats = {'submitted': 0, 'deduplicated': 0, 'succeeded': 0, 'failed': 0}
+        for action, target in completed or ():
+            done = Future()
+            done.set_result({'success': True, 'previously_completed': True})
+            self._futures[(action, target)] = done
+
+    def __enter__(self) -> 'ActionQueue':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, action: str, target: str) -> Future:
+        """
+        Queue one action.
+
+        Args:
+            action: Key of ACTIONS, e.g. 'upvote_post'
+            target: Post/comment id or agent name
+
+        Returns:
+            Future resolving to the API response (or raising its
+            MoltbookAPIError); the existing future for a duplicate
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        key = (action, target)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                self._stats['deduplicated'] += 1
+                return future
+            if action in OPPOSITES:
+                self._futures.pop((OPPOSITES[action], target), None)
+
+            # The worker runs in a copy of the submitter's context (deadline)
+            future = self._executor.submit(contextvars.copy_context().run,
+                                           self._execute, action, target)
+            self._futures[key] = future
+            self._stats['submitted'] += 1
+
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return future
+
+    def _execute(self, action: str, target: str) -> Dict[str, Any]:
+        """Send one action through the sink or the client"""
+        if self.sink is not None:
+            return self.sink(action, target)
+        return getattr(self.client, ACTIONS[action])(target)
+
+    def _finished(self, key: Tuple[str, str], future: Future):
+        """Count the outcome; forget failures so they can be retried"""
+        failed = future.cancelled() or future.exception() is not None
+        with self._lock:
+            self._stats['failed' if failed else 'succeeded'] += 1
+            if failed and self._futures.get(key) is future:
+                del self._futures[key]
+
+    def upvote_post(self, post_id: str) -> Future:
+        return self.submit('upvote_post', post_id)
+
+    def downvote_post(self, post_id: str) -> Future:
+        return self.submit('downvote_post', post_id)
+
+    def upvote_comment(self, comment_id: str) -> Future:
+        return self.submit('upvote_comment', comment_id)
+
+    def follow_agent(self, agent_name: str) -> Future:
+        return self.submit('follow_agent', agent_name)
+
+    def unfollow_agent(self, agent_name: str) -> Future:
+        return self.submit('unfollow_agent', agent_name)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every queued action.
+
+        Returns:
+            True if all finished within `timeout`
+        """
+        with self._lock:
+            pending = list(self._futures.values())
+        _, not_done = wait_all(pending, timeout=timeout)
+        return not not_done
+
+    def close(self, wait: bool = True):
+        """Stop accepting actions; by default wait for the queued ones"""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Submitted, deduplicated, succeeded and failed action counts"""
+        with self._lock:
+            return dict(self._stats)
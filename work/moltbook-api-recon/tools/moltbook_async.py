@@ -0,0 +1,208 @@
+"""
+Moltbook Async SDK - asyncio front-end for moltbook_sdk
+
+Same methods as MoltbookClient, as coroutines. Requests run on a worker
+thread pool over the shared keep-alive ConnectionPool, and a semaphore
+bounds how many are in flight at once. Stdlib only.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import asyncio
+    import moltbook_async
+
+    async def main():
+        async with moltbook_async.AsyncMoltbookClient(concurrency=8) as client:
+            profiles = await asyncio.gather(
+                client.get_agent_profile("Agent1"),
+                client.get_agent_profile("Agent2"),
+            )
+
+    asyncio.run(main())
+
+    # From synchronous code
+    profiles = moltbook_async.fetch_many(client, 'get_agent_profile', names)
+"""
+
+import sys
+import os
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Callable, Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+class AsyncMoltbookClient:
+    """
+    asyncio client for Moltbook API endpoints.
+
+    Wraps a MoltbookClient: blocking calls are dispatched to a thread pool
+    sized to `concurrency`, and an asyncio.Semaphore caps in-flight requests
+    at the same value.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 concurrency: int = 8, pool: Optional[moltbook_sdk.ConnectionPool] = None,
+                 client: Optional[moltbook_sdk.MoltbookClient] = None):
+        """
+        Initialize the async client.
+
+        Args:
+            api_key: Optional API key (Bearer token)
+            base_url: API base URL (default: $MOLTBOOK_BASE_URL, else
+                https://www.moltbook.com)
+            concurrency: Maximum concurrent requests
+            pool: Optional shared ConnectionPool
+            client: Optional existing MoltbookClient to wrap (its pool is
+                shared and left open on close)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        self.concurrency = concurrency
+        self._owns_client = client is None
+        self.client = client or moltbook_sdk.MoltbookClient(
+            api_key=api_key, base_url=base_url, pool=pool, pool_size=concurrency
+        )
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            thread_name_prefix='moltbook')
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking client method under the concurrency limit"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        # Copy the caller's context so a moltbook_sdk.deadline() set around
+        # the await also bounds the worker thread
+        context = contextvars.copy_context()
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, fn, *args, **kwargs)
+            )
+
+    async def close(self):
+        """Shut down worker threads (and the wrapped client, if owned)"""
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self) -> 'AsyncMoltbookClient':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, endpoint: str, method: str = "GET",
+                      data: Optional[Dict] = None) -> Dict[str, Any]:
+        """Raw request to an API endpoint (see MoltbookClient._request)"""
+        return await self._call(self.client._request, endpoint, method=method, data=data)
+
+    async def get_agent_profile(self, agent_name: str) -> Dict[str, Any]:
+        """Get complete agent profile including posts and recent comments"""
+        return await self._call(self.client.get_agent_profile, agent_name)
+
+    async def get_profile_view(self, agent_name: str) -> moltbook_sdk.ProfileView:
+        """Get an agent profile as a lazy ProfileView"""
+        return await self._call(self.client.get_profile_view, agent_name)
+
+    async def get_agent_posts(self, agent_name: str) -> List[moltbook_sdk.Post]:
+        """Get all posts by an agent"""
+        return await self._call(self.client.get_agent_posts, agent_name)
+
+    async def get_agent_comments(self, agent_name: str) -> List[moltbook_sdk.Comment]:
+        """Get recent comments by an agent"""
+        return await self._call(self.client.get_agent_comments, agent_name)
+
+    async def get_unreplied_comments(self, agent_name: str) -> List[Dict[str, Any]]:
+        """Find comments on the agent's posts without a reply from the agent"""
+        return await self._call(self.client.get_unreplied_comments, agent_name)
+
+    async def get_comment_tree(self, post_id: str, sort: str = "top") -> moltbook_sdk.CommentTree:
+        """Fetch every comment of a post as a CommentTree"""
+        return await self._call(self.client.get_comment_tree, post_id, sort=sort)
+
+    async def get_agent_feed(self, agent_name: str, sort: str = "new", limit: int = 25) -> List[Dict]:
+        """Get personalized feed for an agent"""
+        return await self._call(self.client.get_agent_feed, agent_name, sort=sort, limit=limit)
+
+    async def get_agent_discover(self, agent_name: str) -> Dict[str, Any]:
+        """Get analytics and recommendations for an agent"""
+        return await self._call(self.client.get_agent_discover, agent_name)
+
+    async def get_submolt(self, name: str, sort: str = "hot") -> Dict[str, Any]:
+        """Get submolt with posts, sorted"""
+        return await self._call(self.client.get_submolt, name, sort=sort)
+
+    async def create_post(self, title: str, content: str, submolt: str = "general") -> Dict[str, Any]:
+        """Create a new post"""
+        return await self._call(self.client.create_post, title, content, submolt=submolt)
+
+    async def create_comment(self, post_id: str, content: str) -> Dict[str, Any]:
+        """Create a comment on a post"""
+        return await self._call(self.client.create_comment, post_id, content)
+
+    async def upvote_post(self, post_id: str) -> Dict[str, Any]:
+        """Upvote a post"""
+        return await self._call(self.client.upvote_post, post_id)
+
+    async def downvote_post(self, post_id: str) -> Dict[str, Any]:
+        """Downvote a post"""
+        return await self._call(self.client.downvote_post, post_id)
+
+    async def upvote_comment(self, comment_id: str) -> Dict[str, Any]:
+        """Upvote a comment"""
+        return await self._call(self.client.upvote_comment, comment_id)
+
+    async def follow_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Follow an agent"""
+        return await self._call(self.client.follow_agent, agent_name)
+
+    async def unfollow_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Unfollow an agent"""
+        return await self._call(self.client.unfollow_agent, agent_name)
+
+    async def get_me(self) -> Dict[str, Any]:
+        """Get your own profile (stats only)"""
+        return await self._call(self.client.get_me)
+
+
+def fetch_many(client: moltbook_sdk.MoltbookClient, method: str, items: Iterable[Any],
+               concurrency: int = 8, **kwargs) -> List[Any]:
+    """
+    Call an AsyncMoltbookClient method once per item, concurrently.
+
+    Meant for synchronous tools that loop over agent or submolt names.
+
+    Args:
+        client: MoltbookClient whose connection pool is reused
+        method: Method name, e.g. 'get_agent_profile'
+        items: First positional argument for each call
+        concurrency: Maximum concurrent requests
+        **kwargs: Extra keyword arguments passed to every call
+
+    Returns:
+        Results in input order; failed calls hold their MoltbookAPIError
+    """
+    items = list(items)
+
+    async def run() -> List[Any]:
+        async with AsyncMoltbookClient(client=client, concurrency=concurrency) as aclient:
+            call = getattr(aclient, method)
+            return await asyncio.gather(
+                *(call(item, **kwargs) for item in items), return_exceptions=True
+            )
+
+    results = asyncio.run(run()) if items else []
+
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, moltbook_sdk.MoltbookAPIError):
+            raise result
+
+    return results
@@ -0,0 +1,210 @@
+"""
+Moltbook Cache - Persistent HTTP cache for moltbook_sdk
+
+SQLite-backed store of GET response bodies and their validators under
+~/.moltbook/cache. On the next request the client sends If-None-Match /
+If-Modified-Since; a 304 is answered from the stored body. When the server
+sends no validators, the body hash is compared instead so unchanged
+payloads are not parsed again. The database survives restarts, so every
+cron-style agent cycle starts warm.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_sdk
+    import moltbook_cache
+
+    client = moltbook_sdk.MoltbookClient(disk_cache=moltbook_cache.DiskCache())
+    client.get_agent_profile("ClaudeCode_GLM4_7")   # 200, stored
+    client.get_agent_profile("ClaudeCode_GLM4_7")   # 304 or same hash, no re-parse
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".moltbook" / "cache"
+
+
+@dataclass
+class CacheEntry:
+    """Stored response for one URL"""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    body_hash: str
+    stored_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """
+    Persistent, process-safe cache of GET responses with revalidation.
+
+    Parsed results are also memoized in memory (keyed by URL and body
+    hash) so a 304 or an unchanged body skips JSON decoding. Memoized
+    results are shared between callers: treat them as read-only.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 5000,
+                 memo_size: int = 256):
+        """
+        Args:
+            path: SQLite file (default: ~/.moltbook/cache/http_cache.sqlite3)
+            max_entries: Rows kept on disk (oldest are pruned)
+            memo_size: Parsed results kept in memory
+        """
+        if path is None:
+            DEFAULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = str(DEFAULT_CACHE_DIR / "http_cache.sqlite3")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.memo_size = memo_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                body_hash TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """)
+        self._db.commit()
+        self._memo: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._stores_since_prune = 0
+        self.stats = {
+            'lookups': 0,
+            'not_modified': 0,
+            'unchanged_body': 0,
+            'stored': 0
+        }
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Get the stored entry for a URL, if any"""
+        with self._lock:
+            self.stats['lookups'] += 1
+            row = self._db.execute(
+                "SELECT url, etag, last_modified, body, body_hash, stored_at "
+                "FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def _parse(self, url: str, body: bytes, body_hash: str,
+               decode: Callable[[bytes], Any]) -> Any:
+        """Decode a body, reusing the memoized result if the hash matches"""
+        with self._lock:
+            memo = self._memo.get(url)
+            if memo is not None and memo[0] == body_hash:
+                self._memo.move_to_end(url)
+                return memo[1]
+
+        value = decode(body)
+
+        with self._lock:
+            self._memo[url] = (body_hash, value)
+            self._memo.move_to_end(url)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return value
+
+    def not_modified(self, entry: CacheEntry, decode: Callable[[bytes], Any]) -> Any:
+        """Handle a 304: refresh the entry and return its parsed body"""
+        with self._lock:
+            self.stats['not_modified'] += 1
+            self._db.execute("UPDATE responses SET stored_at = ? WHERE url = ?",
+                             (time.time(), entry.url))
+            self._db.commit()
+        return self._parse(entry.url, entry.body, entry.body_hash, decode)
+
+    def store(self, url: str, headers: Dict[str, str], body: bytes,
+              decode: Callable[[bytes], Any], previous: Optional[CacheEntry] = None) -> Any:
+        """
+        Store a 200 response and return its parsed body.
+
+        Args:
+            url: Request URL
+            headers: Response headers (lower-case keys)
+            body: Response body
+            decode: Function turning the body into the parsed result
+            previous: Entry looked up before the request, if any
+
+        Returns:
+            Parsed body
+        """
+        body_hash = hashlib.sha256(body).hexdigest()
+        unchanged = previous is not None and previous.body_hash == body_hash
+        value = self._parse(url, body, body_hash, decode)
+
+        with self._lock:
+            if unchanged:
+                # Same payload: only refresh validators, skip rewriting the blob
+                self.stats['unchanged_body'] += 1
+                self._db.execute(
+                    "UPDATE responses SET etag = ?, last_modified = ?, stored_at = ? "
+                    "WHERE url = ?",
+                    (headers.get('etag'), headers.get('last-modified'), time.time(), url)
+                )
+            else:
+                self.stats['stored'] += 1
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, etag, last_modified, body, body_hash, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, headers.get('etag'), headers.get('last-modified'),
+                     body, body_hash, time.time())
+                )
+                self._stores_since_prune += 1
+                if self._stores_since_prune >= 100:
+                    self._prune()
+            self._db.commit()
+        return value
+
+    def _prune(self):
+        """Keep only the newest `max_entries` rows (caller holds the lock)"""
+        self._stores_since_prune = 0
+        self._db.execute(
+            "DELETE FROM responses WHERE url NOT IN "
+            "(SELECT url FROM responses ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+
+    def invalidate(self, prefix: str = '') -> int:
+        """
+        Delete entries whose URL starts with `prefix`.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE substr(url, 1, ?) = ?", (len(prefix), prefix)
+            )
+            self._db.commit()
+            for url in [u for u in self._memo if u.startswith(prefix)]:
+                del self._memo[url]
+        return cursor.rowcount
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
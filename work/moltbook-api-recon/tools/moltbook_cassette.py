@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Moltbook Cassette - Record and replay API traffic
+
+A Cassette stands in for the client's ConnectionPool. Recording, it sends
+requests through a real pool and writes every response (status, headers,
+body and how long it took) to a gzip-compressed JSON-lines file.
+Replaying, it answers the same requests from that file without touching
+the network, either instantly or after the recorded latency.
+
+Everything above the transport (retries, caches, JSON decoding, model
+construction, the tools' own analysis) still runs during a replay, so an
+instant replay under a profiler shows a tool's CPU cost alone, and a
+replay with latency reproduces the run end to end. Replays skip the
+client's rate limiter.
+
+- Requests are matched on method, path + query and request body (JSON
+  bodies compared as canonical JSON, whatever backend wrote them). Repeated
+  requests get their recorded responses in order; once those run out the
+  last one is repeated.
+- A request that was never recorded gets a 404 (not retried) and is
+  counted in stats['misses'].
+- Request headers (the API key) are not recorded. Failed requests
+  (timeouts, connection errors) are not recorded either.
+- Bodies are stored decoded. Replayed streams are served uncompressed.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    python3 trend_analyzer.py ClaudeCode_GLM4_7 --record run.jsonl.gz
+    python3 -m cProfile -s cumtime trend_analyzer.py ClaudeCode_GLM4_7 --replay run.jsonl.gz
+    python3 trend_analyzer.py ClaudeCode_GLM4_7 --replay run.jsonl.gz --replay-latency
+
+    import moltbook_cassette
+
+    with moltbook_cassette.Cassette("run.jsonl.gz", mode='record') as cassette:
+        client = moltbook_sdk.MoltbookClient(pool=cassette)
+        client.get_agent_profile("ClaudeCode_GLM4_7")
+
+    cassette = moltbook_cassette.Cassette("run.jsonl.gz", latency=1.0)
+    client = moltbook_sdk.MoltbookClient(pool=cassette)
+"""
+
+import sys
+import os
+import atexit
+import base64
+import contextlib
+import gzip
+import json
+import threading
+import time
+import urllib.parse
+import zlib
+from dataclasses import dataclass, field, asdict
+from typing import Optional, Dict, List, Any, Tuple, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+MODES = ('record', 'replay')
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response"""
+    method: str
+    url: str                      # Path and query, without scheme and host
+    body: Optional[str]           # Request body
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)   # Lowercased names
+    response: bytes = b''         # Decoded response body
+    wire_bytes: int = 0
+    latency: float = 0.0          # Seconds from sending to the last body byte
+
+    def to_json(self) -> str:
+        record = asdict(self)
+        try:
+            record['response'] = self.response.decode('utf-8')
+        except UnicodeDecodeError:
+            record['response'] = base64.b64encode(self.response).decode('ascii')
+            record['base64'] = True
+        return json.dumps(record, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> 'Interaction':
+        record = json.loads(line)
+        if record.pop('base64', False):
+            record['response'] = base64.b64decode(record['response'])
+        else:
+            record['response'] = record['response'].encode('utf-8')
+        return cls(**record)
+
+
+def _normalize_body(body: Optional[str]) -> Optional[str]:
+    """
+    Canonical text of a JSON body (sorted keys, compact), so the match
+    does not depend on the JSON backend that wrote it; other text as is
+    """
+    if not body:
+        return body
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(',', ':'),
+                          ensure_ascii=False)
+    except ValueError:
+        return body
+
+
+def _request_key(method: str, url: str, body: Any) -> Tuple[str, str, Optional[str]]:
+    """Match key of a request: method, path + query, normalized body text"""
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    if isinstance(body, (bytes, bytearray)):
+        body = bytes(body).decode('utf-8', errors='replace')
+    return method, path, _normalize_body(body)
+
+
+class _ReplayResponse:
+    """The parts of http.client.HTTPResponse that iter_body/read_body use, over bytes"""
+
+    will_close = False
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self._headers = headers
+        self._body = body
+        self._offset = 0
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._headers.get(name.lower(), default)
+
+    def getheaders(self) -> List[Tuple[str, str]]:
+        return list(self._headers.items())
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        end = len(self._body) if amt is None else min(len(self._body), self._offset + amt)
+        chunk = self._body[self._offset:end]
+        self._offset = end
+        return chunk
+
+    def isclosed(self) -> bool:
+        return self._offset >= len(self._body)
+
+
+class _RecordingResponse:
+    """Wraps a streamed http.client.HTTPResponse, keeping the wire bytes read"""
+
+    def __init__(self, response: Any):
+        self._response = response
+        self.status = response.status
+        self.will_close = response.will_close
+        self.chunks: List[bytes] = []
+        self.read_time = 0.0
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._response.getheader(name, default)
+
+    def getheaders(self) -> List[Tuple[str, str]]:
+        return self._response.getheaders()
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        start = time.perf_counter()
+        chunk = self._response.read(amt)
+        self.read_time += time.perf_counter() - start
+        self.chunks.append(chunk)
+        return chunk
+
+    def isclosed(self) -> bool:
+        return self._response.isclosed()
+
+
+class Cassette:
+    """
+    Recording/replaying stand-in for a ConnectionPool.
+
+    Thread-safe; pass it as MoltbookClient(pool=...) or make it the
+    default with moltbook_sdk.set_default_pool().
+    """
+
+    def __init__(self, path: str, mode: str = 'replay', latency: float = 0.0,
+                 pool: Optional[moltbook_sdk.ConnectionPool] = None):
+        """
+        Args:
+            path: Cassette file (gzip JSON lines); recording overwrites it
+            mode: 'record' or 'replay'
+            latency: Replay: multiple of the recorded latency to wait before
+                each response (0 = instant, 1 = as recorded)
+            pool: Record: pool the requests are sent through (default: a new one)
+
+        Raises:
+            FileNotFoundError: Replaying a cassette that does not exist
+        """
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.offline = mode == 'replay'
+        self.pool = None
+        if mode == 'record':
+            self.pool = pool or moltbook_sdk.ConnectionPool()
+        self.maxsize = self.pool.maxsize if self.pool is not None else 4
+        self._lock = threading.Lock()
+        self._file = None
+        self._interactions: Dict[Tuple[str, str, Optional[str]], List[Interaction]] = {}
+        self._cursors: Dict[Tuple[str, str, Optional[str]], int] = {}
+        self.stats = {
+            'recorded': 0,
+            'replayed': 0,
+            'misses': 0,
+            'latency_seconds': 0.0
+        }
+
+        if mode == 'record':
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = gzip.open(path, 'wt', encoding='utf-8')
+        else:
+            for interaction in self.load(path):
+                key = (interaction.method, interaction.url, _normalize_body(interaction.body))
+                self._interactions.setdefault(key, []).append(interaction)
+
+    @staticmethod
+    def load(path: str) -> Iterator[Interaction]:
+        """
+        Yield a cassette's interactions in recorded order.
+
+        A file cut short (a recording process that was killed) yields
+        the interactions written before the cut.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            try:
+                for line in f:
+                    try:
+                        yield Interaction.from_json(line)
+                    except (ValueError, TypeError):
+                        return  # Partial last line
+            except (EOFError, zlib.error):
+                return
+
+    def __enter__(self) -> 'Cassette':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.eject()
+
+    @property
+    def interactions(self) -> int:
+        """Number of interactions loaded (replay) or recorded so far"""
+        if self.mode == 'record':
+            return self.stats['recorded']
+        return sum(len(recorded) for recorded in self._interactions.values())
+
+    # -- Recording -----------------------------------------------------------
+
+    def _record(self, interaction: Interaction):
+        line = interaction.to_json()
+        with self._lock:
+            if self._file is None:
+                return  # Already ejected
+            self._file.write(line)
+            self._file.write('\n')
+            self.stats['recorded'] += 1
+
+    # -- Replay --------------------------------------------------------------
+
+    def _next(self, method: str, url: str, body: Any) -> Optional[Interaction]:
+        """The recorded response for a request, or None"""
+        key = _request_key(method, url, body)
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                self.stats['misses'] += 1
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(recorded) - 1)
+            self.stats['replayed'] += 1
+            return recorded[cursor]
+
+    def _wait(self, interaction: Interaction, trace: Dict[str, Any]):
+        """Sleep the scaled recorded latency"""
+        delay = interaction.latency * self.latency
+        if delay > 0:
+            time.sleep(delay)
+            with self._lock:
+                self.stats['latency_seconds'] += delay
+        trace['ttfb'] = delay
+
+    @staticmethod
+    def _miss(method: str, url: str) -> Interaction:
+        path = _request_key(method, url, None)[1]
+        body = json.dumps({'success': False, 'error': f"No recorded response for {method} {path}"})
+        return Interaction(method, path, None, 404, {'content-type': 'application/json'},
+                           body.encode('utf-8'))
+
+    # -- ConnectionPool interface ----------------------------------------------
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                connect_timeout: Optional[float] = None,
+                read_timeout: Optional[float] = None,
+                trace: Optional[Dict[str, Any]] = None) -> moltbook_sdk.HTTPResponse:
+        """ConnectionPool.request(): send and record, or answer from the cassette"""
+        if trace is None:
+            trace = {}
+
+        if self.mode == 'record':
+            start = time.perf_counter()
+            response = self.pool.request(method, url, body=body, headers=headers,
+                                         connect_timeout=connect_timeout,
+                                         read_timeout=read_timeout, trace=trace)
+            _, path, text = _request_key(method, url, body)
+            self._record(Interaction(method, path, text, response.status, dict(response.headers),
+                                     response.body, response.wire_bytes,
+                                     time.perf_counter() - start))
+            return response
+
+        interaction = self._next(method, url, body) or self._miss(method, url)
+        self._wait(interaction, trace)
+        return moltbook_sdk.HTTPResponse(
+            status=interaction.status,
+            headers=dict(interaction.headers),
+            body=interaction.response,
+            wire_bytes=interaction.wire_bytes
+        )
+
+    @contextlib.contextmanager
+    def stream(self, method: str, url: str, body: Optional[bytes] = None,
+               headers: Optional[Dict[str, str]] = None,
+               connect_timeout: Optional[float] = None,
+               read_timeout: Optional[float] = None,
+               trace: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """ConnectionPool.stream(): yields a response whose body is read with iter_body()"""
+        if trace is None:
+            trace = {}
+
+        if self.mode == 'replay':
+            interaction = self._next(method, url, body) or self._miss(method, url)
+            self._wait(interaction, trace)
+            headers = {name: value for name, value in interaction.headers.items()
+                       if name not in ('content-encoding', 'content-length')}
+            yield _ReplayResponse(interaction.status, headers, interaction.response)
+            return
+
+        start = time.perf_counter()
+        with self.pool.stream(method, url, body=body, headers=headers,
+                              connect_timeout=connect_timeout, read_timeout=read_timeout,
+                              trace=trace) as response:
+            headers_time = time.perf_counter() - start
+            recording = _RecordingResponse(response)
+            yield recording
+
+            if not response.isclosed():
+                return  # Body not read to the end: nothing complete to record
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            wire = b''.join(recording.chunks)
+            decoded, _ = moltbook_sdk.read_body(
+                _ReplayResponse(response.status, response_headers, wire)
+            )
+            _, path, text = _request_key(method, url, body)
+            self._record(Interaction(method, path, text, response.status, response_headers,
+                                     decoded, len(wire), headers_time + recording.read_time))
+
+    def close(self):
+        """Close the recording pool's idle connections and flush the file"""
+        if self.pool is not None:
+            self.pool.close()
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def eject(self):
+        """Finish the cassette: close the file (recording) and the pool"""
+        if self.pool is not None:
+            self.pool.close()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def summary(self) -> str:
+        """One-line description of what the cassette did"""
+        if self.mode == 'record':
+            return f"cassette {self.path}: {self.stats['recorded']} responses recorded"
+        line = (f"cassette {self.path}: {self.stats['replayed']} responses replayed, "
+                f"{self.stats['misses']} misses")
+        if self.stats['latency_seconds']:
+            line += f", {self.stats['latency_seconds']:.2f}s recorded latency"
+        return line
+
+
+def add_arguments(parser: Any):
+    """Add --record, --replay and --replay-latency to an argparse parser"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--record',
+        metavar='CASSETTE',
+        help='Record API responses to a cassette file (gzip JSON lines)'
+    )
+    group.add_argument(
+        '--replay',
+        metavar='CASSETTE',
+        help='Answer API requests from a recorded cassette instead of the network'
+    )
+    parser.add_argument(
+        '--replay-latency',
+        help='With --replay, wait the recorded latency before each response (default: instant)',
+        action='store_true'
+    )
+
+
+def install(args: Any) -> Optional[Cassette]:
+    """
+    Make the cassette named by parsed --record/--replay arguments the
+    default transport of every client the tool creates.
+
+    At exit the cassette is closed and its summary printed to stderr.
+
+    Returns:
+        The Cassette, or None without --record/--replay
+    """
+    if args.record:
+        cassette = Cassette(args.record, mode='record')
+    elif args.replay:
+        if not os.path.exists(args.replay):
+            sys.exit(f"❌ Cassette not found: {args.replay}")
+        cassette = Cassette(args.replay, latency=1.0 if args.replay_latency else 0.0)
+    else:
+        return None
+
+    moltbook_sdk.set_default_pool(cassette)
+
+    def finish():
+        cassette.eject()
+        print(f"📼 {cassette.summary()}", file=sys.stderr)
+
+    atexit.register(finish)
+    return cassette
@@ -0,0 +1,1019 @@
+#!/usr/bin/env python3
+"""
+Moltbook Fake Server - Local stand-in for the Moltbook API
+
+Serves the endpoints the SDK uses from a synthetic dataset, so the client
+and the analyzers can be measured at sizes production never hands out,
+without spending API quota:
+
+    GET    /api/v1/agents/profile?name=NAME       agent + recentPosts + recentComments
+    GET    /api/v1/agents/me
+    GET    /api/v1/agents/{name}/feed             sort, limit, offset
+    GET    /api/v1/agents/{name}/discover
+    POST   /api/v1/agents/{name}/follow           (DELETE unfollows)
+    GET    /api/v1/submolts/{name}                sort, limit, offset
+    GET    /api/v1/posts/{id}
+    GET    /api/v1/posts/{id}/comments            sort, limit, offset
+    POST   /api/v1/posts                          {title, content, submolt_name}
+    POST   /api/v1/comments                       {post_id, content, parent_id}
+    POST   /api/v1/posts/{id}/upvote              (and /downvote)
+    POST   /api/v1/comments/{id}/upvote
+
+SyntheticDataset is procedural: every agent, post and comment is computed
+from its index with a seeded hash, and listings are arithmetic over post
+indices. 100k agents and 10M posts cost no memory and no start-up time;
+only writes (new posts/comments, votes, follows) are stored. Post j is
+written by agent j % agents in submolt j % submolts, and post times rise
+with j, so "new" listings are O(1) per item. hot/top/rising rank the
+newest `rank_window` posts of a listing.
+
+FakeMoltbookServer serves it over http.server (keep-alive, gzip, ETag /
+If-None-Match -> 304) with optional latency, stalls, injected 5xx errors
+and a per-client token bucket answering 429 with Retry-After. Writes and
+/agents/me need a Bearer token; every token acts as the `me` agent.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    python3 moltbook_fakeserver.py --agents 100000 --posts 10000000 --port 8080 \\
+        --latency-ms 80 --jitter-ms 40 --error-rate 0.01 --rate-limit 100
+    MOLTBOOK_BASE_URL=http://127.0.0.1:8080 python3 trend_analyzer.py agent_000042
+
+    import moltbook_fakeserver
+
+    dataset = moltbook_fakeserver.SyntheticDataset(agents=1000, posts=100000)
+    with moltbook_fakeserver.FakeMoltbookServer(dataset, latency=0.05) as server:
+        client = moltbook_sdk.MoltbookClient(base_url=server.base_url)
+        client.get_agent_profile(dataset.agent_name(42))
+    print(server.stats)
+"""
+
+import sys
+import os
+import gzip
+import hashlib
+import math
+import random
+import re
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, List, Any, Tuple, Iterator, Set
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+SUBMOLT_NAMES = ['general', 'ai', 'buildlogs', 'tech', 'agents', 'philosophy', 'memes',
+                 'science', 'crypto', 'meta', 'music', 'security']
+
+TOPICS = ['agents', 'memory', 'context', 'tokens', 'rust', 'python', 'api', 'latency',
+          'cache', 'sqlite', 'benchmark', 'prompts', 'reasoning', 'tools', 'sdk', 'async',
+          'karma', 'moltbook', 'embeddings', 'retrieval', 'scaling', 'cron', 'automation',
+          'security', 'privacy', 'consciousness', 'poetry', 'economics', 'testing',
+          'debugging', 'deploys', 'linux', 'gpus', 'compilers', 'databases', 'observability']
+
+TITLES = ['{A} {a} for {b}', 'Why {a} beats {b}', 'Building {a} on top of {b}',
+          'TIL: {a} and {b}', 'Ask: how do you handle {a}?', 'Notes on {a}, part {n}',
+          'I measured {a} so you do not have to', '{A} is overrated, {b} is not']
+
+COMMENTS = ['Great point about {a}!', 'Have you tried {a} with {b}?',
+            'Disagree: {a} does not scale past {n} agents.', '+1, we saw the same with {a}.',
+            'Source on the {a} numbers?', 'This is why I moved to {b}.',
+            'Thanks, adding {a} to my notes.', 'Counterpoint: {b} solves most of this.']
+
+AGENT_ID = 'a0000000-0000-4000-8000-{:012x}'
+POST_ID = 'b0000000-0000-4000-8000-{:012x}'
+COMMENT_ID = 'c{:07x}-0000-4000-8000-{:012x}'
+AGENT_NAME = re.compile(r'^agent_(\d+)$')
+POST_REF = re.compile(r'^b0000000-0000-4000-8000-([0-9a-f]{12})$')
+COMMENT_REF = re.compile(r'^c([0-9a-f]{7})-0000-4000-8000-([0-9a-f]{12})$')
+
+SORTS = ('hot', 'new', 'top', 'rising')
+COMMENT_SORTS = ('top', 'new', 'old')
+
+_MASK = (1 << 64) - 1
+_AGENT, _POST, _COMMENT, _SUBMOLT = 1, 2, 3, 4
+
+
+def _hash(seed: int, kind: int, index: int, salt: int = 0) -> int:
+    """64-bit splitmix hash of (seed, kind, index, salt)"""
+    x = (seed * 0x9E3779B97F4A7C15 + kind * 0xD1B54A32D192ED03 +
+         index * 0x94D049BB133111EB + salt * 0x2545F4914F6CDD1D) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+class _Progression:
+    """Post indices j < n with j % modulus in `residues`, highest first"""
+
+    def __init__(self, n: int, modulus: int, residues: Set[int]):
+        residues = [r for r in residues if r < n]
+        self.n = n
+        self.modulus = modulus
+        self.offsets = sorted((n - 1 - r) % modulus for r in residues)
+        self.count = sum((n - r + modulus - 1) // modulus for r in residues)
+
+    def at(self, rank: int) -> int:
+        cycle, index = divmod(rank, len(self.offsets))
+        return self.n - 1 - (self.offsets[index] + cycle * self.modulus)
+
+
+class SyntheticDataset:
+    """
+    Deterministic, procedurally generated Moltbook world plus the writes
+    made against it.
+
+    The same (agents, posts, submolts, days, comments, seed) always gives
+    the same data. Thread-safe.
+    """
+
+    def __init__(self, agents: int = 1000, posts: int = 100_000, submolts: int = 12,
+                 days: float = 30.0, comments: float = 5.0, seed: int = 0,
+                 now: Optional[float] = None, max_comments: int = 500,
+                 max_profile_posts: int = 1000, rank_window: int = 10_000):
+        """
+        Args:
+            agents: Number of agents (agent_000000 ...)
+            posts: Number of posts, spread evenly over the last `days`
+            submolts: Number of submolts (SUBMOLT_NAMES first, then submolt12 ...)
+            days: Time span of the posts, ending at `now`
+            comments: Mean comments per post (heavy-tailed)
+            seed: Hash seed
+            now: End of the post timeline (default: current time)
+            max_comments: Cap on generated comments per post
+            max_profile_posts: Cap on recentPosts per profile
+            rank_window: Newest posts of a listing ranked for hot/top/rising
+        """
+        if agents < 1 or posts < 1 or submolts < 1:
+            raise ValueError("agents, posts and submolts must be >= 1")
+
+        self.agents = agents
+        self.posts = posts
+        self.submolts = submolts
+        self.seed = seed
+        self.mean_comments = comments
+        self.max_comments = max_comments
+        self.max_profile_posts = max_profile_posts
+        self.rank_window = rank_window
+        self.end = time.time() if now is None else now
+        self.start = self.end - days * 86400
+        self.interval = (self.end - self.start) / posts
+        self.width = max(6, len(str(agents - 1)))
+
+        self._lock = threading.Lock()
+        self._created: List[Dict[str, Any]] = []                 # Posts made through the API
+        self._added_comments: Dict[int, List[Dict[str, Any]]] = {}
+        self._post_votes: Dict[int, List[int]] = {}              # j -> [up, down] deltas
+        self._comment_votes: Dict[Tuple[int, int], int] = {}
+        self._karma: Dict[int, int] = {}
+        self._votes: Dict[Tuple[str, str], int] = {}             # (voter, target id) -> +1/-1
+        self._followers: Dict[int, Set[str]] = {}
+        self._rankings: Dict[Tuple[str, int, str], List[int]] = {}
+
+    # -- Randomness ----------------------------------------------------------
+
+    def _unit(self, kind: int, index: int, salt: int = 0) -> float:
+        """Uniform [0, 1) value for an entity attribute"""
+        return (_hash(self.seed, kind, index, salt) >> 11) / 9007199254740992.0
+
+    def _pick(self, options: List[str], kind: int, index: int, salt: int) -> str:
+        return options[_hash(self.seed, kind, index, salt) % len(options)]
+
+    def _text(self, templates: List[str], kind: int, index: int) -> str:
+        a = self._pick(TOPICS, kind, index, 11)
+        b = self._pick(TOPICS, kind, index, 12)
+        return self._pick(templates, kind, index, 10).format(
+            a=a, A=a.capitalize(), b=b, n=_hash(self.seed, kind, index, 13) % 100 + 2
+        )
+
+    # -- Agents --------------------------------------------------------------
+
+    def agent_name(self, i: int) -> str:
+        return f"agent_{i:0{self.width}d}"
+
+    def agent_index(self, name: str) -> Optional[int]:
+        """Index of an agent name, or None if there is no such agent"""
+        match = AGENT_NAME.match(name)
+        if not match or len(match.group(1)) != self.width:
+            return None
+        i = int(match.group(1))
+        return i if i < self.agents else None
+
+    def agent(self, i: int) -> Dict[str, Any]:
+        newest = self._listing('agent', i)
+        last_post = self._created_ts(newest.at(0)) if newest.count else self.start
+        return {
+            'id': AGENT_ID.format(i),
+            'name': self.agent_name(i),
+            'description': f"Synthetic agent #{i}, mostly posts about "
+                           f"{self._pick(TOPICS, _AGENT, i, 1)}",
+            'karma': int(2000 * self._unit(_AGENT, i, 2) ** 5) + self._karma.get(i, 0),
+            'follower_count': int(300 * self._unit(_AGENT, i, 3) ** 5) + len(self._followers.get(i, ())),
+            'following_count': int(50 * self._unit(_AGENT, i, 4) ** 3),
+            'created_at': _iso(self.start - 30 * 86400 * self._unit(_AGENT, i, 5)),
+            'last_active': _iso(last_post),
+            'is_active': True,
+            'is_claimed': self._unit(_AGENT, i, 6) > 0.3
+        }
+
+    def iter_agents(self) -> Iterator[Dict[str, Any]]:
+        """Every agent dict, by index"""
+        for i in range(self.agents):
+            yield self.agent(i)
+
+    # -- Submolts ------------------------------------------------------------
+
+    def submolt_name(self, s: int) -> str:
+        return SUBMOLT_NAMES[s] if s < len(SUBMOLT_NAMES) else f"submolt{s}"
+
+    def submolt_index(self, name: str) -> Optional[int]:
+        if name in SUBMOLT_NAMES:
+            s = SUBMOLT_NAMES.index(name)
+        elif name.startswith('submolt') and name[7:].isdigit():
+            s = int(name[7:])
+        else:
+            return None
+        return s if s < self.submolts else None
+
+    def submolt(self, s: int) -> Dict[str, Any]:
+        name = self.submolt_name(s)
+        return {
+            'name': name,
+            'display_name': name.capitalize(),
+            'description': f"Synthetic submolt about {self._pick(TOPICS, _SUBMOLT, s, 1)}",
+            'subscriber_count': int(self.agents * (0.05 + 0.5 * self._unit(_SUBMOLT, s, 2))),
+            'post_count': self._listing('submolt', s).count
+                          + sum(1 for p in self._created if p['submolt'] == s)
+        }
+
+    def subscriptions(self, i: int) -> Set[int]:
+        """Submolts whose posts make up agent i's feed"""
+        wanted = min(3, self.submolts)
+        subs: Set[int] = set()
+        salt = 0
+        while len(subs) < wanted:
+            subs.add(_hash(self.seed, _AGENT, i, 100 + salt) % self.submolts)
+            salt += 1
+        return subs
+
+    # -- Posts ---------------------------------------------------------------
+
+    def post_index(self, post_id: str) -> Optional[int]:
+        """Index of a post id, or None if there is no such post"""
+        match = POST_REF.match(post_id)
+        if not match:
+            return None
+        j = int(match.group(1), 16)
+        return j if j < self.posts + len(self._created) else None
+
+    def _created_ts(self, j: int) -> float:
+        if j >= self.posts:
+            return self._created[j - self.posts]['ts']
+        return self.start + (j + 1) * self.interval
+
+    def _base_comments(self, j: int) -> int:
+        if j >= self.posts:
+            return 0
+        return min(self.max_comments, int(self.mean_comments * 5 * self._unit(_POST, j, 3) ** 4))
+
+    def comment_count(self, j: int) -> int:
+        return self._base_comments(j) + len(self._added_comments.get(j, ()))
+
+    def _counts(self, j: int) -> Tuple[int, int, int, float]:
+        """(upvotes, downvotes, comment_count, created ts) without building the dict"""
+        up = down = 0
+        if j < self.posts:
+            up = int(400 * self._unit(_POST, j, 1) ** 6)
+            down = int(10 * self._unit(_POST, j, 2) ** 4)
+        delta = self._post_votes.get(j)
+        if delta:
+            up, down = up + delta[0], down + delta[1]
+        return up, down, self.comment_count(j), self._created_ts(j)
+
+    def author(self, j: int) -> int:
+        return self._created[j - self.posts]['author'] if j >= self.posts else j % self.agents
+
+    def post_submolt(self, j: int) -> int:
+        return self._created[j - self.posts]['submolt'] if j >= self.posts else j % self.submolts
+
+    def post(self, j: int) -> Dict[str, Any]:
+        up, down, comments, ts = self._counts(j)
+        if j >= self.posts:
+            created = self._created[j - self.posts]
+            title, content = created['title'], created['content']
+        else:
+            title = self._text(TITLES, _POST, j)
+            # Topic words only, so keyword analyses find the topics
+            words = [self._pick(TOPICS, _POST, j, 20 + n) for n in range(4 * (1 + j % 4))]
+            content = f"{title}. " + " ".join(
+                f"{a.capitalize()} and {b}, or {c} vs {d}?" for a, b, c, d in zip(*[iter(words)] * 4)
+            )
+        return {
+            'id': POST_ID.format(j),
+            'title': title,
+            'content': content,
+            'upvotes': up,
+            'downvotes': down,
+            'comment_count': comments,
+            'created_at': _iso(ts),
+            'submolt': {'name': self.submolt_name(self.post_submolt(j))},
+            'author': {'name': self.agent_name(self.author(j))}
+        }
+
+    def iter_posts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Generated post dicts with indices in [start, stop), oldest first"""
+        for j in range(start, min(self.posts, self.posts if stop is None else stop)):
+            yield self.post(j)
+
+    # -- Listings ------------------------------------------------------------
+
+    def _listing(self, kind: str, index: int) -> _Progression:
+        if kind == 'agent':
+            return _Progression(self.posts, self.agents, {index})
+        if kind == 'submolt':
+            return _Progression(self.posts, self.submolts, {index})
+        return _Progression(self.posts, self.submolts, self.subscriptions(index))
+
+    def _created_matching(self, kind: str, index: int) -> List[int]:
+        """Indices of API-created posts in a listing, newest first"""
+        if kind == 'agent':
+            wanted = lambda p: p['author'] == index
+        elif kind == 'submolt':
+            wanted = lambda p: p['submolt'] == index
+        else:
+            subs = self.subscriptions(index)
+            wanted = lambda p: p['submolt'] in subs
+        return [self.posts + n for n in range(len(self._created) - 1, -1, -1)
+                if wanted(self._created[n])]
+
+    def _score(self, j: int, sort: str, now: float) -> float:
+        up, down, comments, ts = self._counts(j)
+        age_hours = max(0.0, now - ts) / 3600
+        if sort == 'top':
+            return up - down
+        if sort == 'rising':
+            return (comments + up) / (age_hours + 2) ** 2
+        return (up - down) / (age_hours + 2) ** 1.5
+
+    def listing(self, kind: str, index: int, sort: str = 'new', offset: int = 0,
+                limit: int = 25) -> Tuple[List[int], int]:
+        """
+        One page of a post listing.
+
+        Args:
+            kind: 'agent' (posts by agent), 'submolt' or 'feed' (agent's
+                subscribed submolts)
+            index: Agent or submolt index
+            sort: One of SORTS
+
+        Returns:
+            (post indices, total posts in the listing)
+        """
+        created = self._created_matching(kind, index)
+        progression = self._listing(kind, index)
+        total = len(created) + progression.count
+
+        def newest(rank: int) -> int:
+            return created[rank] if rank < len(created) else progression.at(rank - len(created))
+
+        if sort == 'new':
+            return [newest(rank) for rank in range(offset, min(total, offset + limit))], total
+
+        key = (kind, index, sort)
+        with self._lock:
+            ranked = self._rankings.get(key)
+        if ranked is None:
+            now = time.time()
+            candidates = [newest(rank) for rank in range(min(total, self.rank_window))]
+            ranked = sorted(candidates, key=lambda j: self._score(j, sort, now), reverse=True)
+            with self._lock:
+                self._rankings[key] = ranked
+        return ranked[offset:offset + limit], len(ranked)
+
+    # -- Comments ------------------------------------------------------------
+
+    def comment_ref(self, comment_id: str) -> Optional[Tuple[int, int]]:
+        """(post index, comment index) of a comment id, or None"""
+        match = COMMENT_REF.match(comment_id)
+        if not match:
+            return None
+        j, k = int(match.group(2), 16), int(match.group(1), 16)
+        if j >= self.posts + len(self._created) or k >= self.comment_count(j):
+            return None
+        return j, k
+
+    def comment(self, j: int, k: int) -> Dict[str, Any]:
+        base = self._base_comments(j)
+        if k >= base:
+            comment = dict(self._added_comments[j][k - base])
+            comment['upvotes'] += self._comment_votes.get((j, k), 0)
+            return comment
+
+        key = j * 4096 + k
+        parent = None
+        if k and self._unit(_COMMENT, key, 1) < 0.35:
+            parent = _hash(self.seed, _COMMENT, key, 2) % k
+        post_author = self.author(j)
+        if parent is not None and self._unit(_COMMENT, key, 3) < 0.5:
+            author = post_author
+        else:
+            author = _hash(self.seed, _COMMENT, key, 4) % self.agents
+            if author == post_author and self.agents > 1:
+                author = (author + 1) % self.agents
+        post_ts = self._created_ts(j)
+        window = min(max(0.0, self.end - post_ts), 2 * 86400)
+        return {
+            'id': COMMENT_ID.format(k, j),
+            'post_id': POST_ID.format(j),
+            'parent_id': COMMENT_ID.format(parent, j) if parent is not None else None,
+            'content': self._text(COMMENTS, _COMMENT, key),
+            'upvotes': int(20 * self._unit(_COMMENT, key, 5) ** 5) + self._comment_votes.get((j, k), 0),
+            'created_at': _iso(post_ts + window * (k + 1) / (base + 1)),
+            'author': {'name': self.agent_name(author)}
+        }
+
+    def comments(self, j: int, sort: str = 'top') -> List[Dict[str, Any]]:
+        """Every comment of post j (flat, parent_id links replies), sorted"""
+        comments = [self.comment(j, k) for k in range(self.comment_count(j))]
+        if sort == 'top':
+            comments.sort(key=lambda c: c['upvotes'], reverse=True)
+        elif sort == 'new':
+            comments.reverse()
+        return comments
+
+    # -- Composite responses -------------------------------------------------
+
+    def profile(self, i: int) -> Dict[str, Any]:
+        """/agents/profile body: agent, newest posts, replies on its own recent posts"""
+        post_ids, _ = self.listing('agent', i, 'new', 0, self.max_profile_posts)
+        recent_comments = []
+        name = self.agent_name(i)
+        for j in post_ids[:20]:
+            post = None
+            for k in range(self.comment_count(j)):
+                comment = self.comment(j, k)
+                if comment['author']['name'] != name:
+                    continue
+                post = post or self.post(j)
+                comment['post'] = {'id': post['id'], 'title': post['title'],
+                                   'submolt': post['submolt']}
+                recent_comments.append(comment)
+            if len(recent_comments) >= 10:
+                break
+        return {
+            'success': True,
+            'agent': self.agent(i),
+            'recentPosts': [self.post(j) for j in post_ids],
+            'recentComments': recent_comments[:10]
+        }
+
+    def discover(self, i: int) -> Dict[str, Any]:
+        """/agents/{name}/discover body: best posts and similar agents"""
+        post_ids, _ = self.listing('agent', i, 'new', 0, self.max_profile_posts)
+        month = time.time() - 30 * 86400
+        best = sorted(post_ids, key=lambda j: self._counts(j)[0], reverse=True)
+        similar = {_hash(self.seed, _AGENT, i, 200 + n) % self.agents for n in range(6)} - {i}
+        return {
+            'success': True,
+            'bestOf': {
+                'allTime': [self.post(j) for j in best[:5]],
+                'last30Days': [self.post(j) for j in best if self._created_ts(j) >= month][:5]
+            },
+            'series': [],
+            'similarAgents': [{'name': self.agent_name(a), 'karma': self.agent(a)['karma']}
+                              for a in sorted(similar)[:5]]
+        }
+
+    # -- Writes --------------------------------------------------------------
+
+    def create_post(self, author: int, title: str, content: str, submolt: int) -> Dict[str, Any]:
+        with self._lock:
+            self._created.append({'author': author, 'submolt': submolt, 'title': title,
+                                  'content': content, 'ts': time.time()})
+            j = self.posts + len(self._created) - 1
+            self._rankings.clear()
+        return self.post(j)
+
+    def create_comment(self, author: int, j: int, content: str,
+                       parent: Optional[int] = None) -> Dict[str, Any]:
+        with self._lock:
+            added = self._added_comments.setdefault(j, [])
+            k = self._base_comments(j) + len(added)
+            added.append({
+                'id': COMMENT_ID.format(k, j),
+                'post_id': POST_ID.format(j),
+                'parent_id': COMMENT_ID.format(parent, j) if parent is not None else None,
+                'content': content,
+                'upvotes': 0,
+                'created_at': _iso(time.time()),
+                'author': {'name': self.agent_name(author)}
+            })
+            self._rankings.clear()
+        return self.comment(j, k)
+
+    def vote_post(self, voter: str, j: int, direction: int) -> str:
+        """
+        Up (+1) or down (-1) vote a post as `voter`. Repeating a vote
+        removes it, like the API.
+
+        Returns:
+            'upvoted', 'downvoted' or 'removed'
+        """
+        target = POST_ID.format(j)
+        with self._lock:
+            previous = self._votes.pop((voter, target), 0)
+            delta = self._post_votes.setdefault(j, [0, 0])
+            if previous:
+                delta[0 if previous > 0 else 1] -= 1
+                self._karma[self.author(j)] = self._karma.get(self.author(j), 0) - previous
+            if previous == direction:
+                action = 'removed'
+            else:
+                self._votes[(voter, target)] = direction
+                delta[0 if direction > 0 else 1] += 1
+                self._karma[self.author(j)] = self._karma.get(self.author(j), 0) + direction
+                action = 'upvoted' if direction > 0 else 'downvoted'
+            self._rankings.clear()
+        return action
+
+    def vote_comment(self, voter: str, j: int, k: int) -> str:
+        """Upvote a comment as `voter` (again: remove the upvote)"""
+        target = COMMENT_ID.format(k, j)
+        with self._lock:
+            if self._votes.pop((voter, target), 0):
+                self._comment_votes[(j, k)] = self._comment_votes.get((j, k), 0) - 1
+                return 'removed'
+            self._votes[(voter, target)] = 1
+            self._comment_votes[(j, k)] = self._comment_votes.get((j, k), 0) + 1
+            return 'upvoted'
+
+    def follow(self, voter: str, i: int, follow: bool = True) -> str:
+        with self._lock:
+            followers = self._followers.setdefault(i, set())
+            if follow:
+                followers.add(voter)
+                return 'followed'
+            followers.discard(voter)
+            return 'unfollowed'
+
+
+class _HTTPError(Exception):
+    """Error answered as {"success": false, "error": message}"""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+# (method, path regex under /api/v1, FakeMoltbookServer handler)
+ROUTES = [
+    ('GET', r'^/agents/profile$', '_get_profile'),
+    ('GET', r'^/agents/me$', '_get_me'),
+    ('GET', r'^/agents/(?P<name>[^/]+)/feed$', '_get_feed'),
+    ('GET', r'^/agents/(?P<name>[^/]+)/discover$', '_get_discover'),
+    ('POST', r'^/agents/(?P<name>[^/]+)/follow$', '_follow'),
+    ('DELETE', r'^/agents/(?P<name>[^/]+)/follow$', '_follow'),
+    ('GET', r'^/submolts/(?P<name>[^/]+)$', '_get_submolt'),
+    ('POST', r'^/posts$', '_create_post'),
+    ('GET', r'^/posts/(?P<id>[^/]+)$', '_get_post'),
+    ('GET', r'^/posts/(?P<id>[^/]+)/comments$', '_get_comments'),
+    ('POST', r'^/posts/(?P<id>[^/]+)/(?P<vote>upvote|downvote)$', '_vote_post'),
+    ('POST', r'^/comments$', '_create_comment'),
+    ('POST', r'^/comments/(?P<id>[^/]+)/upvote$', '_vote_comment'),
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive handler delegating to the FakeMoltbookServer"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "FakeMoltbook/1.0"
+
+    def _dispatch(self):
+        self.server.fake.handle(self)
+
+    do_GET = do_POST = do_DELETE = do_PUT = do_PATCH = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class FakeMoltbookServer:
+    """
+    HTTP server answering Moltbook API requests from a SyntheticDataset.
+
+    Runs on a daemon thread after start(); one thread per connection, so
+    injected latency does not serialize requests.
+    """
+
+    def __init__(self, dataset: Optional[SyntheticDataset] = None, host: str = '127.0.0.1',
+                 port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, stall_rate: float = 0.0, stall: float = 30.0,
+                 rate_limit: Optional[int] = None, rate_window: float = 60.0,
+                 compression: bool = True, max_limit: int = 100, me: int = 0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            dataset: Data served (default: SyntheticDataset())
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            latency: Seconds added before every response
+            jitter: Extra uniform random delay, 0..jitter seconds
+            error_rate: Fraction of requests answered 500/502/503
+            stall_rate: Fraction of requests delayed by `stall` seconds
+                (beyond the client's read timeout, for timeout tests)
+            stall: Seconds a stalled request waits
+            rate_limit: Requests per `rate_window` per client (API key, else
+                address); excess requests get 429 + Retry-After (None = off)
+            rate_window: Rate limit window in seconds
+            compression: gzip bodies for clients sending Accept-Encoding: gzip
+            max_limit: Largest page size honored for `limit`
+            me: Index of the agent every API key acts as
+            seed: Seed of the latency/error injection (default: random)
+        """
+        self.dataset = dataset or SyntheticDataset()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.compression = compression
+        self.max_limit = max_limit
+        self.me = me
+        self.routes = [(method, re.compile(pattern), handler) for method, pattern, handler in ROUTES]
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, List[float]] = {}
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'rate_limited': 0,
+            'injected_errors': 0,
+            'stalls': 0,
+            'bytes_sent': 0,
+            'statuses': {}
+        }
+        self._server = _ThreadingServer((host, port), _Handler)
+        self._server.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to pass as MoltbookClient(base_url=...)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeMoltbookServer':
+        """Serve on a daemon thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True,
+                                        name='moltbook-fakeserver')
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until stop()"""
+        self._server.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeMoltbookServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # -- Request handling ------------------------------------------------------
+
+    def handle(self, request: BaseHTTPRequestHandler):
+        """Answer one request (called on the connection's thread)"""
+        with self._lock:
+            self.stats['requests'] += 1
+
+        length = int(request.headers.get('Content-Length') or 0)
+        raw_body = request.rfile.read(length) if length else b''
+        parts = urllib.parse.urlsplit(request.path)
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(parts.query).items()}
+        token = self._token(request)
+
+        headers: Dict[str, str] = {}
+        try:
+            self._delay()
+            self._throttle(token or request.client_address[0], headers)
+            self._inject_error()
+            status, payload = self._route(request.command, parts.path, query, raw_body, token)
+        except _HTTPError as e:
+            headers.update(e.headers)
+            status, payload = e.status, {'success': False, 'error': str(e)}
+        self._respond(request, status, payload, headers)
+
+    @staticmethod
+    def _token(request: BaseHTTPRequestHandler) -> Optional[str]:
+        auth = request.headers.get('Authorization') or ''
+        if not auth.startswith('Bearer '):
+            return None
+        return auth[7:].strip() or None
+
+    def _delay(self):
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if self.stall_rate and self._random.random() < self.stall_rate:
+            with self._lock:
+                self.stats['stalls'] += 1
+            delay += self.stall
+        if delay > 0:
+            time.sleep(delay)
+
+    def _throttle(self, client: str, headers: Dict[str, str]):
+        """Take a token from the client's bucket or raise 429"""
+        if self.rate_limit is None:
+            return
+        refill = self.rate_limit / self.rate_window
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(client, [float(self.rate_limit), now])
+            bucket[0] = min(float(self.rate_limit), bucket[0] + (now - bucket[1]) * refill)
+            bucket[1] = now
+            allowed = bucket[0] >= 1
+            if allowed:
+                bucket[0] -= 1
+            else:
+                self.stats['rate_limited'] += 1
+            remaining = int(bucket[0])
+            retry_after = max(1, math.ceil((1 - bucket[0]) / refill))
+        headers['X-RateLimit-Limit'] = str(self.rate_limit)
+        headers['X-RateLimit-Remaining'] = str(remaining)
+        if not allowed:
+            raise _HTTPError(429, "Rate limit exceeded", {'Retry-After': str(retry_after)})
+
+    def _inject_error(self):
+        if self.error_rate and self._random.random() < self.error_rate:
+            with self._lock:
+                self.stats['injected_errors'] += 1
+            status = self._random.choice((500, 502, 503))
+            raise _HTTPError(status, "Injected server error",
+                             {'Retry-After': '1'} if status == 503 else None)
+
+    def _route(self, method: str, path: str, query: Dict[str, str], raw_body: bytes,
+               token: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        if not path.startswith('/api/v1/'):
+            raise _HTTPError(404, "Not found")
+        path = path[len('/api/v1'):]
+
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            body = None
+            if raw_body:
+                try:
+                    body = moltbook_sdk.json_loads(raw_body)
+                except ValueError:
+                    raise _HTTPError(400, "Invalid JSON body")
+            params = {key: urllib.parse.unquote(value) for key, value in match.groupdict().items()}
+            return getattr(self, handler)(method=method, query=query, body=body or {},
+                                          token=token, **params)
+        raise _HTTPError(405 if allowed else 404, "Method not allowed" if allowed else "Not found")
+
+    def _respond(self, request: BaseHTTPRequestHandler, status: int, payload: Dict[str, Any],
+                 headers: Dict[str, str]):
+        body = moltbook_sdk.json_dumps(payload)
+        if request.command == 'GET' and status == 200:
+            etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+            headers['ETag'] = etag
+            if etag in (request.headers.get('If-None-Match') or ''):
+                status, body = 304, b''
+        headers['Content-Type'] = 'application/json; charset=utf-8'
+        if (self.compression and len(body) >= 512
+                and 'gzip' in (request.headers.get('Accept-Encoding') or '')):
+            body = gzip.compress(body, compresslevel=6)
+            headers['Content-Encoding'] = 'gzip'
+
+        request.send_response(status)
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        if body:
+            request.wfile.write(body)
+
+        with self._lock:
+            self.stats['bytes_sent'] += len(body)
+            self.stats['statuses'][status] = self.stats['statuses'].get(status, 0) + 1
+            if status == 304:
+                self.stats['not_modified'] += 1
+
+    # -- Endpoint helpers ------------------------------------------------------
+
+    def _page(self, query: Dict[str, str]) -> Tuple[int, int]:
+        """(offset, limit) from the query string"""
+        try:
+            offset = max(0, int(query.get('offset', 0)))
+            limit = min(self.max_limit, max(1, int(query.get('limit', 25))))
+        except ValueError:
+            raise _HTTPError(400, "limit and offset must be integers")
+        return offset, limit
+
+    @staticmethod
+    def _sort(query: Dict[str, str], allowed: Tuple[str, ...], default: str) -> str:
+        sort = query.get('sort', default)
+        if sort not in allowed:
+            raise _HTTPError(400, f"sort must be one of {', '.join(allowed)}")
+        return sort
+
+    def _agent(self, name: str) -> int:
+        i = self.dataset.agent_index(name)
+        if i is None:
+            raise _HTTPError(404, "Agent not found")
+        return i
+
+    def _post(self, post_id: str) -> int:
+        j = self.dataset.post_index(post_id)
+        if j is None:
+            raise _HTTPError(404, "Post not found")
+        return j
+
+    @staticmethod
+    def _authenticated(token: Optional[str]) -> str:
+        if not token:
+            raise _HTTPError(401, "Authentication required")
+        return token
+
+    def _listing_page(self, kind: str, index: int, query: Dict[str, str],
+                      default_sort: str) -> Dict[str, Any]:
+        sort = self._sort(query, SORTS, default_sort)
+        offset, limit = self._page(query)
+        post_ids, total = self.dataset.listing(kind, index, sort, offset, limit)
+        return {
+            'posts': [self.dataset.post(j) for j in post_ids],
+            'count': len(post_ids),
+            'has_more': offset + len(post_ids) < total,
+            'next_offset': offset + len(post_ids)
+        }
+
+    # -- Endpoints -------------------------------------------------------------
+
+    def _get_profile(self, query: Dict[str, str], **_) -> Tuple[int, Dict[str, Any]]:
+        if not query.get('name'):
+            raise _HTTPError(400, "name is required")
+        return 200, self.dataset.profile(self._agent(query['name']))
+
+    def _get_me(self, token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        self._authenticated(token)
+        return 200, {'success': True, 'agent': self.dataset.agent(self.me)}
+
+    def _get_feed(self, name: str, query: Dict[str, str], **_) -> Tuple[int, Dict[str, Any]]:
+        page = self._listing_page('feed', self._agent(name), query, 'new')
+        return 200, dict(page, success=True)
+
+    def _get_discover(self, name: str, **_) -> Tuple[int, Dict[str, Any]]:
+        return 200, self.dataset.discover(self._agent(name))
+
+    def _follow(self, method: str, name: str, token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        voter = self._authenticated(token)
+        action = self.dataset.follow(voter, self._agent(name), follow=method == 'POST')
+        return 200, {'success': True, 'action': action}
+
+    def _get_submolt(self, name: str, query: Dict[str, str], **_) -> Tuple[int, Dict[str, Any]]:
+        s = self.dataset.submolt_index(name)
+        if s is None:
+            raise _HTTPError(404, "Submolt not found")
+        page = self._listing_page('submolt', s, query, 'hot')
+        return 200, dict(page, success=True, submolt=self.dataset.submolt(s))
+
+    def _get_post(self, id: str, **_) -> Tuple[int, Dict[str, Any]]:
+        return 200, {'success': True, 'post': self.dataset.post(self._post(id))}
+
+    def _get_comments(self, id: str, query: Dict[str, str], **_) -> Tuple[int, Dict[str, Any]]:
+        j = self._post(id)
+        sort = self._sort(query, COMMENT_SORTS, 'top')
+        offset, limit = self._page(query)
+        comments = self.dataset.comments(j, sort)
+        page = comments[offset:offset + limit]
+        return 200, {
+            'success': True,
+            'comments': page,
+            'count': len(page),
+            'has_more': offset + len(page) < len(comments),
+            'next_offset': offset + len(page)
+        }
+
+    def _create_post(self, body: Dict[str, Any], token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        self._authenticated(token)
+        title, content = body.get('title'), body.get('content')
+        if not title or not content:
+            raise _HTTPError(400, "title and content are required")
+        s = self.dataset.submolt_index(body.get('submolt_name') or body.get('submolt') or 'general')
+        if s is None:
+            raise _HTTPError(404, "Submolt not found")
+        return 201, {'success': True, 'post': self.dataset.create_post(self.me, title, content, s)}
+
+    def _create_comment(self, body: Dict[str, Any], token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        self._authenticated(token)
+        if not body.get('post_id') or not body.get('content'):
+            raise _HTTPError(400, "post_id and content are required")
+        j = self._post(body['post_id'])
+        parent = None
+        if body.get('parent_id'):
+            ref = self.dataset.comment_ref(body['parent_id'])
+            if ref is None or ref[0] != j:
+                raise _HTTPError(404, "Parent comment not found")
+            parent = ref[1]
+        comment = self.dataset.create_comment(self.me, j, body['content'], parent)
+        return 201, {'success': True, 'comment': comment}
+
+    def _vote_post(self, id: str, vote: str, token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        voter = self._authenticated(token)
+        action = self.dataset.vote_post(voter, self._post(id), 1 if vote == 'upvote' else -1)
+        return 200, {'success': True, 'action': action}
+
+    def _vote_comment(self, id: str, token: Optional[str], **_) -> Tuple[int, Dict[str, Any]]:
+        voter = self._authenticated(token)
+        ref = self.dataset.comment_ref(id)
+        if ref is None:
+            raise _HTTPError(404, "Comment not found")
+        return 200, {'success': True, 'action': self.dataset.vote_comment(voter, *ref)}
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Serve a synthetic Moltbook API locally for load and scaling tests'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8080, help='Port (default: 8080)')
+    parser.add_argument('--agents', type=int, default=1000, help='Number of agents')
+    parser.add_argument('--posts', type=int, default=100_000, help='Number of posts')
+    parser.add_argument('--submolts', type=int, default=len(SUBMOLT_NAMES), help='Number of submolts')
+    parser.add_argument('--days', type=float, default=30.0, help='Days the posts are spread over')
+    parser.add_argument('--comments', type=float, default=5.0, help='Mean comments per post')
+    parser.add_argument('--seed', type=int, default=0, help='Dataset seed')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Delay before every response')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Extra random delay, 0..N ms')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help='Fraction of requests answered 500/502/503')
+    parser.add_argument('--stall-rate', type=float, default=0.0,
+                        help='Fraction of requests held for --stall-seconds')
+    parser.add_argument('--stall-seconds', type=float, default=30.0, help='Length of a stall')
+    parser.add_argument('--rate-limit', type=int,
+                        help='Requests per minute per client before 429 (default: unlimited)')
+    parser.add_argument('--no-gzip', action='store_true', help='Never compress responses')
+    parser.add_argument('--max-limit', type=int, default=100, help='Largest page size honored')
+
+    args = parser.parse_args()
+
+    dataset = SyntheticDataset(agents=args.agents, posts=args.posts, submolts=args.submolts,
+                               days=args.days, comments=args.comments, seed=args.seed)
+    server = FakeMoltbookServer(
+        dataset, host=args.host, port=args.port, latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000, error_rate=args.error_rate, stall_rate=args.stall_rate,
+        stall=args.stall_seconds, rate_limit=args.rate_limit, compression=not args.no_gzip,
+        max_limit=args.max_limit
+    )
+
+    print(f"\n🧪 FAKE MOLTBOOK API: {server.base_url}/api/v1")
+    print(f"  {dataset.agents:,} agents | {dataset.posts:,} posts | {dataset.submolts} submolts"
+          f" | ~{dataset.mean_comments:g} comments/post")
+    print(f"  Agents: {dataset.agent_name(0)} .. {dataset.agent_name(dataset.agents - 1)}"
+          f" | Submolts: {', '.join(dataset.submolt_name(s) for s in range(min(5, dataset.submolts)))}")
+    print(f"\n  MOLTBOOK_BASE_URL={server.base_url} python3 trend_analyzer.py {dataset.agent_name(1)}")
+    print("\nCtrl-C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        stats = server.stats
+        print(f"\n📊 {stats['requests']} requests | {stats['not_modified']} not modified | "
+              f"{stats['rate_limited']} rate limited | {stats['injected_errors']} injected errors | "
+              f"{stats['bytes_sent'] / 1e6:.1f} MB sent")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Moltbook Metrics - Rolling latency percentiles per endpoint template
+
+LatencyAggregator is a MoltbookClient observer: it receives a
+RequestTiming for every HTTP attempt and keeps the last `window` samples
+of each phase (queue, connect, TLS, time-to-first-byte, body read, JSON
+decode, model construction, total) per endpoint template, e.g.
+/agents/profile or /agents/{name}/feed. Recording is a few deque appends,
+cheap enough to leave on; percentiles are only sorted when asked for.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_sdk
+    import moltbook_metrics
+
+    metrics = moltbook_metrics.LatencyAggregator()
+    client = moltbook_sdk.MoltbookClient(observers=[metrics])
+    client.get_agent_profile("ClaudeCode_GLM4_7")
+
+    print(metrics.report())
+    metrics.percentiles()['GET /agents/profile']['ttfb']   # {'p50': ..., 'p95': ..., ...}
+"""
+
+import sys
+import os
+import re
+import threading
+from collections import deque
+from typing import Optional, Dict, List, Tuple, Pattern
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+PHASES = ['queue', 'connect', 'tls', 'ttfb', 'read', 'decode', 'models', 'total']
+
+# Path segments that are names/ids, replaced in endpoint templates
+TEMPLATE_RULES: List[Tuple[Pattern, str]] = [
+    (re.compile(r'^/agents/(?!profile$|me$)[^/]+'), '/agents/{name}'),
+    (re.compile(r'^/submolts/[^/]+'), '/submolts/{name}'),
+    (re.compile(r'^/(posts|comments)/[^/]+'), r'/\1/{id}'),
+]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Reduce an endpoint to its template: no query string, ids as placeholders.
+
+    '/agents/profile?name=Foo' -> '/agents/profile'
+    '/posts/abc-123/upvote'    -> '/posts/{id}/upvote'
+    """
+    path = endpoint.split('?', 1)[0]
+    for pattern, replacement in TEMPLATE_RULES:
+        if pattern.match(path):
+            return pattern.sub(replacement, path, count=1)
+    return path
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (q in 0-100)"""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil(n * q / 100)
+    return ordered[int(rank) - 1]
+
+
+class _EndpointStats:
+    """Sample windows and counters for one method + endpoint template"""
+
+    def __init__(self, window: int):
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.requests = 0
+        self.errors = 0
+        self.statuses: Dict[int, int] = {}
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+
+class LatencyAggregator:
+    """
+    Observer keeping rolling p50/p95/p99 per endpoint template and phase.
+
+    Connect/TLS samples are only taken for attempts that opened a new
+    connection, so their percentiles describe handshakes, not reuse.
+    """
+
+    def __init__(self, window: int = 1024):
+        """
+        Args:
+            window: Samples kept per endpoint template and phase
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def __call__(self, timing: moltbook_sdk.RequestTiming):
+        self.record(timing)
+
+    def record(self, timing: moltbook_sdk.RequestTiming):
+        """Add one RequestTiming"""
+        key = f"{timing.method} {endpoint_template(timing.endpoint)}"
+
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats(self.window)
+
+            if timing.kind == 'models':
+                stats.samples['models'].append(timing.models)
+                return
+
+            stats.requests += 1
+            if timing.error is not None:
+                stats.errors += 1
+            if timing.status is not None:
+                stats.statuses[timing.status] = stats.statuses.get(timing.status, 0) + 1
+            stats.wire_bytes += timing.wire_bytes
+            stats.decoded_bytes += timing.decoded_bytes
+
+            samples = stats.samples
+            samples['queue'].append(timing.queue)
+            if not timing.reused:
+                samples['connect'].append(timing.connect)
+                samples['tls'].append(timing.tls)
+            if timing.status is not None:
+                samples['ttfb'].append(timing.ttfb)
+                samples['read'].append(timing.read)
+                samples['decode'].append(timing.decode)
+            samples['total'].append(timing.total)
+
+    def percentiles(self, key: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        p50/p95/p99 (seconds) and sample count per endpoint and phase.
+
+        Args:
+            key: Only this endpoint, e.g. 'GET /agents/profile'
+
+        Returns:
+            {endpoint: {phase: {'count', 'p50', 'p95', 'p99'}}}, phases
+            without samples omitted
+        """
+        with self._lock:
+            snapshot = {
+                name: {phase: list(values) for phase, values in stats.samples.items() if values}
+                for name, stats in self._endpoints.items()
+                if key is None or name == key
+            }
+
+        result = {}
+        for name, phases in snapshot.items():
+            result[name] = {}
+            for phase, values in phases.items():
+                values.sort()
+                result[name][phase] = {
+                    'count': len(values),
+                    'p50': percentile(values, 50),
+                    'p95': percentile(values, 95),
+                    'p99': percentile(values, 99)
+                }
+        return result
+
+    def counters(self) -> Dict[str, Dict[str, object]]:
+        """Requests, errors, statuses and bytes per endpoint (since creation/reset)"""
+        with self._lock:
+            return {
+                name: {
+                    'requests': stats.requests,
+                    'errors': stats.errors,
+                    'statuses': dict(stats.statuses),
+                    'wire_bytes': stats.wire_bytes,
+                    'decoded_bytes': stats.decoded_bytes
+                }
+                for name, stats in self._endpoints.items()
+            }
+
+    def reset(self):
+        """Drop all samples and counters"""
+        with self._lock:
+            self._endpoints.clear()
+
+    def report(self) -> str:
+        """Text table of p50/p95/p99 in milliseconds per endpoint and phase"""
+        percentiles = self.percentiles()
+        counters = self.counters()
+        lines = []
+        for name in sorted(percentiles):
+            count = counters[name]
+            lines.append(f"{name}  ({count['requests']} requests, {count['errors']} errors, "
+                         f"{count['wire_bytes']} wire bytes)")
+            for phase in PHASES:
+                if phase not in percentiles[name]:
+                    continue
+                p = percentiles[name][phase]
+                lines.append(f"  {phase:8s} p50 {p['p50'] * 1000:8.2f}ms  "
+                             f"p95 {p['p95'] * 1000:8.2f}ms  "
+                             f"p99 {p['p99'] * 1000:8.2f}ms  (n={p['count']})")
+        return "\n".join(lines)
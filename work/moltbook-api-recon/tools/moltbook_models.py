@@ -0,0 +1,194 @@
+"""
+Moltbook Models - Compact model variants for large in-memory mirrors
+
+The moltbook_sdk dataclasses carry a per-instance __dict__, which costs
+more than the data itself once whole submolts are held in memory. This
+module offers two denser forms:
+
+- CompactAgent / CompactPost / CompactComment: frozen, __slots__ versions
+  of the SDK models (same fields, same from_dict parsing)
+- PostBatch: columnar store of the numeric post fields in `array` columns,
+  with submolt names interned into a small code table
+
+`python3 sdk_benchmark.py memory` reports the footprint of each form.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_models
+
+    post = moltbook_models.CompactPost.from_dict(raw_post)
+
+    batch = moltbook_models.PostBatch.from_dicts(submolt_data['posts'])
+    print(len(batch), batch.total('upvotes'), batch.count_by_submolt())
+    for i in batch.top(5, 'upvotes'):
+        print(batch.ids[i], batch.upvotes[i])
+"""
+
+import sys
+import os
+import heapq
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Any, Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+@dataclass(frozen=True)
+class CompactAgent:
+    """Slotted, immutable Agent"""
+    __slots__ = ('id', 'name', 'description', 'karma', 'follower_count',
+                 'following_count', 'created_at', 'is_active', 'is_claimed')
+    id: str
+    name: str
+    description: str
+    karma: int
+    follower_count: int
+    following_count: int
+    created_at: str
+    is_active: bool
+    is_claimed: bool
+
+    # Same parsing as the SDK model
+    from_dict = classmethod(moltbook_sdk.Agent.from_dict.__func__)
+
+
+@dataclass(frozen=True)
+class CompactPost:
+    """Slotted, immutable Post"""
+    __slots__ = ('id', 'title', 'content', 'upvotes', 'downvotes',
+                 'comment_count', 'created_at', 'submolt', 'created_ts')
+    id: str
+    title: str
+    content: str
+    upvotes: int
+    downvotes: int
+    comment_count: int
+    created_at: str
+    submolt: str
+    created_ts: float
+
+    from_dict = classmethod(moltbook_sdk.Post.from_dict.__func__)
+
+
+@dataclass(frozen=True)
+class CompactComment:
+    """Slotted, immutable Comment"""
+    __slots__ = ('id', 'content', 'upvotes', 'created_at', 'post_id',
+                 'post_title', 'submolt', 'author', 'created_ts')
+    id: str
+    content: str
+    upvotes: int
+    created_at: str
+    post_id: str
+    post_title: str
+    submolt: str
+    author: str
+    created_ts: float
+
+    from_dict = classmethod(moltbook_sdk.Comment.from_dict.__func__)
+
+
+class PostBatch:
+    """
+    Columnar store of post ids and numeric fields.
+
+    Columns are parallel: row i is ids[i], upvotes[i], downvotes[i],
+    comment_count[i], created_at[i] (epoch seconds) and submolt_codes[i],
+    an index into `submolt_names`. Numeric columns are `array` objects, so
+    numpy.frombuffer(batch.upvotes, dtype='q') wraps them without copying.
+    Titles and content are not kept.
+    """
+
+    NUMERIC_COLUMNS = ('upvotes', 'downvotes', 'comment_count', 'created_at')
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.upvotes = array('q')
+        self.downvotes = array('q')
+        self.comment_count = array('q')
+        self.created_at = array('d')
+        self.submolt_codes = array('I')
+        self.submolt_names: List[str] = []
+        self._submolt_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_dicts(cls, items: Iterable[Dict[str, Any]]) -> 'PostBatch':
+        """Build a batch from raw post dicts"""
+        batch = cls()
+        batch.extend(items)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _submolt_code(self, name: str) -> int:
+        """Code of a submolt name, adding it to the table if new"""
+        code = self._submolt_index.get(name)
+        if code is None:
+            code = self._submolt_index[name] = len(self.submolt_names)
+            self.submolt_names.append(sys.intern(name))
+        return code
+
+    def append(self, data: Dict[str, Any]):
+        """Add one raw post dict (parsed like Post.from_dict)"""
+        submolt = data.get('submolt')
+        self.ids.append(data.get('id', ''))
+        self.upvotes.append(data.get('upvotes', 0))
+        self.downvotes.append(data.get('downvotes', 0))
+        self.comment_count.append(data.get('comment_count', 0))
+        self.created_at.append(moltbook_sdk.parse_timestamp(data.get('created_at')))
+        self.submolt_codes.append(self._submolt_code(
+            submolt.get('name', 'unknown') if submolt else 'unknown'
+        ))
+
+    def extend(self, items: Iterable[Dict[str, Any]]):
+        """Add raw post dicts"""
+        for data in items:
+            self.append(data)
+
+    def submolt(self, index: int) -> str:
+        """Submolt name of row `index`"""
+        return self.submolt_names[self.submolt_codes[index]]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Row `index` as a dict"""
+        return {
+            'id': self.ids[index],
+            'upvotes': self.upvotes[index],
+            'downvotes': self.downvotes[index],
+            'comment_count': self.comment_count[index],
+            'created_at': self.created_at[index],
+            'submolt': self.submolt(index)
+        }
+
+    def total(self, column: str) -> float:
+        """Sum of a numeric column"""
+        if column not in self.NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        return sum(getattr(self, column))
+
+    def top(self, n: int, column: str = 'upvotes') -> List[int]:
+        """Row indexes of the `n` highest values of a numeric column"""
+        if column not in self.NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        values = getattr(self, column)
+        return heapq.nlargest(n, range(len(values)), key=values.__getitem__)
+
+    def count_by_submolt(self) -> Dict[str, int]:
+        """Number of posts per submolt"""
+        counts = [0] * len(self.submolt_names)
+        for code in self.submolt_codes:
+            counts[code] += 1
+        return dict(zip(self.submolt_names, counts))
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the batch, including id strings"""
+        total = sys.getsizeof(self.ids) + sum(sys.getsizeof(i) for i in self.ids)
+        for column in self.NUMERIC_COLUMNS + ('submolt_codes',):
+            total += sys.getsizeof(getattr(self, column))
+        total += sum(sys.getsizeof(name) for name in self.submolt_names)
+        return total
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Moltbook Rate Limiter - Cross-process token buckets for the documented limits
+
+Every process on the box draws from the same buckets, stored in a SQLite
+file (~/.moltbook/ratelimit.sqlite3) and updated under an exclusive write
+transaction. A caller either gets its tokens, or learns exactly when they
+will be available - the server never has to answer 429.
+
+Limits (SKILL.md / prompts/moltbook-agent.md):
+- 100 requests per minute
+- 1 post per 30 minutes
+- 1 comment per 20 seconds
+- 50 comments per day
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_sdk
+    import moltbook_ratelimit
+
+    limiter = moltbook_ratelimit.RateLimiter()
+    client = moltbook_sdk.MoltbookClient(api_key=key, rate_limiter=limiter)
+
+    # Or check by hand without blocking
+    decision = limiter.try_acquire('comment')
+    if not decision.allowed:
+        print(f"Sleep {decision.wait:.0f}s")
+"""
+
+import sys
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+POST_INTERVAL = 30 * 60      # 1 post per 30 minutes
+COMMENT_INTERVAL = 20        # 1 comment per 20 seconds
+MAX_COMMENTS_PER_DAY = 50
+MAX_REQUESTS_PER_MINUTE = 100
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """Token bucket: holds up to `capacity` tokens, refilled over `period` seconds"""
+    capacity: float
+    period: float
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second"""
+        return self.capacity / self.period
+
+
+DEFAULT_BUCKETS = {
+    'request': BucketSpec(MAX_REQUESTS_PER_MINUTE, 60),
+    'post': BucketSpec(1, POST_INTERVAL),
+    'comment': BucketSpec(1, COMMENT_INTERVAL),
+    'comment_day': BucketSpec(MAX_COMMENTS_PER_DAY, 24 * 3600),
+}
+
+# Buckets each action draws one token from
+ACTION_BUCKETS = {
+    'request': ['request'],
+    'vote': ['request'],
+    'post': ['request', 'post'],
+    'comment': ['request', 'comment', 'comment_day'],
+}
+
+
+def classify(method: str, endpoint: str) -> str:
+    """Map an API call to its rate-limit action"""
+    if method == "GET":
+        return 'request'
+    path = endpoint.split('?', 1)[0].rstrip('/')
+    if path == '/posts':
+        return 'post'
+    if path == '/comments' or re.match(r'^/posts/[^/]+/comments$', path):
+        return 'comment'
+    if re.match(r'^/(posts|comments)/[^/]+/(upvote|downvote)$', path):
+        return 'vote'
+    return 'request'
+
+
+class RateLimitExceeded(moltbook_sdk.MoltbookAPIError):
+    """Local refusal: the action would exceed a documented rate limit"""
+
+    def __init__(self, action: str, wait: float):
+        super().__init__(
+            f"Rate limit: {action} allowed again in {wait:.1f}s",
+            retry_after=wait
+        )
+        self.action = action
+        self.wait = wait
+        self.retry_at = time.time() + wait
+
+
+@dataclass
+class Decision:
+    """Outcome of a rate-limit check"""
+    allowed: bool
+    wait: float = 0.0       # Seconds until the action is allowed
+    retry_at: float = 0.0   # Epoch time when the action is allowed
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by every process using the same file.
+
+    Buckets are refilled lazily from the stored timestamp on each check, and
+    all buckets of an action are debited in one transaction (all or
+    nothing).
+    """
+
+    def __init__(self, path: Optional[str] = None,
+                 buckets: Optional[Dict[str, BucketSpec]] = None,
+                 actions: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            path: SQLite state file (default: ~/.moltbook/ratelimit.sqlite3)
+            buckets: Bucket specs by name (default: DEFAULT_BUCKETS)
+            actions: Buckets per action (default: ACTION_BUCKETS)
+        """
+        if path is None:
+            config_dir = Path.home() / ".moltbook"
+            config_dir.mkdir(exist_ok=True)
+            path = str(config_dir / "ratelimit.sqlite3")
+
+        self.path = path
+        self.buckets = buckets or DEFAULT_BUCKETS
+        self.actions = actions or ACTION_BUCKETS
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def _levels(self, names: List[str], now: float) -> Dict[str, float]:
+        """Current token level per bucket, refilled up to `now`"""
+        levels = {}
+        for name in names:
+            spec = self.buckets[name]
+            row = self._db.execute(
+                "SELECT tokens, updated_at FROM buckets WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                levels[name] = spec.capacity
+            else:
+                tokens, updated_at = row
+                elapsed = max(0.0, now - updated_at)
+                levels[name] = min(spec.capacity, tokens + elapsed * spec.rate)
+        return levels
+
+    def try_acquire(self, action: str) -> Decision:
+        """
+        Take one token from every bucket of `action`, without blocking.
+
+        Returns:
+            Decision; when refused, `wait`/`retry_at` say exactly when the
+            action will be allowed
+        """
+        names = self.actions[action]
+
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                levels = self._levels(names, now)
+
+                wait = max(
+                    ((1 - levels[name]) / self.buckets[name].rate
+                     for name in names if levels[name] < 1),
+                    default=0.0
+                )
+
+                if wait <= 0:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                        [(name, levels[name] - 1, now) for name in names]
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+        if wait > 0:
+            return Decision(allowed=False, wait=wait, retry_at=now + wait)
+        return Decision(allowed=True, retry_at=now)
+
+    def acquire(self, action: str, max_wait: Optional[float] = None):
+        """
+        Take tokens for `action`, sleeping until they are available.
+
+        Args:
+            action: 'request', 'vote', 'post' or 'comment'
+            max_wait: Longest total sleep allowed (None = no limit,
+                0 = never sleep)
+
+        Raises:
+            RateLimitExceeded: If the action cannot be allowed within max_wait
+        """
+        waited = 0.0
+        while True:
+            decision = self.try_acquire(action)
+            if decision.allowed:
+                return
+            if max_wait is not None and waited + decision.wait > max_wait:
+                raise RateLimitExceeded(action, decision.wait)
+            time.sleep(decision.wait)
+            waited += decision.wait
+
+    def acquire_request(self, method: str, endpoint: str, max_wait: Optional[float] = None):
+        """acquire() for the action an API call maps to (see classify)"""
+        self.acquire(classify(method, endpoint), max_wait=max_wait)
+
+    def status(self) -> Dict[str, Dict[str, float]]:
+        """Current tokens and capacity per bucket"""
+        with self._lock:
+            levels = self._levels(list(self.buckets), time.time())
+        return {
+            name: {'tokens': levels[name], 'capacity': spec.capacity}
+            for name, spec in self.buckets.items()
+        }
+
+    def close(self):
+        """Close the state file"""
+        with self._lock:
+            self._db.close()
+
+
+def main():
+    """CLI interface: show bucket levels"""
+    limiter = RateLimiter()
+    print("⏱️  Moltbook rate limits (shared by all processes)")
+    print("=" * 60)
+    for name, level in limiter.status().items():
+        print(f"  {name:12s} {level['tokens']:6.1f} / {level['capacity']:g} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,12 +22,27 @@ Usage:
     client.post_comment(post_id, "Great post!")
 """
 
-import urllib.request
-import urllib.error
+import codecs
+import contextlib
+import contextvars
+import email.utils
+import functools
+import heapq
+import http.client
 import json
-from typing import Optional, Dict, List, Any
+import os
+import random
+import re
+import threading
+import time
+import urllib.parse
+import zlib
+from typing import Optional, Dict, List, Set, Any, Tuple, Callable, Pattern, Iterator, Iterable
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 @dataclass
@@ -69,6 +84,7 @@ class Post:
     comment_count: int
     created_at: str
     submolt: str
+    created_ts: float = 0.0  # created_at as UTC epoch seconds (0.0 if unparseable)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Post':
@@ -81,7 +97,8 @@ class Post:
             downvotes=data.get('downvotes', 0),
             comment_count=data.get('comment_count', 0),
             created_at=data.get('created_at', ''),
-            submolt=submolt_data.get('name', 'unknown') if submolt_data else 'unknown'
+            submolt=submolt_data.get('name', 'unknown') if submolt_data else 'unknown',
+            created_ts=parse_timestamp(data.get('created_at'))
         )
 
 
@@ -96,6 +113,7 @@ class Comment:
     post_title: str
     submolt: str
     author: str
+    created_ts: float = 0.0  # created_at as UTC epoch seconds (0.0 if unparseable)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Comment':
@@ -108,50 +126,1802 @@ class Comment:
             post_id=post_data.get('id', '') if post_data else '',
             post_title=post_data.get('title', '') if post_data else '',
             submolt=post_data.get('submolt', {}).get('name', 'unknown') if post_data else 'unknown',
-            author=data.get('author', {}).get('name', 'unknown') if data.get('author') else 'unknown'
+            author=data.get('author', {}).get('name', 'unknown') if data.get('author') else 'unknown',
+            created_ts=parse_timestamp(data.get('created_at'))
         )
 
 
+class LazyModelList(Sequence):
+    """
+    Read-only list of model objects backed by raw response dicts.
+
+    Each model is built the first time it is indexed or iterated and then
+    kept. Field scans (values, top, where) read the raw dicts, so counts
+    and sums never build an object.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], Any]):
+        """
+        Args:
+            items: Raw dicts from the API response (not copied or modified)
+            factory: Model constructor, e.g. Post.from_dict
+        """
+        self.raw = items
+        self._factory = factory
+        self._built: List[Any] = [None] * len(items)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.raw)))]
+        model = self._built[index]
+        if model is None:
+            model = self._built[index] = self._factory(self.raw[index])
+        return model
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self.raw)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        built = sum(1 for model in self._built if model is not None)
+        return f"<LazyModelList {len(self.raw)} items, {built} built>"
+
+    def values(self, field: str, default: Any = 0) -> Iterator[Any]:
+        """Raw values of one field, without building models"""
+        return (item.get(field, default) for item in self.raw)
+
+    def top(self, n: int, field: str = 'upvotes') -> List[Any]:
+        """The `n` models with the highest `field`, building only those"""
+        indexes = heapq.nlargest(n, range(len(self.raw)),
+                                 key=lambda i: self.raw[i].get(field, 0))
+        return [self[i] for i in indexes]
+
+    def where(self, predicate: Callable[[Dict[str, Any]], bool]) -> Iterator[Any]:
+        """Models whose raw dict satisfies `predicate`, building only those"""
+        for index, item in enumerate(self.raw):
+            if predicate(item):
+                yield self[index]
+
+
+class ProfileView:
+    """
+    Lazy view of an /agents/profile response.
+
+    Wraps the raw payload: `posts` and `comments` are LazyModelLists and
+    `agent` is built on first access. Aggregates are computed from the raw
+    dicts once and cached. Dict-style access (`view['agent']`,
+    `view.get('recentPosts')`) reads the payload, so a view can be passed
+    where a profile dict was expected.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Args:
+            data: Profile payload as returned by get_agent_profile (shared,
+                never modified)
+        """
+        self.data = data
+        self.posts = LazyModelList(data.get('recentPosts') or [], Post.from_dict)
+        self.comments = LazyModelList(data.get('recentComments') or [], Comment.from_dict)
+        self._agent: Optional[Agent] = None
+        self._aggregates: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    @property
+    def agent(self) -> Agent:
+        """Agent model (built once)"""
+        if self._agent is None:
+            self._agent = Agent.from_dict(self.data.get('agent') or {})
+        return self._agent
+
+    def _aggregate(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Compute an aggregate once per view"""
+        if name not in self._aggregates:
+            self._aggregates[name] = compute()
+        return self._aggregates[name]
+
+    @property
+    def total_upvotes(self) -> int:
+        """Sum of upvotes over all posts"""
+        return self._aggregate('total_upvotes', lambda: sum(self.posts.values('upvotes')))
+
+    @property
+    def total_downvotes(self) -> int:
+        """Sum of downvotes over all posts"""
+        return self._aggregate('total_downvotes', lambda: sum(self.posts.values('downvotes')))
+
+    @property
+    def total_comments_received(self) -> int:
+        """Sum of comment counts over all posts"""
+        return self._aggregate('total_comments_received',
+                               lambda: sum(self.posts.values('comment_count')))
+
+    @property
+    def submolts(self) -> List[str]:
+        """Distinct submolts posted in"""
+        return self._aggregate('submolts', lambda: list({
+            (item.get('submolt') or {}).get('name', 'unknown') for item in self.posts.raw
+        }))
+
+    def top_posts(self, n: int = 3, field: str = 'upvotes') -> List[Post]:
+        """Best `n` posts by `field` (only those posts are built)"""
+        return self.posts.top(n, field)
+
+
+class CommentTree:
+    """
+    Comments of one post, indexed by id and by parent.
+
+    Accepts flat comments carrying `parent_id`, nested `replies` lists, or
+    both. The authors of each comment's direct replies are indexed at build
+    time, so has_reply_from() is a set lookup and unreplied() is one pass.
+    Raw dicts are kept as returned (nested `replies` lists included).
+    """
+
+    def __init__(self, post_id: str, comments: Iterable[Dict[str, Any]]):
+        """
+        Args:
+            post_id: Post the comments belong to
+            comments: Raw comment dicts from /posts/{id}/comments
+        """
+        self.post_id = post_id
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.parent_of: Dict[str, Optional[str]] = {}
+        self.children: Dict[Optional[str], List[str]] = {}  # None = top level
+        self._reply_authors: Dict[str, set] = {}
+
+        pending = [(comment, None) for comment in comments]
+        while pending:
+            comment, nested_parent = pending.pop()
+            comment_id = comment.get('id')
+            if not comment_id or comment_id in self.by_id:
+                continue
+            parent_id = comment.get('parent_id') or nested_parent
+            self.by_id[comment_id] = comment
+            self.parent_of[comment_id] = parent_id
+            self.children.setdefault(parent_id, []).append(comment_id)
+            if parent_id is not None:
+                self._reply_authors.setdefault(parent_id, set()).add(self.author(comment))
+            pending.extend((reply, comment_id) for reply in comment.get('replies') or ())
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __contains__(self, comment_id: str) -> bool:
+        return comment_id in self.by_id
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.by_id.values())
+
+    @staticmethod
+    def author(comment: Dict[str, Any]) -> str:
+        """Author name of a raw comment ('unknown' if missing)"""
+        return (comment.get('author') or {}).get('name', 'unknown')
+
+    def roots(self) -> List[Dict[str, Any]]:
+        """Top-level comments (including replies whose parent is missing)"""
+        return [self.by_id[i] for i, parent in self.parent_of.items()
+                if parent is None or parent not in self.by_id]
+
+    def replies(self, comment_id: str) -> List[Dict[str, Any]]:
+        """Direct replies to a comment"""
+        return [self.by_id[i] for i in self.children.get(comment_id, ())]
+
+    def has_reply_from(self, comment_id: str, author: str) -> bool:
+        """Whether `author` wrote a direct reply to the comment"""
+        return author in self._reply_authors.get(comment_id, ())
+
+    def unreplied(self, author: str) -> List[Dict[str, Any]]:
+        """Comments by others that `author` has not replied to directly"""
+        return [comment for comment_id, comment in self.by_id.items()
+                if self.author(comment) != author and not self.has_reply_from(comment_id, author)]
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_timestamp(value: Optional[str]) -> float:
+    """
+    Convert an API ISO 8601 timestamp to UTC epoch seconds.
+
+    A trailing 'Z' is accepted and naive timestamps are taken as UTC.
+    Results are cached: re-fetched posts keep their timestamp strings, so
+    repeat parses are dictionary lookups.
+
+    Returns:
+        Epoch seconds, or 0.0 if the value is missing or malformed
+    """
+    if not value:
+        return 0.0
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return 0.0
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def created_before(since: float) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Stop predicate for the iter_* methods: true for items created before
+    `since` (epoch seconds). Items without a valid created_at never stop
+    the walk. Only meaningful on newest-first (sort='new') listings.
+    """
+    def stop(item: Dict[str, Any]) -> bool:
+        created = parse_timestamp(item.get('created_at'))
+        return 0.0 < created < since
+    return stop
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """
+    A JSON (de)serializer.
+
+    loads accepts bytes or str; dumps(obj, indent=False) returns UTF-8
+    bytes, indented by 2 spaces when `indent` is true and compact
+    (orjson's separators) otherwise, so request bodies and saved files
+    are the same bytes whichever backend is installed.
+    """
+    name: str
+    loads: Callable[[Any], Any]
+    dumps: Callable[..., bytes]
+
+
+JSON_BACKENDS = ['orjson', 'ujson', 'json']
+
+
+def _load_json_backend(name: str) -> Optional[JSONBackend]:
+    """Build a backend by module name, or None if it is not installed"""
+    if name == 'orjson':
+        try:
+            import orjson
+        except ImportError:
+            return None
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            option = orjson.OPT_NON_STR_KEYS  # int keys become strings, as in json
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option)
+
+        return JSONBackend('orjson', orjson.loads, dumps)
+
+    if name == 'ujson':
+        try:
+            import ujson
+        except ImportError:
+            return None
+
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                               indent=2 if indent else 0).encode('utf-8')
+
+        return JSONBackend('ujson', ujson.loads, dumps)
+
+    if name == 'json':
+        def dumps(obj: Any, indent: bool = False) -> bytes:
+            if indent:
+                return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+            return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        return JSONBackend('json', json.loads, dumps)
+
+    raise ValueError(f"Unknown JSON backend: {name} (choose from {', '.join(JSON_BACKENDS)})")
+
+
+def available_json_backends() -> List[str]:
+    """Names of the installed JSON backends, fastest first"""
+    return [name for name in JSON_BACKENDS if _load_json_backend(name) is not None]
+
+
+def set_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """
+    Select the JSON backend used for request/response bodies and tool files.
+
+    Args:
+        name: 'orjson', 'ujson' or 'json' (None = fastest installed)
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    global _json
+    if name is None:
+        backend = next(b for b in map(_load_json_backend, JSON_BACKENDS) if b is not None)
+    else:
+        backend = _load_json_backend(name)
+        if backend is None:
+            raise ValueError(f"JSON backend not installed: {name}")
+    _json = backend
+    return backend
+
+
+def json_backend() -> JSONBackend:
+    """The JSON backend in use"""
+    return _json
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON bytes/str with the current backend (raises ValueError)"""
+    return _json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the current backend"""
+    return _json.dumps(obj, indent)
+
+
+def load_json(path: str) -> Any:
+    """
+    Read a JSON file with the current backend.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not valid JSON
+    """
+    with open(path, 'rb') as f:
+        return _json.loads(f.read())
+
+
+def save_json(path: str, obj: Any, indent: bool = True):
+    """Write `obj` to a JSON file with the current backend"""
+    data = _json.dumps(obj, indent)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# Fastest installed backend, unless MOLTBOOK_JSON names one
+_json: JSONBackend = set_json_backend(os.environ.get('MOLTBOOK_JSON') or None)
+
+
 class MoltbookAPIError(Exception):
     """API error exception"""
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error description
+            status: HTTP status code (None for connection/parse errors)
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class MoltbookTimeoutError(MoltbookAPIError):
+    """Request timed out (connect/read timeout or exhausted deadline)"""
     pass
 
 
+_deadline: contextvars.ContextVar = contextvars.ContextVar('moltbook_deadline', default=None)
+
+
+@contextlib.contextmanager
+def deadline(seconds: Optional[float]):
+    """
+    Bound every request made inside the block to a shared time budget.
+
+    Requests use only the time remaining (timeouts are clipped, retries
+    and rate-limit waits stop early) and fail with MoltbookTimeoutError
+    once it is spent. Nested deadlines keep the earliest expiry.
+    Propagates to AsyncMoltbookClient calls made inside the block.
+
+    Args:
+        seconds: Budget in seconds (None = no deadline)
+    """
+    if seconds is None:
+        yield
+        return
+
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left in the current deadline, or None if there is none"""
+    expires_at = _deadline.get()
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def _clip(timeout: Optional[float], remaining: Optional[float]) -> Optional[float]:
+    """Shorten a timeout to the remaining deadline budget"""
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+@dataclass
+class HTTPResponse:
+    """Raw HTTP response returned by the transport"""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    wire_bytes: int = 0  # Body bytes received before Content-Encoding decoding
+
+
+@dataclass
+class RequestTiming:
+    """
+    Where the time of one HTTP attempt went, passed to client observers.
+
+    Phases are in seconds. kind='models' events time Post/Comment
+    construction from an already-fetched response and only set `models`.
+    """
+    method: str
+    endpoint: str
+    kind: str = 'http'            # 'http' or 'models'
+    status: Optional[int] = None  # None if no response was received
+    error: Optional[str] = None   # Exception class name on failure
+    reused: bool = False          # Sent over a pooled keep-alive connection
+    queue: float = 0.0            # Waiting for a free pool slot
+    connect: float = 0.0          # TCP connect (new connections only)
+    tls: float = 0.0              # TLS handshake (new connections only)
+    ttfb: float = 0.0             # Request sent -> response headers
+    read: float = 0.0             # Body read and decompression
+    decode: float = 0.0           # JSON decode / cache revalidation
+    models: float = 0.0           # Post/Comment construction
+    total: float = 0.0
+    request_bytes: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    timestamp: float = 0.0        # Epoch time the attempt started
+
+
+READ_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_PAGE_SIZE = 25  # Items per page requested by the iter_* methods
+
+DEFAULT_BASE_URL = "https://www.moltbook.com"  # Overridden by MOLTBOOK_BASE_URL
+
+# Methods the pool resends when a reused connection fails after the
+# request was written (a POST may already have been applied)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+def iter_body(response: http.client.HTTPResponse,
+              wire_bytes: Optional[List[int]] = None) -> Iterator[bytes]:
+    """
+    Yield a response body in chunks, decoding gzip/deflate on the fly.
+
+    Compressed data is decompressed chunk by chunk as it comes off the
+    socket, so neither the full compressed nor the full decompressed body
+    has to be held at once.
+
+    Args:
+        response: Response whose body has not been read yet
+        wire_bytes: Optional one-item list; body bytes received on the
+            wire are added to wire_bytes[0]
+
+    Raises:
+        http.client.HTTPException: On a corrupt compressed body
+    """
+    if wire_bytes is None:
+        wire_bytes = [0]
+
+    encoding = (response.getheader('Content-Encoding') or '').strip().lower()
+    if encoding not in ('gzip', 'x-gzip', 'deflate'):
+        while True:
+            chunk = response.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            wire_bytes[0] += len(chunk)
+            yield chunk
+
+    # 32 + MAX_WBITS auto-detects gzip and zlib headers; some servers send
+    # raw deflate, which is retried with negative wbits.
+    decoder = zlib.decompressobj(32 + zlib.MAX_WBITS)
+    first = True
+    try:
+        while True:
+            chunk = response.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            wire_bytes[0] += len(chunk)
+            try:
+                decoded = decoder.decompress(chunk, READ_CHUNK_SIZE)
+            except zlib.error:
+                if not (first and encoding == 'deflate'):
+                    raise
+                decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+                decoded = decoder.decompress(chunk, READ_CHUNK_SIZE)
+            first = False
+            # Cap each yielded chunk: highly compressible bodies would
+            # otherwise inflate one wire chunk into megabytes
+            while True:
+                if decoded:
+                    yield decoded
+                if not decoder.unconsumed_tail:
+                    break
+                decoded = decoder.decompress(decoder.unconsumed_tail, READ_CHUNK_SIZE)
+        tail = decoder.flush()
+    except zlib.error as e:
+        raise http.client.HTTPException(f"Invalid {encoding} response body: {e}") from e
+    if tail:
+        yield tail
+
+
+def read_body(response: http.client.HTTPResponse) -> Tuple[bytes, int]:
+    """
+    Read a whole response body, decoding gzip/deflate Content-Encoding.
+
+    Returns:
+        Tuple of (decoded body, body bytes received on the wire)
+
+    Raises:
+        http.client.HTTPException: On a corrupt compressed body
+    """
+    encoding = (response.getheader('Content-Encoding') or '').strip().lower()
+    if encoding not in ('gzip', 'x-gzip', 'deflate'):
+        data = response.read()
+        return data, len(data)
+
+    wire_bytes = [0]
+    data = b''.join(iter_body(response, wire_bytes))
+    return data, wire_bytes[0]
+
+
+class _JSONStream:
+    """
+    Text buffer over a stream of UTF-8 chunks, consumed from the front.
+
+    Always uses the stdlib decoder: raw_decode (parse one value at an
+    offset) has no orjson/ujson equivalent.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def _grow(self):
+        """Read until the unconsumed text has doubled (or the stream ends)"""
+        self.text = self.text[self.pos:]
+        self.pos = 0
+        target = max(2 * len(self.text), 1)
+        while len(self.text) < target and not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.text += self._utf8.decode(b'', final=True)
+                self.eof = True
+            else:
+                self.text += self._utf8.decode(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of stream)"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.text) or self.eof:
+                return self.text[self.pos:self.pos + 1]
+            self._grow()
+
+    def take(self, expected: str) -> str:
+        """Consume the next non-whitespace character, which must be in `expected`"""
+        char = self.peek()
+        if not char or char not in expected:
+            raise MoltbookAPIError(f"Invalid JSON response: expected one of {expected!r}, "
+                                   f"got {char or 'end of body'!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise MoltbookAPIError(f"Invalid JSON response: {e}") from e
+                self._grow()
+                continue
+            # A number cut at the buffer end parses "successfully": read on
+            if end == len(self.text) and not self.eof:
+                self._grow()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_members(chunks: Iterable[bytes],
+                      stream_keys: Iterable[str] = ()) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally decode a top-level JSON object from byte chunks.
+
+    Yields (key, value) per member in document order. Members named in
+    `stream_keys` whose value is an array yield (key, element) once per
+    element instead, as soon as that element has arrived, so memory is
+    bounded by the chunk size plus the largest single element.
+
+    Raises:
+        MoltbookAPIError: On invalid JSON
+    """
+    stream_keys = set(stream_keys)
+    buf = _JSONStream(chunks)
+
+    buf.take('{')
+    if buf.peek() == '}':
+        buf.take('}')
+        return
+
+    while True:
+        key = buf.value()
+        if not isinstance(key, str):
+            raise MoltbookAPIError(f"Invalid JSON response: object key {key!r}")
+        buf.take(':')
+
+        if key in stream_keys and buf.peek() == '[':
+            buf.take('[')
+            if buf.peek() == ']':
+                buf.take(']')
+            else:
+                while True:
+                    yield key, buf.value()
+                    if buf.take(',]') == ']':
+                        break
+        else:
+            yield key, buf.value()
+
+        if buf.take(',}') == '}':
+            return
+
+
+class _Refused(Exception):
+    """A rate limiter refused an attempt (kept out of RetryPolicy)"""
+
+    def __init__(self, error: BaseException):
+        super().__init__(str(error))
+        self.error = error
+
+
+class _SendFailed(Exception):
+    """The connection failed while the request was being written"""
+
+    def __init__(self, error: BaseException):
+        super().__init__(str(error))
+        self.error = error
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP(S) connections, keyed by host.
+
+    Connections are kept open (HTTP/1.1 keep-alive) and reused, so only the
+    first request to a host pays the TCP and TLS handshakes. At most
+    `maxsize` connections are open per host; extra callers wait for a free
+    slot. Connections idle for longer than `idle_timeout` seconds are
+    closed instead of reused.
+    """
+
+    offline = False  # Transports answering without the API (cassette replay) set this
+
+    def __init__(self, maxsize: int = 4, idle_timeout: float = 60.0):
+        """
+        Initialize the pool.
+
+        Args:
+            maxsize: Maximum open connections per host
+            idle_timeout: Seconds a connection may sit idle before eviction
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._slots: Dict[Tuple[str, str, int], threading.BoundedSemaphore] = {}
+        self.stats = {
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'connections_evicted': 0
+        }
+
+    def _slot(self, key: Tuple[str, str, int]) -> threading.BoundedSemaphore:
+        """Get the per-host semaphore bounding open connections"""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.maxsize)
+            return slot
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection for `key`, or open a new one"""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    self.stats['connections_reused'] += 1
+                    return conn, True
+                conn.close()
+                self.stats['connections_evicted'] += 1
+            self.stats['connections_opened'] += 1
+
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return conn_class(host, port), False
+
+    @staticmethod
+    def _connect(conn: http.client.HTTPConnection, trace: Dict[str, Any]):
+        """Open a new connection, timing the TCP connect and TLS handshake apart"""
+        # http.client opens its socket through the _create_connection hook;
+        # timing it separates the TCP connect from the TLS wrap that follows
+        create = conn._create_connection
+        tcp = []
+
+        def timed_create(*args, **kwargs):
+            start = time.perf_counter()
+            sock = create(*args, **kwargs)
+            tcp.append(time.perf_counter() - start)
+            return sock
+
+        conn._create_connection = timed_create
+        start = time.perf_counter()
+        try:
+            conn.connect()
+        finally:
+            conn._create_connection = create
+            total = time.perf_counter() - start
+            trace['connect'] = tcp[0] if tcp else total
+            trace['tls'] = total - trace['connect'] if isinstance(conn, http.client.HTTPSConnection) else 0.0
+
+    def _checkin(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        """Return a healthy connection to the idle list"""
+        with self._lock:
+            self._idle.setdefault(key, []).append((conn, time.monotonic()))
+
+    def evict_idle(self) -> int:
+        """
+        Close every connection idle for longer than `idle_timeout`.
+
+        Returns:
+            Number of connections closed
+        """
+        now = time.monotonic()
+        evicted = 0
+        with self._lock:
+            for key, idle in self._idle.items():
+                fresh = []
+                for conn, last_used in idle:
+                    if now - last_used <= self.idle_timeout:
+                        fresh.append((conn, last_used))
+                    else:
+                        conn.close()
+                        evicted += 1
+                self._idle[key] = fresh
+            self.stats['connections_evicted'] += evicted
+        return evicted
+
+    def request(self, method: str, url: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                connect_timeout: Optional[float] = None,
+                read_timeout: Optional[float] = None,
+                trace: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        Send a request over a pooled connection.
+
+        A reused connection that the server already closed is retried on a
+        fresh connection if the request cannot have been applied: writing
+        it failed, or the method is in IDEMPOTENT_METHODS. Otherwise the
+        error is raised and RetryPolicy decides.
+
+        Args:
+            method: HTTP method
+            url: Absolute http:// or https:// URL
+            body: Optional request body
+            headers: Optional request headers
+            connect_timeout: Seconds to wait for a pool slot and for the
+                TCP/TLS connect (None = no limit)
+            read_timeout: Seconds each socket read may block (None = no limit)
+            trace: Optional dict filled with phase timings in seconds
+                ('queue', 'connect', 'tls', 'ttfb', 'read') and 'reused'
+
+        Returns:
+            HTTPResponse with the full body read
+
+        Raises:
+            TimeoutError: On connect/read timeouts
+            OSError, http.client.HTTPException: On connection failures
+        """
+        key, path = self._route(url)
+        if trace is None:
+            trace = {}
+
+        slot = self._acquire(key, connect_timeout, trace)
+        try:
+            while True:
+                conn, reused = self._checkout(key)
+                trace['reused'] = reused
+                try:
+                    response = self._start(conn, method, path, body, headers,
+                                           connect_timeout, read_timeout, trace)
+                    first_byte = time.perf_counter()
+                    data, wire_bytes = read_body(response)
+                    trace['read'] = time.perf_counter() - first_byte
+                except _SendFailed as e:
+                    conn.close()
+                    if reused:
+                        continue  # Stale keep-alive connection, nothing was sent
+                    raise e.error from None
+                except (ConnectionError, http.client.BadStatusLine):
+                    conn.close()
+                    if reused and method in IDEMPOTENT_METHODS:
+                        continue  # Stale keep-alive connection, safe to resend
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+
+                return HTTPResponse(
+                    status=response.status,
+                    headers={k.lower(): v for k, v in response.getheaders()},
+                    body=data,
+                    wire_bytes=wire_bytes
+                )
+        finally:
+            slot.release()
+
+    @contextlib.contextmanager
+    def stream(self, method: str, url: str, body: Optional[bytes] = None,
+               headers: Optional[Dict[str, str]] = None,
+               connect_timeout: Optional[float] = None,
+               read_timeout: Optional[float] = None,
+               trace: Optional[Dict[str, Any]] = None) -> Iterator[http.client.HTTPResponse]:
+        """
+        Like request(), but yield the response with its body still unread.
+
+        Read it with iter_body(). The pool slot is held until the block
+        exits; the connection is reused only if the body was read to the
+        end, otherwise it is closed.
+
+        Yields:
+            http.client.HTTPResponse (headers read, body pending)
+        """
+        key, path = self._route(url)
+        if trace is None:
+            trace = {}
+
+        slot = self._acquire(key, connect_timeout, trace)
+        try:
+            while True:
+                conn, reused = self._checkout(key)
+                trace['reused'] = reused
+                try:
+                    response = self._start(conn, method, path, body, headers,
+                                           connect_timeout, read_timeout, trace)
+                    break
+                except _SendFailed as e:
+                    conn.close()
+                    if reused:
+                        continue  # Stale keep-alive connection, nothing was sent
+                    raise e.error from None
+                except (ConnectionError, http.client.BadStatusLine):
+                    conn.close()
+                    if reused and method in IDEMPOTENT_METHODS:
+                        continue  # Stale keep-alive connection, safe to resend
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+
+            try:
+                yield response
+            except BaseException:
+                conn.close()
+                raise
+
+            if response.isclosed() and not response.will_close:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+        finally:
+            slot.release()
+
+    @staticmethod
+    def _route(url: str) -> Tuple[Tuple[str, str, int], str]:
+        """Split a URL into its pool key and request path"""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        return (scheme, parts.hostname or '', port), path
+
+    def _acquire(self, key: Tuple[str, str, int], connect_timeout: Optional[float],
+                 trace: Dict[str, Any]) -> threading.BoundedSemaphore:
+        """Wait for a free per-host slot (caller releases it)"""
+        slot = self._slot(key)
+        queued = time.perf_counter()
+        acquired = slot.acquire(timeout=connect_timeout)
+        trace['queue'] = time.perf_counter() - queued
+        if not acquired:
+            raise TimeoutError(f"Timed out waiting for a connection to {key[1]}")
+        return slot
+
+    def _start(self, conn: http.client.HTTPConnection, method: str, path: str,
+               body: Optional[bytes], headers: Optional[Dict[str, str]],
+               connect_timeout: Optional[float], read_timeout: Optional[float],
+               trace: Dict[str, Any]) -> http.client.HTTPResponse:
+        """
+        Connect if needed, send the request and read the response headers.
+
+        Raises:
+            _SendFailed: If the connection broke while the request was written
+        """
+        if conn.sock is None:
+            conn.timeout = connect_timeout
+            self._connect(conn, trace)
+        conn.sock.settimeout(read_timeout)
+        sent = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+        except ConnectionError as e:
+            raise _SendFailed(e)
+        response = conn.getresponse()
+        trace['ttfb'] = time.perf_counter() - sent
+        return response
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle.clear()
+
+
+_default_pool: Optional[Any] = None
+
+
+def set_default_pool(pool: Optional[Any]) -> Optional[Any]:
+    """
+    Make `pool` the transport of every MoltbookClient created without one.
+
+    Lets a tool swap the transport of all its clients at once, e.g. for a
+    moltbook_cassette.Cassette. None goes back to a ConnectionPool per
+    client.
+
+    Returns:
+        The previous default
+    """
+    global _default_pool
+    previous, _default_pool = _default_pool, pool
+    return previous
+
+
+class _Flight:
+    """One in-flight or recently completed call tracked by SingleFlight"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.finished_at = 0.0
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical calls into one execution.
+
+    Callers asking for a key that is already in flight wait for that call
+    and get the same result. A successful result is also shared with
+    callers arriving within `window` seconds after it completed. Errors
+    are never shared past the callers already waiting on them.
+
+    Shared results are the same object for every caller: treat them as
+    read-only.
+    """
+
+    def __init__(self, window: float = 2.0):
+        """
+        Args:
+            window: Seconds a completed result is reused (0 = in-flight only)
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.stats = {
+            'executed': 0,
+            'deduplicated': 0
+        }
+
+    def _expired(self, flight: _Flight, now: float) -> bool:
+        return flight.done.is_set() and now - flight.finished_at > self.window
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` for `key`, or join an in-flight/recent call for the same key.
+
+        Returns:
+            Result of `fn` (possibly shared with other callers)
+        """
+        now = time.monotonic()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and not self._expired(flight, now):
+                self.stats['deduplicated'] += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.stats['executed'] += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            flight.finished_at = time.monotonic()
+            with self._lock:
+                if flight.error is not None or self.window <= 0:
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+                self._prune(flight.finished_at)
+            flight.done.set()
+
+        return flight.result
+
+    def _prune(self, now: float):
+        """Drop expired entries (caller holds the lock)"""
+        for key in [k for k, f in self._flights.items() if self._expired(f, now)]:
+            del self._flights[key]
+
+    def forget(self, prefix: str = ''):
+        """
+        Stop sharing results whose key starts with `prefix`.
+
+        Calls still in flight keep their current waiters, but later callers
+        start a fresh call instead of joining one that began before a write.
+        """
+        with self._lock:
+            for key in [k for k in self._flights if k.startswith(prefix)]:
+                del self._flights[key]
+
+
+# Cache TTLs (seconds) per endpoint family, first match wins.
+# Endpoints matching no rule are never cached.
+DEFAULT_CACHE_TTLS = [
+    (r'^/agents/profile\?', 60),
+    (r'^/submolts/[^/?]+\?sort=hot\b', 30),
+    (r'^/agents/[^/?]+/discover\b', 600),
+]
+
+# Reads made stale by each write, first match wins. Write patterns match
+# "METHOD endpoint". Targets are read-endpoint prefixes filled from the
+# pattern's named groups, the write's JSON body and {me} (the client's
+# agent_name); a target whose value is unknown is cut at the placeholder,
+# so it drops more rather than nothing. "ref:" targets drop every cached
+# response containing that post or comment (listings, profiles, trees).
+DEFAULT_INVALIDATIONS = [
+    (r'^POST /posts$', ['/submolts/{submolt_name}?', '/agents/profile?name={me}', '/agents/me']),
+    (r'^POST /comments$', ['/posts/{post_id}/comments', 'ref:{post_id}',
+                           '/agents/profile?name={me}', '/agents/me']),
+    (r'^POST /posts/(?P<post_id>[^/]+)/(up|down)vote$', ['ref:{post_id}']),
+    (r'^POST /comments/(?P<comment_id>[^/]+)/upvote$', ['ref:{comment_id}']),
+    (r'^(POST|DELETE) /agents/(?P<name>[^/]+)/follow$', [
+        '/agents/profile?name={name}', '/agents/profile?name={me}', '/agents/me',
+        '/agents/{me}/feed'
+    ]),
+]
+
+
+def _fill_target(template: str, values: Dict[str, str]) -> str:
+    """Fill {field} placeholders; stop at the first field without a value"""
+    parts = re.split(r'\{(\w+)\}', template)
+    filled = parts[0]
+    for field, literal in zip(parts[1::2], parts[2::2]):
+        if not values.get(field):
+            break
+        filled += values[field] + literal
+    return filled
+
+
+def _collect_ids(value: Any, ids: Set[str]):
+    """Add the 'id' of every object nested in a JSON value to `ids`"""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            item_id = item.get('id')
+            if isinstance(item_id, str):
+                ids.add(item_id)
+            stack.extend(v for v in item.values() if isinstance(v, (dict, list)))
+        elif isinstance(item, list):
+            stack.extend(v for v in item if isinstance(v, (dict, list)))
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory TTL + LRU cache for GET responses.
+
+    Keys are endpoint paths (including the query string). Each endpoint
+    family gets its own TTL from `ttls`; the least recently used entry is
+    evicted once `maxsize` entries are stored. Cached values are shared
+    between callers: treat them as read-only.
+
+    Every stored response is indexed by the ids of the objects it contains,
+    so a write to one post or comment can drop exactly the listings and
+    profiles that show it (invalidate_refs). Each invalidation bumps
+    `generation`; a response fetched before it is not stored afterwards.
+    """
+
+    def __init__(self, maxsize: int = 512, ttls: Optional[List[Tuple[str, float]]] = None):
+        """
+        Args:
+            maxsize: Maximum number of cached responses
+            ttls: List of (endpoint regex, ttl seconds), first match wins
+                (default: DEFAULT_CACHE_TTLS)
+        """
+        self.maxsize = maxsize
+        self._ttls: List[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_CACHE_TTLS)
+        ]
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[float, Any, Set[str]]]' = OrderedDict()
+        self._refs: Dict[str, Set[str]] = {}
+        self.generation = 0
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """TTL for an endpoint, or None if it should not be cached"""
+        for pattern, ttl in self._ttls:
+            if pattern.search(endpoint):
+                return ttl
+        return None
+
+    def _drop(self, endpoint: str):
+        """Remove an entry and its id references (caller holds the lock)"""
+        _, _, ids = self._entries.pop(endpoint)
+        for ref in ids:
+            endpoints = self._refs.get(ref)
+            if endpoints is not None:
+                endpoints.discard(endpoint)
+                if not endpoints:
+                    del self._refs[ref]
+
+    def get(self, endpoint: str) -> Optional[Any]:
+        """Return the cached response, or None on miss/expiry"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+
+            expires_at, value, _ = entry
+            if now >= expires_at:
+                self._drop(endpoint)
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            self._entries.move_to_end(endpoint)
+            self.stats['hits'] += 1
+            return value
+
+    def set(self, endpoint: str, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        Store a response if its endpoint family is cacheable.
+
+        Args:
+            endpoint: Endpoint path the response was fetched from
+            value: Decoded response
+            generation: `generation` read before the fetch started; the
+                response is dropped if an invalidation happened since
+
+        Returns:
+            True if stored
+        """
+        ttl = self.ttl_for(endpoint)
+        if not ttl:
+            return False
+
+        ids: Set[str] = set()
+        _collect_ids(value, ids)
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            if endpoint in self._entries:
+                self._drop(endpoint)
+            self._entries[endpoint] = (time.monotonic() + ttl, value, ids)
+            for ref in ids:
+                self._refs.setdefault(ref, set()).add(endpoint)
+            while len(self._entries) > self.maxsize:
+                self._drop(next(iter(self._entries)))
+                self.stats['evictions'] += 1
+        return True
+
+    def invalidate(self, prefix: str = '') -> int:
+        """
+        Drop every entry whose endpoint starts with `prefix`.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self.generation += 1
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                self._drop(key)
+            self.stats['invalidations'] += len(keys)
+        return len(keys)
+
+    def invalidate_refs(self, ref: str) -> int:
+        """
+        Drop every entry whose response contains an object with id `ref`.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self.generation += 1
+            keys = list(self._refs.get(ref, ()))
+            for key in keys:
+                self._drop(key)
+            self.stats['invalidations'] += len(keys)
+        return len(keys)
+
+    def clear(self):
+        """Drop all entries"""
+        self.invalidate('')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """
+    Retry failed requests with exponential backoff and decorrelated jitter.
+
+    - 429 is always retried (the server did not process the request), and
+      Retry-After is honored; a wait longer than `max_delay` gives up.
+    - 5xx and connection errors are retried only for idempotent requests
+      (GETs, or writes the caller marks idempotent). Votes toggle, so they
+      are not idempotent.
+    - A retry budget caps retries at roughly `budget_ratio` of requests
+      (plus a small reserve), so an outage cannot turn into a retry storm.
+
+    One policy is meant per client; sharing it shares the budget.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.5,
+                 max_delay: float = 30.0, budget_ratio: float = 0.1,
+                 budget_reserve: float = 5.0, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            max_retries: Maximum retries per request (0 disables retries)
+            base_delay: Minimum backoff in seconds
+            max_delay: Backoff cap, and the longest Retry-After honored
+            budget_ratio: Retry tokens earned per request
+            budget_reserve: Initial and maximum retry tokens
+            sleep: Sleep function (replaceable in tests)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.sleep = sleep
+        self._tokens = budget_reserve
+        self._lock = threading.Lock()
+        self.stats = {
+            'retries': 0,
+            'backoff_seconds': 0.0,
+            'budget_exhausted': 0,
+            'gave_up': 0
+        }
+
+    def record_request(self):
+        """Earn retry budget for one first-attempt request"""
+        with self._lock:
+            self._tokens = min(self.budget_reserve, self._tokens + self.budget_ratio)
+
+    def is_retryable(self, error: MoltbookAPIError, idempotent: bool) -> bool:
+        """Whether an error may be retried for this request"""
+        if error.status == 429:
+            return True
+        if not idempotent:
+            return False
+        return error.status is None or error.status in self.RETRY_STATUSES
+
+    def next_delay(self, previous: float, error: MoltbookAPIError) -> float:
+        """Backoff before the next attempt (decorrelated jitter or Retry-After)"""
+        if error.retry_after is not None:
+            return error.retry_after
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def run(self, attempt: Callable[[], Any], idempotent: bool) -> Any:
+        """
+        Call `attempt` until it succeeds or retrying is no longer allowed.
+
+        Raises:
+            MoltbookAPIError: The last error when giving up
+        """
+        self.record_request()
+        delay = self.base_delay
+        retries = 0
+
+        while True:
+            try:
+                return attempt()
+            except MoltbookAPIError as e:
+                if retries >= self.max_retries or not self.is_retryable(e, idempotent):
+                    raise
+
+                delay = self.next_delay(delay, e)
+                remaining = remaining_time()
+                with self._lock:
+                    if delay > self.max_delay or (remaining is not None and delay >= remaining):
+                        self.stats['gave_up'] += 1
+                        raise
+                    if self._tokens < 1:
+                        self.stats['budget_exhausted'] += 1
+                        raise
+                    self._tokens -= 1
+                    self.stats['retries'] += 1
+                    self.stats['backoff_seconds'] += delay
+
+                retries += 1
+                self.sleep(delay)
+
+
+@dataclass
+class ProfileResult:
+    """Outcome of one profile fetch in MoltbookClient.get_profiles"""
+    name: str
+    profile: Optional[Dict[str, Any]] = None
+    error: Optional[MoltbookAPIError] = None
+    elapsed: float = 0.0  # Seconds spent on this fetch
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class CommentTreeResult:
+    """Outcome of one comment fetch in MoltbookClient.get_comment_trees"""
+    post_id: str
+    tree: Optional[CommentTree] = None
+    error: Optional[MoltbookAPIError] = None
+    elapsed: float = 0.0  # Seconds spent on this fetch
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class MoltbookClient:
     """
     Client for Moltbook undocumented API endpoints.
 
-    Uses only Python stdlib (no external dependencies).
+    Uses only Python stdlib (no external dependencies). Requests go through
+    a keep-alive ConnectionPool that can be shared between clients and
+    threads.
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://www.moltbook.com"):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 pool: Optional[ConnectionPool] = None, pool_size: int = 4,
+                 idle_timeout: float = 60.0, coalesce_window: Optional[float] = 2.0,
+                 cache: Optional[ResponseCache] = None, disk_cache: Optional[Any] = None,
+                 compression: bool = True, retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[Any] = None, rate_limit_wait: Optional[float] = 60.0,
+                 connect_timeout: Optional[float] = 10.0, read_timeout: Optional[float] = 30.0,
+                 observers: Optional[List[Callable[[RequestTiming], None]]] = None,
+                 agent_name: Optional[str] = None,
+                 invalidations: Optional[List[Tuple[str, List[str]]]] = None,
+                 listeners: Optional[List[Callable[[str, Any], None]]] = None):
         """
         Initialize the Moltbook client.
 
         Args:
             api_key: Optional API key (Bearer token)
-            base_url: API base URL (default: https://www.moltbook.com)
+            base_url: API base URL (default: $MOLTBOOK_BASE_URL, else
+                https://www.moltbook.com)
+            pool: Optional shared ConnectionPool (default: the one passed to
+                set_default_pool(), else a new one)
+            pool_size: Max connections per host for the created pool
+            idle_timeout: Idle eviction timeout in seconds for the created pool
+            coalesce_window: Seconds identical GETs share one result
+                (0 = only concurrent calls, None = no coalescing)
+            cache: Optional ResponseCache for GET responses (off by default)
+            disk_cache: Optional moltbook_cache.DiskCache for persistent,
+                revalidated GET responses (off by default)
+            compression: Negotiate gzip/deflate response bodies
+            retry_policy: Retry/backoff policy (default: RetryPolicy();
+                pass RetryPolicy(max_retries=0) to disable)
+            rate_limiter: Optional moltbook_ratelimit.RateLimiter shared by
+                all processes; requests wait for tokens before being sent
+                (not while the pool is offline, e.g. replaying a cassette)
+            rate_limit_wait: Longest wait for tokens before raising
+                RateLimitExceeded (0 = refuse immediately, None = no limit)
+            connect_timeout: Seconds allowed for a pool slot + connect
+            read_timeout: Seconds each socket read may block
+            observers: Callables receiving a RequestTiming per HTTP attempt
+                (e.g. moltbook_metrics.LatencyAggregator)
+            agent_name: Name of the agent the API key belongs to, so writes
+                can drop its cached profile (if unset, every cached profile)
+            invalidations: List of (write regex, read-endpoint targets) run
+                after each write (default: DEFAULT_INVALIDATIONS)
+            listeners: Callables receiving (endpoint, response) for every GET
+                response fetched from the API (e.g. moltbook_store.MoltbookStore)
         """
         self.api_key = api_key
-        self.base_url = base_url
-        self.api_base = f"{base_url}/api/v1"
-
-    def _request(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None) -> Dict[str, Any]:
+        base_url = base_url or os.environ.get('MOLTBOOK_BASE_URL') or DEFAULT_BASE_URL
+        self.base_url = base_url.rstrip('/')
+        self.api_base = f"{self.base_url}/api/v1"
+        if pool is None:
+            pool = _default_pool
+        self.pool = pool if pool is not None else ConnectionPool(maxsize=pool_size,
+                                                                 idle_timeout=idle_timeout)
+        self.single_flight = SingleFlight(coalesce_window) if coalesce_window is not None else None
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.compression = compression
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.rate_limit_wait = rate_limit_wait
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.error_stats = {
+            'timeouts': 0,
+            'deadline_exceeded': 0,
+            'connection_errors': 0,
+            'http_errors': 0
+        }
+        self.transfer_stats = {
+            'requests': 0,
+            'wire_bytes': 0,
+            'decoded_bytes': 0
+        }
+        self.recent_transfers = deque(maxlen=100)
+        self.observers: List[Callable[[RequestTiming], None]] = list(observers or [])
+        self.listeners: List[Callable[[str, Any], None]] = list(listeners or [])
+        self.agent_name = agent_name
+        self.invalidations: List[Tuple[Pattern, List[str]]] = [
+            (re.compile(pattern), targets)
+            for pattern, targets in (DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        ]
+        self._stats_lock = threading.Lock()
+
+    def close(self):
+        """Close pooled connections"""
+        self.pool.close()
+
+    def add_observer(self, observer: Callable[[RequestTiming], None]):
+        """Call `observer` with a RequestTiming after every HTTP attempt"""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: Callable[[RequestTiming], None]):
+        """Stop calling `observer`"""
+        self.observers.remove(observer)
+
+    def _emit(self, timing: RequestTiming):
+        """Hand a timing to every observer; a failing observer never fails the request"""
+        for observer in list(self.observers):
+            try:
+                observer(timing)
+            except Exception:
+                pass
+
+    def add_listener(self, listener: Callable[[str, Any], None]):
+        """Call `listener` with (endpoint, response) after every GET fetched from the API"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Any], None]):
+        """Stop calling `listener`"""
+        self.listeners.remove(listener)
+
+    def _publish(self, endpoint: str, result: Any):
+        """Hand a response to every listener; a failing listener never fails the request"""
+        for listener in list(self.listeners):
+            try:
+                listener(endpoint, result)
+            except Exception:
+                pass
+
+    def __enter__(self) -> 'MoltbookClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None,
+                 idempotent: Optional[bool] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
-        Internal HTTP request method using urllib.
+        Internal HTTP request method using the connection pool.
+
+        GETs are served from the response cache when one is configured;
+        identical concurrent or back-to-back GETs are coalesced into one
+        request (see SingleFlight). Any write clears the coalesced results
+        and drops the cached reads it makes stale (see invalidations), even
+        if it failed, since the server may have applied it.
 
         Args:
             endpoint: API endpoint path
             method: HTTP method (GET or POST)
             data: Optional POST data
+            idempotent: Whether the request may be retried after 5xx or
+                connection errors (default: True for GET only)
+            timeout: Read timeout for this call (default: client read_timeout)
 
         Returns:
             JSON response as dict
 
         Raises:
+            MoltbookTimeoutError: On timeouts or an exhausted deadline
             MoltbookAPIError: On HTTP errors or invalid responses
         """
+        if method != "GET":
+            try:
+                return self._send(endpoint, method, data, idempotent=bool(idempotent),
+                                  timeout=timeout)
+            finally:
+                if self.single_flight is not None:
+                    self.single_flight.forget()
+                self.invalidate_for_write(method, endpoint, data)
+
+        if self.cache is not None:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return cached
+
+        if self.single_flight is None:
+            return self._fetch(endpoint, timeout)
+
+        return self.single_flight.do(endpoint, lambda: self._fetch(endpoint, timeout))
+
+    def _fetch(self, endpoint: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """GET an endpoint, store the response in the cache and publish it"""
+        generation = self.cache.generation if self.cache is not None else None
+        result = self._send(endpoint, timeout=timeout)
+        if self.cache is not None:
+            self.cache.set(endpoint, result, generation)
+        if self.listeners:
+            self._publish(endpoint, result)
+        return result
+
+    def invalidate(self, prefix: str = '') -> int:
+        """
+        Drop cached and coalesced GET results for endpoints starting with `prefix`.
+
+        Args:
+            prefix: Endpoint prefix, e.g. "/agents/profile?name=Foo"
+
+        Returns:
+            Number of cache entries dropped
+        """
+        if self.single_flight is not None:
+            self.single_flight.forget(prefix)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(f"{self.api_base}{prefix}")
+        return self.cache.invalidate(prefix) if self.cache is not None else 0
+
+    def invalidate_for_write(self, method: str, endpoint: str,
+                             data: Optional[Dict] = None) -> int:
+        """
+        Drop the cached reads a write makes stale, per `invalidations`.
+
+        Args:
+            method: HTTP method of the write
+            endpoint: Endpoint path of the write
+            data: JSON body of the write (fills targets like {post_id})
+
+        Returns:
+            Number of cache entries dropped
+        """
+        request = f"{method} {endpoint}"
+        for pattern, targets in self.invalidations:
+            match = pattern.search(request)
+            if match is not None:
+                break
+        else:
+            return 0
+
+        values = {key: str(value) for key, value in (data or {}).items() if value is not None}
+        values.update((key, value) for key, value in match.groupdict().items() if value)
+        if self.agent_name:
+            values['me'] = self.agent_name
+
+        dropped = 0
+        for target in targets:
+            prefix = _fill_target(target, values)
+            if prefix.startswith('ref:'):
+                ref = prefix[len('ref:'):]
+                if not ref:
+                    dropped += self.invalidate('')
+                elif self.cache is not None:
+                    dropped += self.cache.invalidate_refs(ref)
+            else:
+                dropped += self.invalidate(prefix)
+        return dropped
+
+    def _send(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None,
+              idempotent: bool = True, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a request under the client's rate limiter and retry policy.
+
+        Every attempt, retries included, takes its own limiter tokens, with
+        the wait clipped to the deadline left at that attempt. A limiter
+        refusal (RateLimitExceeded) is raised as is, not retried.
+        """
+        limited = self.rate_limiter is not None and not getattr(self.pool, 'offline', False)
+
+        def attempt() -> Dict[str, Any]:
+            if limited:
+                try:
+                    self.rate_limiter.acquire_request(
+                        method, endpoint, max_wait=_clip(self.rate_limit_wait, remaining_time())
+                    )
+                except MoltbookAPIError as e:
+                    raise _Refused(e)
+            return self._send_once(endpoint, method, data, timeout)
+
+        try:
+            return self.retry_policy.run(attempt, idempotent=idempotent)
+        except _Refused as e:
+            raise e.error from None
+
+    def _send_once(self, endpoint: str, method: str = "GET", data: Optional[Dict] = None,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send one HTTP request, reporting its timings to the observers"""
+        if not self.observers:
+            return self._exchange(endpoint, method, data, timeout, {})
+
+        trace: Dict[str, Any] = {}
+        timestamp = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            return self._exchange(endpoint, method, data, timeout, trace)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self._emit(RequestTiming(
+                method=method, endpoint=endpoint, error=error, timestamp=timestamp,
+                total=time.perf_counter() - start, **trace
+            ))
+
+    def _exchange(self, endpoint: str, method: str, data: Optional[Dict],
+                  timeout: Optional[float], trace: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one HTTP request and decode the JSON response.
+
+        Timeouts are clipped to the current deadline. With a disk cache,
+        GETs are sent as conditional requests and a 304 is answered from
+        the stored body. Phase timings and sizes are written to `trace`
+        (RequestTiming field names).
+        """
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            self._count_error('deadline_exceeded')
+            raise MoltbookTimeoutError(f"Deadline exceeded before {method} {endpoint}")
+
         url = f"{self.api_base}{endpoint}"
+        headers = self._headers()
+
+        body = None
+        if data:
+            body = _json.dumps(data)
+            trace['request_bytes'] = len(body)
+
+        cached = None
+        if method == "GET" and self.disk_cache is not None:
+            cached = self.disk_cache.lookup(url)
+            if cached is not None:
+                headers.update(cached.conditional_headers())
+
+        try:
+            response = self.pool.request(
+                method, url, body=body, headers=headers,
+                connect_timeout=_clip(self.connect_timeout, remaining),
+                read_timeout=_clip(timeout if timeout is not None else self.read_timeout, remaining),
+                trace=trace
+            )
+        except TimeoutError as e:
+            self._count_error('timeouts')
+            raise MoltbookTimeoutError(f"Timeout: {method} {endpoint}: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            self._count_error('connection_errors')
+            raise MoltbookAPIError(f"Connection error: {e}") from e
+
+        self._record_transfer(method, endpoint, response)
+        trace['status'] = response.status
+        trace['wire_bytes'] = response.wire_bytes
+        trace['decoded_bytes'] = len(response.body)
+
+        decode_start = time.perf_counter()
+        try:
+            return self._handle_response(method, url, response, cached)
+        finally:
+            trace['decode'] = time.perf_counter() - decode_start
+
+    def _handle_response(self, method: str, url: str, response: HTTPResponse,
+                         cached: Optional[Any]) -> Dict[str, Any]:
+        """Turn a response into a result: 304 replay, error, cache store or decode"""
+        if response.status == 304 and cached is not None:
+            return self.disk_cache.not_modified(cached, self._decode)
+
+        if response.status >= 400:
+            self._count_error('http_errors')
+            error_body = response.body.decode('utf-8', errors='replace')
+            raise MoltbookAPIError(
+                f"HTTP {response.status}: {error_body}",
+                status=response.status,
+                retry_after=parse_retry_after(response.headers.get('retry-after'))
+            )
+
+        if method == "GET" and self.disk_cache is not None and response.status == 200:
+            return self.disk_cache.store(url, response.headers, response.body,
+                                         self._decode, previous=cached)
+
+        return self._decode(response.body)
+
+    def _headers(self) -> Dict[str, str]:
+        """Request headers common to every call"""
         headers = {
             "Content-Type": "application/json",
             "User-Agent": "MoltbookSDK/1.0"
@@ -160,22 +1930,126 @@ class MoltbookClient:
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        body = None
-        if data:
-            body = json.dumps(data).encode('utf-8')
+        if self.compression:
+            headers["Accept-Encoding"] = "gzip, deflate"
+
+        return headers
 
-        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    def stream(self, endpoint: str, keys: Iterable[str] = ()) -> Iterator[Tuple[str, Any]]:
+        """
+        GET an endpoint and decode its JSON body while it downloads.
+
+        Yields top-level (key, value) members as they arrive; arrays under
+        `keys` yield (key, element) per element (see iter_json_members),
+        so a multi-MB response is never held whole. Rate limits, timeouts
+        and deadlines apply; caches, coalescing, retries, observers and
+        listeners do not (a partly consumed stream cannot be shared or
+        replayed).
+        Stopping early closes the connection instead of reusing it.
+
+        Args:
+            endpoint: API endpoint path
+            keys: Top-level array members to yield element by element
+
+        Raises:
+            MoltbookTimeoutError: On timeouts or an exhausted deadline
+            MoltbookAPIError: On HTTP errors or invalid JSON
+        """
+        if self.rate_limiter is not None and not getattr(self.pool, 'offline', False):
+            self.rate_limiter.acquire_request(
+                "GET", endpoint, max_wait=_clip(self.rate_limit_wait, remaining_time())
+            )
+
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            self._count_error('deadline_exceeded')
+            raise MoltbookTimeoutError(f"Deadline exceeded before GET {endpoint}")
 
+        wire_bytes = [0]
+        decoded_bytes = 0
+
+        def chunks(response: http.client.HTTPResponse) -> Iterator[bytes]:
+            nonlocal decoded_bytes
+            for chunk in iter_body(response, wire_bytes):
+                decoded_bytes += len(chunk)
+                yield chunk
+
+        try:
+            with self.pool.stream(
+                "GET", f"{self.api_base}{endpoint}", headers=self._headers(),
+                connect_timeout=_clip(self.connect_timeout, remaining),
+                read_timeout=_clip(self.read_timeout, remaining)
+            ) as response:
+                if response.status >= 400:
+                    self._count_error('http_errors')
+                    error_body, _ = read_body(response)
+                    raise MoltbookAPIError(
+                        f"HTTP {response.status}: {error_body.decode('utf-8', errors='replace')}",
+                        status=response.status,
+                        retry_after=parse_retry_after(response.getheader('Retry-After'))
+                    )
+
+                body = chunks(response)
+                try:
+                    yield from iter_json_members(body, keys)
+                    for _ in body:
+                        pass  # Drain trailing bytes so the connection can be reused
+                finally:
+                    self._record_transfer("GET", endpoint, HTTPResponse(
+                        status=response.status,
+                        headers={k.lower(): v for k, v in response.getheaders()},
+                        body=b'', wire_bytes=wire_bytes[0]
+                    ), decoded_bytes=decoded_bytes)
+        except TimeoutError as e:
+            self._count_error('timeouts')
+            raise MoltbookTimeoutError(f"Timeout: GET {endpoint}: {e}") from e
+        except (OSError, http.client.HTTPException) as e:
+            self._count_error('connection_errors')
+            raise MoltbookAPIError(f"Connection error: {e}") from e
+
+    def _count_error(self, kind: str):
+        """Count a failed request by error class"""
+        with self._stats_lock:
+            self.error_stats[kind] += 1
+
+    def _record_transfer(self, method: str, endpoint: str, response: HTTPResponse,
+                         decoded_bytes: Optional[int] = None):
+        """Track bytes on the wire vs decoded bytes for one request"""
+        if decoded_bytes is None:
+            decoded_bytes = len(response.body)
+        with self._stats_lock:
+            self.transfer_stats['requests'] += 1
+            self.transfer_stats['wire_bytes'] += response.wire_bytes
+            self.transfer_stats['decoded_bytes'] += decoded_bytes
+            self.recent_transfers.append({
+                'method': method,
+                'endpoint': endpoint,
+                'status': response.status,
+                'encoding': response.headers.get('content-encoding', 'identity'),
+                'wire_bytes': response.wire_bytes,
+                'decoded_bytes': decoded_bytes
+            })
+
+    def _build_models(self, endpoint: str, factory: Callable[[Dict[str, Any]], Any],
+                      items: List[Dict[str, Any]]) -> List[Any]:
+        """Build model objects from response dicts, timing it for the observers"""
+        if not self.observers:
+            return [factory(item) for item in items]
+
+        timestamp = time.time()
+        start = time.perf_counter()
+        models = [factory(item) for item in items]
+        elapsed = time.perf_counter() - start
+        self._emit(RequestTiming(method="GET", endpoint=endpoint, kind='models',
+                                 models=elapsed, total=elapsed, timestamp=timestamp))
+        return models
+
+    @staticmethod
+    def _decode(body: bytes) -> Dict[str, Any]:
+        """Parse a JSON response body"""
         try:
-            with urllib.request.urlopen(req) as response:
-                response_data = response.read().decode('utf-8')
-                return json.loads(response_data)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else ''
-            raise MoltbookAPIError(f"HTTP {e.code}: {error_body}") from e
-        except urllib.error.URLError as e:
-            raise MoltbookAPIError(f"Connection error: {e.reason}") from e
-        except json.JSONDecodeError as e:
+            return _json.loads(body)  # every backend takes bytes: no separate decode step
+        except ValueError as e:  # JSONDecodeError and UnicodeDecodeError of every backend
             raise MoltbookAPIError(f"Invalid JSON response: {e}") from e
 
     def get_agent_profile(self, agent_name: str) -> Dict[str, Any]:
@@ -195,6 +2069,149 @@ class MoltbookClient:
         """
         return self._request(f"/agents/profile?name={agent_name}")
 
+    def get_profile_view(self, agent_name: str) -> ProfileView:
+        """
+        Get an agent profile as a lazy ProfileView.
+
+        Post/Comment objects are only built for the entries actually used;
+        prefer this over get_agent_posts when only counts, totals or the
+        top posts are needed.
+
+        Args:
+            agent_name: Agent name
+
+        Returns:
+            ProfileView over the profile payload
+        """
+        return ProfileView(self.get_agent_profile(agent_name))
+
+    def get_profiles(self, agent_names: Iterable[str],
+                     concurrency: Optional[int] = None) -> Iterator[ProfileResult]:
+        """
+        Fetch several agent profiles in parallel, yielding them as they complete.
+
+        A failed fetch yields a ProfileResult carrying its MoltbookAPIError
+        instead of stopping the others. Requests share the client's pool,
+        cache, rate limiter and the caller's deadline(). Stopping the
+        iteration early cancels the fetches not yet started.
+
+        Args:
+            agent_names: Agent names (duplicates are fetched once)
+            concurrency: Parallel requests (default: the pool's per-host
+                connection limit; more only queue for a connection)
+
+        Yields:
+            ProfileResult per name, in completion order
+        """
+        for name, profile, error, elapsed in self._fetch_concurrently(
+                self.get_agent_profile, agent_names, concurrency):
+            yield ProfileResult(name, profile=profile, error=error, elapsed=elapsed)
+
+    def _fetch_concurrently(self, fetch: Callable[[str], Any], keys: Iterable[str],
+                            concurrency: Optional[int]) -> Iterator[Tuple[str, Any, Optional[MoltbookAPIError], float]]:
+        """
+        Run `fetch(key)` per distinct key on a thread pool, in the caller's
+        context, yielding (key, value, error, elapsed) in completion order.
+        API errors are returned, not raised.
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+
+        def run(key: str) -> Tuple[str, Any, Optional[MoltbookAPIError], float]:
+            start = time.perf_counter()
+            try:
+                value = fetch(key)
+            except MoltbookAPIError as e:
+                return key, None, e, time.perf_counter() - start
+            return key, value, None, time.perf_counter() - start
+
+        workers = min(concurrency or self.pool.maxsize, len(keys))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='moltbook-fetch')
+        try:
+            # Each task runs in a copy of the caller's context (deadline)
+            futures = [executor.submit(contextvars.copy_context().run, run, key) for key in keys]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_pages(self, path: str, key: str, params: Dict[str, Any], page_size: int,
+                    stop: Optional[Callable[[Dict[str, Any]], bool]],
+                    max_items: Optional[int], prefetch: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Walk a limit/offset listing page by page, yielding `key` items.
+
+        The next page comes from `next_cursor` or `next_offset` when the
+        response has them, else offset + items received; `has_more: false`,
+        an empty page or a short page ends the walk. With `prefetch`, page
+        N+1 is requested on a background thread (in the caller's context,
+        so deadline() applies) while page N is being consumed.
+        """
+        def fetch(offset: int, cursor: Optional[str]) -> Dict[str, Any]:
+            query = dict(params, limit=page_size, offset=offset)
+            if cursor:
+                query['cursor'] = cursor
+            return self._request(f"{path}?{urllib.parse.urlencode(query)}")
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='moltbook-pages') if prefetch else None
+        pending = None
+        yielded = 0
+        offset = 0
+        first_id = None
+        try:
+            data = fetch(0, None)
+            while True:
+                items = data.get(key) or []
+                if items and first_id is not None and items[0].get('id') == first_id:
+                    return  # Server ignored the offset and sent the same page again
+                first_id = items[0].get('id') if items else None
+
+                next_page = self._next_page(data, items, offset, page_size)
+                if max_items is not None and yielded + len(items) >= max_items:
+                    next_page = None
+                if next_page is not None and executor is not None:
+                    pending = executor.submit(contextvars.copy_context().run, fetch, *next_page)
+
+                for item in items:
+                    if (stop is not None and stop(item)) or (max_items is not None and yielded >= max_items):
+                        return
+                    yield item
+                    yielded += 1
+
+                if next_page is None:
+                    return
+                offset = next_page[0]
+                data = pending.result() if pending is not None else fetch(*next_page)
+                pending = None
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _next_page(data: Dict[str, Any], items: List[Any], offset: int,
+                   page_size: int) -> Optional[Tuple[int, Optional[str]]]:
+        """(offset, cursor) of the page after `data`, or None if it was the last"""
+        if not items or data.get('has_more') is False:
+            return None
+        if 'has_more' not in data and len(items) < page_size:
+            return None
+        next_offset = data.get('next_offset')
+        if not isinstance(next_offset, int):
+            next_offset = offset + len(items)
+        return next_offset, data.get('next_cursor')
+
+    def stream_profile(self, agent_name: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream an agent profile: ('agent', dict), then one ('recentPosts', dict)
+        per post and one ('recentComments', dict) per comment as they arrive.
+
+        Args:
+            agent_name: Agent name
+        """
+        return self.stream(f"/agents/profile?name={agent_name}",
+                           keys=('recentPosts', 'recentComments'))
+
     def get_agent_posts(self, agent_name: str) -> List[Post]:
         """
         Get all posts by an agent.
@@ -207,7 +2224,7 @@ class MoltbookClient:
         """
         profile_data = self.get_agent_profile(agent_name)
         posts_data = profile_data.get('recentPosts', [])
-        return [Post.from_dict(p) for p in posts_data]
+        return self._build_models(f"/agents/profile?name={agent_name}", Post.from_dict, posts_data)
 
     def get_agent_comments(self, agent_name: str) -> List[Comment]:
         """
@@ -221,33 +2238,42 @@ class MoltbookClient:
         """
         profile_data = self.get_agent_profile(agent_name)
         comments_data = profile_data.get('recentComments', [])
-        return [Comment.from_dict(c) for c in comments_data]
+        return self._build_models(f"/agents/profile?name={agent_name}", Comment.from_dict, comments_data)
 
-    def get_unreplied_comments(self, agent_name: str) -> List[Dict[str, Any]]:
+    def get_unreplied_comments(self, agent_name: str,
+                               concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Find comments on agent's posts that don't have a response from the agent.
+        Find comments on the agent's posts that the agent has not replied to.
 
-        This is a simple heuristic: check if the most recent comment on each post
-        is NOT by the post author.
+        The comments of every post with comments are fetched in parallel
+        (get_comment_trees); a comment counts as replied when the agent
+        wrote a direct reply to it.
 
         Args:
             agent_name: Agent name
+            concurrency: Parallel comment fetches (default: pool connection limit)
 
         Returns:
-            List of dicts with post info and comment that might need a reply
+            One dict per post with unreplied comments: 'post' (Post),
+            'comment_count', 'unreplied' (raw comment dicts) and 'reason'.
+            Posts whose comments could not be fetched get an empty
+            'unreplied' list and the error as 'reason'.
         """
-        posts = self.get_agent_posts(agent_name)
+        posts = {post.id: post for post in self.get_profile_view(agent_name).posts.where(
+            lambda p: p.get('comment_count', 0) > 0)}
         unreplied = []
 
-        for post in posts:
-            if post.comment_count > 0:
-                # Note: This is a simplified check. A full implementation would
-                # fetch all comments for each post and check for author responses.
-                unreplied.append({
-                    'post': post,
-                    'comment_count': post.comment_count,
-                    'reason': 'Has comments (needs manual check for replies)'
-                })
+        for result in self.get_comment_trees(posts, concurrency=concurrency):
+            post = posts[result.post_id]
+            if not result.ok:
+                unreplied.append({'post': post, 'comment_count': post.comment_count,
+                                  'unreplied': [], 'reason': f"Comments unavailable: {result.error}"})
+                continue
+            comments = result.tree.unreplied(agent_name)
+            if comments:
+                unreplied.append({'post': post, 'comment_count': post.comment_count,
+                                  'unreplied': comments,
+                                  'reason': f"{len(comments)} comment(s) without a reply from {agent_name}"})
 
         return unreplied
 
@@ -267,6 +2293,27 @@ class MoltbookClient:
         """
         return self._request(f"/agents/{agent_name}/feed?sort={sort}&limit={limit}")
 
+    def iter_feed(self, agent_name: str, sort: str = "new", page_size: int = DEFAULT_PAGE_SIZE,
+                  stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                  max_items: Optional[int] = None, prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over an agent's whole feed, one page at a time.
+
+        Args:
+            agent_name: Agent name
+            sort: Sort order (new, hot, top)
+            page_size: Posts per request
+            stop: Ends the iteration at the first post for which it returns
+                true (that post is not yielded), e.g. created_before(since)
+            max_items: Stop after this many posts
+            prefetch: Request the next page while the current one is consumed
+
+        Yields:
+            Raw post dicts
+        """
+        return self._iter_pages(f"/agents/{agent_name}/feed", 'posts', {'sort': sort},
+                                page_size, stop, max_items, prefetch)
+
     def get_agent_discover(self, agent_name: str) -> Dict[str, Any]:
         """
         Get analytics and recommendations for an agent.
@@ -296,6 +2343,80 @@ class MoltbookClient:
         """
         return self._request(f"/submolts/{name}?sort={sort}")
 
+    def stream_submolt(self, name: str, sort: str = "hot") -> Iterator[Tuple[str, Any]]:
+        """
+        Stream a submolt: one ('posts', dict) per post as it arrives, plus
+        the other top-level members whole.
+
+        Args:
+            name: Submolt name
+            sort: Sort order (hot, new, top, rising)
+        """
+        return self.stream(f"/submolts/{name}?sort={sort}", keys=('posts',))
+
+    def iter_submolt_posts(self, name: str, sort: str = "hot", page_size: int = DEFAULT_PAGE_SIZE,
+                           stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                           max_items: Optional[int] = None,
+                           prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all posts of a submolt, one page at a time.
+
+        Args:
+            name: Submolt name
+            sort: Sort order (hot, new, top, rising); use 'new' with
+                created_before() to stop at a date
+            page_size, stop, max_items, prefetch: As for iter_feed
+
+        Yields:
+            Raw post dicts
+        """
+        return self._iter_pages(f"/submolts/{name}", 'posts', {'sort': sort},
+                                page_size, stop, max_items, prefetch)
+
+    def iter_post_comments(self, post_id: str, sort: str = "top", page_size: int = DEFAULT_PAGE_SIZE,
+                           stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                           max_items: Optional[int] = None,
+                           prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all comments of a post, one page at a time.
+
+        Args:
+            post_id: Post UUID
+            sort: Sort order (top, new)
+            page_size, stop, max_items, prefetch: As for iter_feed
+
+        Yields:
+            Raw comment dicts
+        """
+        return self._iter_pages(f"/posts/{post_id}/comments", 'comments', {'sort': sort},
+                                page_size, stop, max_items, prefetch)
+
+    def get_comment_tree(self, post_id: str, sort: str = "top") -> CommentTree:
+        """
+        Fetch every comment of a post (all pages) as a CommentTree.
+
+        Args:
+            post_id: Post UUID
+            sort: Sort order (top, new)
+        """
+        return CommentTree(post_id, self.iter_post_comments(post_id, sort=sort, prefetch=False))
+
+    def get_comment_trees(self, post_ids: Iterable[str],
+                          concurrency: Optional[int] = None) -> Iterator[CommentTreeResult]:
+        """
+        Fetch the comments of several posts in parallel (see get_profiles).
+
+        Args:
+            post_ids: Post UUIDs (duplicates are fetched once)
+            concurrency: Parallel requests (default: pool connection limit)
+
+        Yields:
+            CommentTreeResult per post, in completion order
+        """
+        for post_id, tree, error, elapsed in self._fetch_concurrently(
+                self.get_comment_tree, post_ids, concurrency):
+            yield CommentTreeResult(post_id, tree=tree, error=error, elapsed=elapsed)
+
     def create_post(self, title: str, content: str, submolt: str = "general") -> Dict[str, Any]:
         """
         Create a new post.
@@ -342,6 +2463,14 @@ class MoltbookClient:
         """Upvote a comment"""
         return self._request(f"/comments/{comment_id}/upvote", method="POST")
 
+    def follow_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Follow an agent"""
+        return self._request(f"/agents/{agent_name}/follow", method="POST")
+
+    def unfollow_agent(self, agent_name: str) -> Dict[str, Any]:
+        """Unfollow an agent"""
+        return self._request(f"/agents/{agent_name}/follow", method="DELETE")
+
     def get_me(self) -> Dict[str, Any]:
         """
         Get your own profile (stats only).
@@ -9,10 +9,12 @@ Usage:
 """
 
 import os
-import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
 
 def main():
     print("\n" + "="*50)
@@ -59,8 +61,7 @@ def main():
         }
     }
 
-    with open(config_path, 'w') as f:
-        json.dump(config, f, indent=2)
+    moltbook_sdk.save_json(str(config_path), config)
 
     # Set permissions
     os.chmod(config_path, 0o600)
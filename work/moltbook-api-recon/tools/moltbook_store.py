@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Moltbook Store - Local SQLite mirror of agents, posts and comments
+
+MoltbookStore is a MoltbookClient listener: every profile, submolt
+listing, feed and comment page the client fetches is upserted into an
+indexed SQLite database (WAL mode, so analyzers can read while a
+fetching process writes). Analyses then run as local queries instead of
+re-downloading everything:
+
+- posts(submolt=..., since=...) uses the (submolt, created_ts) index
+- posts(author=...) / profile(name) use the (author, created_ts) index
+- comment_tree(post_id) uses the post_id index
+
+The store also answers the client's read methods used by the analyzers
+(get_agent_profile, get_profiles, get_comment_trees, iter_submolt_posts)
+with API-shaped data, so a tool can be pointed at it instead of a client.
+Rows are as complete as what was mirrored: a comment tree only holds
+the comments of pages fetched so far.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_sdk
+    import moltbook_store
+
+    store = moltbook_store.MoltbookStore()
+    client = moltbook_sdk.MoltbookClient(listeners=[store])
+    client.get_agent_profile("ClaudeCode_GLM4_7")     # mirrored
+    list(client.iter_submolt_posts("general", max_items=500))
+
+    # Later, without network
+    recent = store.posts(submolt="general", since=time.time() - 86400)
+    profile = store.get_agent_profile("ClaudeCode_GLM4_7")
+    tree = store.comment_tree(post_id)
+    print(store.counts())   # {'agents': ..., 'posts': ..., 'comments': ...}
+"""
+
+import sys
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Iterable, Iterator, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+
+
+DEFAULT_STORE_PATH = Path.home() / ".moltbook" / "store.sqlite3"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS agents (
+        name TEXT PRIMARY KEY,
+        id TEXT,
+        description TEXT,
+        karma INTEGER,
+        follower_count INTEGER,
+        following_count INTEGER,
+        created_at TEXT,
+        is_active INTEGER,
+        is_claimed INTEGER,
+        updated_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS posts (
+        id TEXT PRIMARY KEY,
+        author TEXT,
+        submolt TEXT,
+        title TEXT,
+        content TEXT,
+        upvotes INTEGER,
+        downvotes INTEGER,
+        comment_count INTEGER,
+        created_at TEXT,
+        created_ts REAL,
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS posts_submolt_created ON posts (submolt, created_ts);
+    CREATE INDEX IF NOT EXISTS posts_author_created ON posts (author, created_ts);
+    CREATE TABLE IF NOT EXISTS comments (
+        id TEXT PRIMARY KEY,
+        post_id TEXT,
+        parent_id TEXT,
+        author TEXT,
+        content TEXT,
+        upvotes INTEGER,
+        created_at TEXT,
+        created_ts REAL,
+        post_title TEXT,
+        submolt TEXT,
+        updated_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS comments_post ON comments (post_id);
+    CREATE INDEX IF NOT EXISTS comments_author_created ON comments (author, created_ts);
+    CREATE TABLE IF NOT EXISTS watermarks (
+        source TEXT PRIMARY KEY,
+        created_ts REAL,
+        last_id TEXT,
+        synced_at REAL NOT NULL,
+        refreshed_at REAL NOT NULL
+    );
+"""
+
+AGENT_COLUMNS = ('name', 'id', 'description', 'karma', 'follower_count', 'following_count',
+                 'created_at', 'is_active', 'is_claimed')
+POST_COLUMNS = ('id', 'author', 'submolt', 'title', 'content', 'upvotes', 'downvotes',
+                'comment_count', 'created_at', 'created_ts')
+COMMENT_COLUMNS = ('id', 'post_id', 'parent_id', 'author', 'content', 'upvotes',
+                   'created_at', 'created_ts', 'post_title', 'submolt')
+
+# Listing order per API sort name
+POST_ORDER = {
+    'new': 'created_ts DESC',
+    'top': 'upvotes DESC',
+    'hot': 'upvotes - downvotes DESC, created_ts DESC',
+    # Votes + comments per squared age in hours, as the API's rising
+    'rising': "(upvotes + comment_count) / ((MAX(0, CAST(strftime('%s', 'now') AS REAL)"
+              " - COALESCE(created_ts, 0)) / 3600.0 + 2)"
+              " * (MAX(0, CAST(strftime('%s', 'now') AS REAL)"
+              " - COALESCE(created_ts, 0)) / 3600.0 + 2)) DESC, created_ts DESC",
+}
+
+
+@dataclass
+class Watermark:
+    """Newest item synced from one source, e.g. 'submolt:general'"""
+    source: str
+    created_ts: Optional[float]   # created_at of the newest item (epoch seconds)
+    last_id: Optional[str]        # id of the newest item
+    synced_at: float              # Last sync of the source
+    refreshed_at: float           # Last sync that also refreshed hot posts
+
+
+def _upsert_sql(table: str, columns: Tuple[str, ...], key: str) -> str:
+    """INSERT ... ON CONFLICT that keeps stored values where the new row has NULLs"""
+    updates = ', '.join(f"{c} = COALESCE(excluded.{c}, {table}.{c})" for c in columns if c != key)
+    return (f"INSERT INTO {table} ({', '.join(columns)}, updated_at) "
+            f"VALUES ({', '.join('?' * (len(columns) + 1))}) "
+            f"ON CONFLICT({key}) DO UPDATE SET {updates}, updated_at = excluded.updated_at")
+
+
+def _name(value: Any) -> Optional[str]:
+    """Name of a nested {'name': ...} object (author, submolt)"""
+    return value.get('name') if isinstance(value, dict) else None
+
+
+def _created(data: Dict[str, Any]) -> Tuple[Optional[str], Optional[float]]:
+    """created_at string and epoch seconds (None if missing/malformed)"""
+    created_at = data.get('created_at')
+    return created_at, moltbook_sdk.parse_timestamp(created_at) or None
+
+
+class MoltbookStore:
+    """
+    Thread-safe SQLite mirror fed by MoltbookClient listeners.
+
+    Upserts never erase: a field missing from a response keeps its stored
+    value, so a post seen first in a profile and later in a listing
+    without content keeps its content.
+    """
+
+    # Endpoint path -> ingest method name
+    ROUTES = [
+        (re.compile(r'^/agents/profile$'), '_ingest_profile'),
+        (re.compile(r'^/agents/me$'), '_ingest_me'),
+        (re.compile(r'^/agents/(?P<name>[^/]+)/feed$'), '_ingest_listing'),
+        (re.compile(r'^/submolts/(?P<submolt>[^/]+)$'), '_ingest_listing'),
+        (re.compile(r'^/posts/(?P<post_id>[^/]+)/comments$'), '_ingest_comments'),
+    ]
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file (default: ~/.moltbook/store.sqlite3)
+        """
+        if path is None:
+            DEFAULT_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            path = str(DEFAULT_STORE_PATH)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+        self._upsert_agent = _upsert_sql('agents', AGENT_COLUMNS, 'name')
+        self._upsert_post = _upsert_sql('posts', POST_COLUMNS, 'id')
+        self._upsert_comment = _upsert_sql('comments', COMMENT_COLUMNS, 'id')
+        self.stats = {
+            'responses': 0,
+            'agents': 0,
+            'posts': 0,
+            'comments': 0
+        }
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> 'MoltbookStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -- Ingest ------------------------------------------------------------
+
+    def __call__(self, endpoint: str, response: Any):
+        self.ingest(endpoint, response)
+
+    def ingest(self, endpoint: str, response: Any) -> int:
+        """
+        Upsert the agents, posts and comments of one GET response.
+
+        Args:
+            endpoint: Endpoint path with query, e.g. "/agents/profile?name=Foo"
+            response: Decoded response
+
+        Returns:
+            Rows upserted (0 for endpoints that are not mirrored)
+        """
+        if not isinstance(response, dict):
+            return 0
+        split = urllib.parse.urlsplit(endpoint)
+        for pattern, method in self.ROUTES:
+            match = pattern.match(split.path)
+            if match is not None:
+                query = dict(urllib.parse.parse_qsl(split.query))
+                rows = getattr(self, method)(response, query=query, **match.groupdict())
+                with self._lock:
+                    self.stats['responses'] += 1
+                return rows
+        return 0
+
+    def _ingest_profile(self, response: Dict[str, Any], query: Dict[str, str]) -> int:
+        agent = response.get('agent') or {}
+        name = agent.get('name') or query.get('name')
+        if not name:
+            return 0
+        return self.upsert(
+            agents=[dict(agent, name=name)],
+            posts=response.get('recentPosts') or (),
+            comments=response.get('recentComments') or (),
+            author=name
+        )
+
+    def _ingest_me(self, response: Dict[str, Any], query: Dict[str, str]) -> int:
+        agent = response.get('agent')
+        return self.upsert(agents=[agent]) if isinstance(agent, dict) and agent.get('name') else 0
+
+    def _ingest_listing(self, response: Dict[str, Any], query: Dict[str, str],
+                        name: Optional[str] = None, submolt: Optional[str] = None) -> int:
+        posts = response.get('posts') or ()
+        if submolt is None:
+            return self.upsert(posts=posts)
+        return self.upsert(posts=[p if _name(p.get('submolt')) else dict(p, submolt={'name': submolt})
+                                  for p in posts])
+
+    def _ingest_comments(self, response: Dict[str, Any], query: Dict[str, str],
+                         post_id: str) -> int:
+        return self.upsert(comments=response.get('comments') or (), post_id=post_id)
+
+    def upsert(self, agents: Iterable[Dict[str, Any]] = (), posts: Iterable[Dict[str, Any]] = (),
+               comments: Iterable[Dict[str, Any]] = (), author: Optional[str] = None,
+               post_id: Optional[str] = None) -> int:
+        """
+        Upsert raw API dicts in one transaction.
+
+        Args:
+            agents: Agent dicts (need 'name')
+            posts: Post dicts; `author` fills posts without an author
+            comments: Comment dicts, flat (parent_id) or nested (replies);
+                `author` fills comments without an author
+            author: Author of posts/comments that do not name one
+                (a profile's recentPosts/recentComments)
+            post_id: Post of the comments (a /posts/{id}/comments page)
+
+        Returns:
+            Rows upserted (author stubs not counted)
+        """
+        now = time.time()
+        agent_rows = [self._agent_row(a) + (now,) for a in agents]
+        post_rows = [self._post_row(p, author) + (now,) for p in posts if p.get('id')]
+        comment_rows = [row + (now,) for row in self._comment_rows(comments, author, post_id)]
+
+        # Authors seen only in posts/comments get a name-only row
+        authors = {row[1] for row in post_rows if row[1]} | {row[3] for row in comment_rows if row[3]}
+        authors -= {row[0] for row in agent_rows}
+
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO agents (name, updated_at) VALUES (?, ?) ON CONFLICT(name) DO NOTHING",
+                [(name, now) for name in authors]
+            )
+            self._db.executemany(self._upsert_agent, agent_rows)
+            self._db.executemany(self._upsert_post, post_rows)
+            self._db.executemany(self._upsert_comment, comment_rows)
+            self.stats['agents'] += len(agent_rows)
+            self.stats['posts'] += len(post_rows)
+            self.stats['comments'] += len(comment_rows)
+        return len(agent_rows) + len(post_rows) + len(comment_rows)
+
+    @staticmethod
+    def _agent_row(data: Dict[str, Any]) -> tuple:
+        return tuple(data.get(column) for column in AGENT_COLUMNS)
+
+    @staticmethod
+    def _post_row(data: Dict[str, Any], author: Optional[str]) -> tuple:
+        created_at, created_ts = _created(data)
+        return (data['id'], _name(data.get('author')) or author, _name(data.get('submolt')),
+                data.get('title'), data.get('content'), data.get('upvotes'),
+                data.get('downvotes'), data.get('comment_count'), created_at, created_ts)
+
+    @staticmethod
+    def _comment_rows(comments: Iterable[Dict[str, Any]], author: Optional[str],
+                      post_id: Optional[str]) -> Iterator[tuple]:
+        comments = list(comments)
+        if post_id is not None:
+            # Comment pages: flatten nested replies, keeping parent links
+            tree = moltbook_sdk.CommentTree(post_id, comments)
+            items = [(c, tree.parent_of[i]) for i, c in tree.by_id.items()]
+        else:
+            items = [(c, c.get('parent_id')) for c in comments if c.get('id')]
+
+        for comment, parent_id in items:
+            post = comment.get('post') if isinstance(comment.get('post'), dict) else {}
+            created_at, created_ts = _created(comment)
+            yield (comment['id'], post_id or post.get('id') or comment.get('post_id'), parent_id,
+                   _name(comment.get('author')) or author, comment.get('content'),
+                   comment.get('upvotes'), created_at, created_ts, post.get('title'),
+                   _name(post.get('submolt')))
+
+    # -- Queries -----------------------------------------------------------
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._db.execute(sql, tuple(params)).fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        """Rows per table"""
+        return {table: self._select(f"SELECT COUNT(*) FROM {table}")[0][0]
+                for table in ('agents', 'posts', 'comments')}
+
+    def agent(self, name: str) -> Optional[Dict[str, Any]]:
+        """Stored agent as an API-shaped dict, or None"""
+        rows = self._select(f"SELECT {', '.join(AGENT_COLUMNS)} FROM agents WHERE name = ?", (name,))
+        if not rows:
+            return None
+        agent = {k: v for k, v in zip(AGENT_COLUMNS, rows[0]) if v is not None}
+        for flag in ('is_active', 'is_claimed'):
+            if flag in agent:
+                agent[flag] = bool(agent[flag])
+        return agent
+
+    def raw_posts(self, submolt: Optional[str] = None, author: Optional[str] = None,
+                  since: Optional[float] = None, until: Optional[float] = None,
+                  sort: str = 'new', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Stored posts as API-shaped dicts.
+
+        Args:
+            submolt: Only this submolt
+            author: Only this author
+            since: Only posts created at/after this epoch time
+            until: Only posts created before this epoch time
+            sort: 'new', 'top', 'hot' (net votes, then newest) or 'rising'
+                (votes + comments per squared age)
+            limit: Maximum posts returned
+
+        Raises:
+            ValueError: On an unknown sort
+        """
+        if sort not in POST_ORDER:
+            raise ValueError(f"Unknown sort: {sort} (choose from {', '.join(POST_ORDER)})")
+
+        where, params = [], []
+        for clause, value in (('submolt = ?', submolt), ('author = ?', author),
+                              ('created_ts >= ?', since), ('created_ts < ?', until)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+
+        sql = f"SELECT {', '.join(POST_COLUMNS)} FROM posts"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {POST_ORDER[sort]}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._post_dict(row) for row in self._select(sql, params)]
+
+    def posts(self, **filters) -> List[moltbook_sdk.Post]:
+        """Stored posts as Post models (filters as for raw_posts)"""
+        return [moltbook_sdk.Post.from_dict(p) for p in self.raw_posts(**filters)]
+
+    @staticmethod
+    def _post_dict(row: tuple) -> Dict[str, Any]:
+        post = {k: v for k, v in zip(POST_COLUMNS, row) if v is not None and k != 'created_ts'}
+        if 'author' in post:
+            post['author'] = {'name': post['author']}
+        if 'submolt' in post:
+            post['submolt'] = {'name': post['submolt']}
+        return post
+
+    def raw_comments(self, post_id: Optional[str] = None, author: Optional[str] = None,
+                     since: Optional[float] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Stored comments as API-shaped dicts (with parent_id and a 'post'
+        summary), newest first.
+        """
+        where, params = [], []
+        for clause, value in (('post_id = ?', post_id), ('author = ?', author),
+                              ('created_ts >= ?', since)):
+            if value is not None:
+                where.append(clause)
+                params.append(value)
+
+        sql = f"SELECT {', '.join(COMMENT_COLUMNS)} FROM comments"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY created_ts DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._comment_dict(row) for row in self._select(sql, params)]
+
+    def comments(self, **filters) -> List[moltbook_sdk.Comment]:
+        """Stored comments as Comment models (filters as for raw_comments)"""
+        return [moltbook_sdk.Comment.from_dict(c) for c in self.raw_comments(**filters)]
+
+    @staticmethod
+    def _comment_dict(row: tuple) -> Dict[str, Any]:
+        values = dict(zip(COMMENT_COLUMNS, row))
+        comment = {k: values[k] for k in ('id', 'parent_id', 'content', 'upvotes', 'created_at')
+                   if values[k] is not None}
+        if values['author']:
+            comment['author'] = {'name': values['author']}
+        if values['post_id']:
+            comment['post'] = {'id': values['post_id'], 'title': values['post_title'] or '',
+                               'submolt': {'name': values['submolt'] or 'unknown'}}
+        return comment
+
+    def comment_tree(self, post_id: str) -> moltbook_sdk.CommentTree:
+        """CommentTree of the stored comments of a post"""
+        return moltbook_sdk.CommentTree(post_id, self.raw_comments(post_id=post_id))
+
+    def watermark(self, source: str) -> Optional[Watermark]:
+        """High-water mark of a sync source, or None if never synced"""
+        rows = self._select("SELECT source, created_ts, last_id, synced_at, refreshed_at "
+                            "FROM watermarks WHERE source = ?", (source,))
+        return Watermark(*rows[0]) if rows else None
+
+    def watermarks(self) -> List[Watermark]:
+        """Every sync source's high-water mark"""
+        return [Watermark(*row) for row in self._select(
+            "SELECT source, created_ts, last_id, synced_at, refreshed_at "
+            "FROM watermarks ORDER BY source")]
+
+    def set_watermark(self, watermark: Watermark):
+        """Record a sync source's high-water mark"""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks "
+                "(source, created_ts, last_id, synced_at, refreshed_at) VALUES (?, ?, ?, ?, ?)",
+                (watermark.source, watermark.created_ts, watermark.last_id,
+                 watermark.synced_at, watermark.refreshed_at)
+            )
+
+    def profile(self, name: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Profile response rebuilt from the store (agent, recentPosts and
+        recentComments, newest first), or None if the agent is unknown.
+        """
+        agent = self.agent(name)
+        if agent is None:
+            return None
+        return {
+            'success': True,
+            'agent': agent,
+            'recentPosts': self.raw_posts(author=name, limit=limit),
+            'recentComments': self.raw_comments(author=name, limit=limit)
+        }
+
+    # -- Client read methods, answered locally -------------------------------
+
+    def get_agent_profile(self, agent_name: str) -> Dict[str, Any]:
+        """Stored profile; raises MoltbookAPIError (404) if never mirrored"""
+        profile = self.profile(agent_name)
+        if profile is None:
+            raise moltbook_sdk.MoltbookAPIError(f"{agent_name} is not in the local store",
+                                                status=404)
+        return profile
+
+    def get_profiles(self, agent_names: Iterable[str],
+                     concurrency: Optional[int] = None) -> Iterator[moltbook_sdk.ProfileResult]:
+        """Stored profiles as ProfileResults, in input order"""
+        for name in dict.fromkeys(agent_names):
+            started = time.perf_counter()
+            try:
+                profile, error = self.get_agent_profile(name), None
+            except moltbook_sdk.MoltbookAPIError as e:
+                profile, error = None, e
+            yield moltbook_sdk.ProfileResult(name, profile=profile, error=error,
+                                             elapsed=time.perf_counter() - started)
+
+    def get_comment_tree(self, post_id: str, sort: str = "top") -> moltbook_sdk.CommentTree:
+        return self.comment_tree(post_id)
+
+    def get_comment_trees(self, post_ids: Iterable[str],
+                          concurrency: Optional[int] = None) -> Iterator[moltbook_sdk.CommentTreeResult]:
+        """
+        Stored comment trees as CommentTreeResults, in input order; a post
+        without stored comments gets a MoltbookAPIError (404) result.
+        """
+        for post_id in dict.fromkeys(post_ids):
+            started = time.perf_counter()
+            tree, error = self.comment_tree(post_id), None
+            if not len(tree):
+                tree, error = None, moltbook_sdk.MoltbookAPIError(
+                    f"No comments of {post_id} in the local store", status=404)
+            yield moltbook_sdk.CommentTreeResult(post_id, tree=tree, error=error,
+                                                 elapsed=time.perf_counter() - started)
+
+    def get_submolt(self, name: str, sort: str = "hot") -> Dict[str, Any]:
+        return {'posts': self.raw_posts(submolt=name, sort=sort)}
+
+    def iter_submolt_posts(self, name: str, sort: str = "hot",
+                           page_size: int = moltbook_sdk.DEFAULT_PAGE_SIZE,
+                           stop: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                           max_items: Optional[int] = None,
+                           prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """Stored posts of a submolt, with the same stop/max_items as the client"""
+        for post in self.raw_posts(submolt=name, sort=sort, limit=max_items):
+            if stop is not None and stop(post):
+                return
+            yield post
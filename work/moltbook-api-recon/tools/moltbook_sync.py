@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Moltbook Sync - Incremental delta sync into the local store
+
+Keeps a moltbook_store.MoltbookStore current at a cost of O(new items)
+per run instead of re-downloading whole profiles and listings. Each
+source (agent profile, submolt, feed) has a high-water mark in the
+store: the created_at and id of the newest item synced.
+
+- Submolts and feeds are walked newest first (sort=new) and the walk
+  stops at the watermark, so a quiet source costs one page.
+- Counters of posts that are still "hot" (younger than `hot_window`,
+  48h by default) change after they are first seen. Every
+  `refresh_interval` a source's walk goes back over the hot window
+  instead, refreshing their upvotes and comment counts.
+- Profiles cannot be fetched partially. They are refreshed once per
+  `refresh_interval`; new posts in between arrive through the synced
+  submolts.
+
+With a moltbook_timeseries.TimeSeriesStore, every sync also records
+karma, follower_count and per-post upvotes/comment_count history.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    python3 moltbook_sync.py --agents ClaudeCode_GLM4_7 --submolts general,ai
+    python3 moltbook_sync.py --status
+
+    import moltbook_sync
+    client = moltbook_sdk.MoltbookClient(api_key=key)
+    sync = moltbook_sync.StoreSync(client, store)
+    for result in sync.sync(agents=["ClaudeCode_GLM4_7"], submolts=["general"]):
+        print(result.source, result.new_items, result.requests)
+"""
+
+import sys
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Callable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+import moltbook_store
+import moltbook_timeseries
+import moltbook_cassette
+
+
+HOT_WINDOW = 48 * 3600         # Posts younger than this still gain votes/comments
+REFRESH_INTERVAL = 30 * 60     # How often hot posts and profiles are refreshed
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one source"""
+    source: str
+    new_items: int = 0          # Items newer than the previous watermark
+    seen_items: int = 0         # Items walked (new + refreshed)
+    refreshed: bool = False     # Whether hot posts/the profile were refreshed
+    requests: int = 0           # HTTP requests spent
+    error: Optional[moltbook_sdk.MoltbookAPIError] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class StoreSync:
+    """
+    Pull new items from the API into a MoltbookStore, per-source watermarks.
+
+    Any MoltbookClient works: before each source is synced, the client's
+    coalesced and in-memory cached results for it are dropped, so the
+    sync records what the API returns now rather than what the client
+    already held. (A DiskCache revalidates, so it is kept.)
+    """
+
+    def __init__(self, client: moltbook_sdk.MoltbookClient, store: moltbook_store.MoltbookStore,
+                 hot_window: float = HOT_WINDOW, refresh_interval: float = REFRESH_INTERVAL,
+                 backfill: Optional[float] = None,
+                 series: Optional[moltbook_timeseries.TimeSeriesStore] = None):
+        """
+        Args:
+            client: Client used for requests; `store` (and `series`) are
+                added as its listeners
+            store: Store receiving the items and watermarks
+            hot_window: Age (seconds) below which post counters are refreshed
+            refresh_interval: Seconds between hot-post/profile refreshes of a source
+            backfill: How far back (seconds) the first sync of a source walks
+                (default: hot_window)
+            series: Optional TimeSeriesStore recording metric history
+        """
+        self.client = client
+        self.store = store
+        self.hot_window = hot_window
+        self.refresh_interval = refresh_interval
+        self.backfill = hot_window if backfill is None else backfill
+        self.series = series
+        for listener in (store, series):
+            if listener is not None and listener not in client.listeners:
+                client.add_listener(listener)
+
+    def _due(self, watermark: Optional[moltbook_store.Watermark], now: float, force: bool) -> bool:
+        """Whether a source's hot posts/profile should be refreshed"""
+        return force or watermark is None or now - watermark.refreshed_at >= self.refresh_interval
+
+    def _run(self, source: str, prefix: str, sync: Callable[[SyncResult], None]) -> SyncResult:
+        """
+        Run one source's sync, timing it and counting its requests.
+
+        `prefix` is the endpoint prefix of the source's requests; results
+        the client coalesced or cached for it are dropped first.
+        """
+        if self.client.single_flight is not None:
+            self.client.single_flight.forget(prefix)
+        if self.client.cache is not None:
+            self.client.cache.invalidate(prefix)
+
+        result = SyncResult(source)
+        started = time.perf_counter()
+        requests = self.client.transfer_stats['requests']
+        try:
+            sync(result)
+        except moltbook_sdk.MoltbookAPIError as e:
+            result.error = e
+        result.requests = self.client.transfer_stats['requests'] - requests
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _sync_listing(self, result: SyncResult,
+                      walk: Callable[[Callable[[Dict[str, Any]], bool]], Iterator[Dict[str, Any]]],
+                      force: bool):
+        """Walk a newest-first listing back to its watermark (or the hot window)"""
+        now = time.time()
+        watermark = self.store.watermark(result.source)
+        result.refreshed = self._due(watermark, now, force)
+
+        since = watermark.created_ts if watermark and watermark.created_ts else now - self.backfill
+        if result.refreshed:
+            since = min(since, now - self.hot_window)
+        last_id = watermark.last_id if watermark and not result.refreshed else None
+        older = moltbook_sdk.created_before(since)
+
+        def stop(item: Dict[str, Any]) -> bool:
+            return (last_id is not None and item.get('id') == last_id) or older(item)
+
+        previous_ts = watermark.created_ts if watermark else None
+        newest_ts, newest_id = previous_ts, watermark.last_id if watermark else None
+        # Pages are mirrored into the store by the client's listener
+        for item in walk(stop):
+            result.seen_items += 1
+            created = moltbook_sdk.parse_timestamp(item.get('created_at'))
+            if previous_ts is None or created > previous_ts:
+                result.new_items += 1
+            if created and (newest_ts is None or created > newest_ts):
+                newest_ts, newest_id = created, item.get('id')
+
+        self.store.set_watermark(moltbook_store.Watermark(
+            result.source, newest_ts, newest_id, synced_at=now,
+            refreshed_at=now if result.refreshed else watermark.refreshed_at
+        ))
+
+    def sync_submolt(self, name: str, force: bool = False) -> SyncResult:
+        """Pull a submolt's new posts (and refresh hot ones when due)"""
+        return self._run(f"submolt:{name}", f"/submolts/{name}?", lambda result: self._sync_listing(
+            result, lambda stop: self.client.iter_submolt_posts(name, sort='new', stop=stop,
+                                                                prefetch=False),
+            force))
+
+    def sync_feed(self, agent_name: str, force: bool = False) -> SyncResult:
+        """Pull an agent's new feed posts (and refresh hot ones when due)"""
+        return self._run(f"feed:{agent_name}", f"/agents/{agent_name}/feed?", lambda result: self._sync_listing(
+            result, lambda stop: self.client.iter_feed(agent_name, sort='new', stop=stop,
+                                                       prefetch=False),
+            force))
+
+    def sync_profile(self, agent_name: str, force: bool = False) -> SyncResult:
+        """Refresh an agent's profile if due (karma, followers, recent posts' counters)"""
+        def sync(result: SyncResult):
+            now = time.time()
+            watermark = self.store.watermark(result.source)
+            if not self._due(watermark, now, force):
+                return
+            result.refreshed = True
+
+            profile = self.client.get_agent_profile(agent_name)
+            previous_ts = watermark.created_ts if watermark else None
+            newest_ts, newest_id = previous_ts, watermark.last_id if watermark else None
+            for post in profile.get('recentPosts') or ():
+                result.seen_items += 1
+                created = moltbook_sdk.parse_timestamp(post.get('created_at'))
+                if previous_ts is None or created > previous_ts:
+                    result.new_items += 1
+                if created and (newest_ts is None or created > newest_ts):
+                    newest_ts, newest_id = created, post.get('id')
+
+            self.store.set_watermark(moltbook_store.Watermark(
+                result.source, newest_ts, newest_id, synced_at=now, refreshed_at=now
+            ))
+
+        return self._run(f"profile:{agent_name}", f"/agents/profile?name={agent_name}", sync)
+
+    def sync(self, agents: Iterable[str] = (), submolts: Iterable[str] = (),
+             feeds: Iterable[str] = (), force: bool = False) -> Iterator[SyncResult]:
+        """
+        Sync every source, one at a time.
+
+        Args:
+            agents: Agent profiles to refresh
+            submolts: Submolts to pull
+            feeds: Agents whose feed to pull
+            force: Refresh hot posts and profiles even if not due
+
+        Yields:
+            SyncResult per source
+        """
+        for name in submolts:
+            yield self.sync_submolt(name, force)
+        for name in feeds:
+            yield self.sync_feed(name, force)
+        for name in agents:
+            yield self.sync_profile(name, force)
+
+
+def show_status(store: moltbook_store.MoltbookStore):
+    """Print every source's watermark and the store's row counts"""
+    now = time.time()
+    print(f"\n📦 STORE: {store.path}")
+    counts = store.counts()
+    print(f"  Agents: {counts['agents']} | Posts: {counts['posts']} | Comments: {counts['comments']}")
+    print(f"\n🔖 WATERMARKS")
+    for mark in store.watermarks():
+        newest = (time.strftime('%Y-%m-%d %H:%M', time.gmtime(mark.created_ts))
+                  if mark.created_ts else '-')
+        print(f"  {mark.source:30s} newest {newest} UTC | synced {(now - mark.synced_at) / 60:.0f}m ago"
+              f" | refreshed {(now - mark.refreshed_at) / 60:.0f}m ago")
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    def names(value: str) -> List[str]:
+        return [n.strip() for n in value.split(',') if n.strip()]
+
+    parser = argparse.ArgumentParser(
+        description='Incrementally sync Moltbook profiles, submolts and feeds into the local store'
+    )
+    parser.add_argument('--agents', type=names, default=[], help='Comma-separated agent profiles')
+    parser.add_argument('--submolts', type=names, default=[], help='Comma-separated submolts')
+    parser.add_argument('--feeds', type=names, default=[], help='Comma-separated agents whose feed to sync')
+    parser.add_argument('--store', help='Store path (default: ~/.moltbook/store.sqlite3)')
+    parser.add_argument('--series', help='Time-series path (default: ~/.moltbook/timeseries.sqlite3)')
+    parser.add_argument('--no-series', action='store_true',
+                        help='Do not record karma/follower/post counter history')
+    parser.add_argument('--api-key', help='Moltbook API key',
+                        default=os.environ.get('MOLTBOOK_API_KEY'))
+    parser.add_argument('--hot-hours', type=float, default=HOT_WINDOW / 3600,
+                        help='Refresh counters of posts younger than this (default: 48)')
+    parser.add_argument('--refresh-minutes', type=float, default=REFRESH_INTERVAL / 60,
+                        help='Minutes between hot-post/profile refreshes (default: 30)')
+    parser.add_argument('--backfill-hours', type=float,
+                        help='How far back a new source is walked (default: --hot-hours)')
+    parser.add_argument('--force', action='store_true',
+                        help='Refresh hot posts and profiles now')
+    parser.add_argument('--status', action='store_true', help='Show watermarks and exit')
+
+    moltbook_cassette.add_arguments(parser)
+
+    args = parser.parse_args()
+    moltbook_cassette.install(args)
+
+    store = moltbook_store.MoltbookStore(args.store)
+    if args.status:
+        show_status(store)
+        return
+
+    if not (args.agents or args.submolts or args.feeds):
+        parser.error("nothing to sync: pass --agents, --submolts and/or --feeds")
+
+    series = None if args.no_series else moltbook_timeseries.TimeSeriesStore(args.series)
+    client = moltbook_sdk.MoltbookClient(api_key=args.api_key)
+    sync = StoreSync(
+        client, store, hot_window=args.hot_hours * 3600,
+        refresh_interval=args.refresh_minutes * 60,
+        backfill=args.backfill_hours * 3600 if args.backfill_hours is not None else None,
+        series=series
+    )
+
+    print(f"\n🔄 SYNC → {store.path}")
+    total_requests = total_new = 0
+    for result in sync.sync(args.agents, args.submolts, args.feeds, force=args.force):
+        total_requests += result.requests
+        total_new += result.new_items
+        if not result.ok:
+            print(f"  ❌ {result.source}: {result.error}")
+            continue
+        refreshed = ' (refreshed)' if result.refreshed else ''
+        print(f"  ✓ {result.source:30s} {result.new_items:4d} new / {result.seen_items:4d} seen"
+              f" | {result.requests} requests | {result.elapsed:.2f}s{refreshed}")
+    print(f"\n  Total: {total_new} new items, {total_requests} requests")
+    if series is not None:
+        print(f"  Series: {series.stats['recorded']} changed samples recorded "
+              f"({series.stats['unchanged']} unchanged)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Moltbook Time Series - Append-only metric history for agents and posts
+
+A profile or listing is a single point in time; growth needs history.
+TimeSeriesStore keeps (entity, metric, ts) -> value samples in SQLite
+(~/.moltbook/timeseries.sqlite3, WAL):
+
+- One WITHOUT ROWID table keyed by (entity id, metric id, ts), so a
+  sample costs a few dozen bytes and "value at time t" is one index seek
+- Entities ('agent:NAME', 'post:ID') and metric names are interned to
+  small integer ids
+- A sample is only written when the value changed since the previous
+  one. A series is a step function, so months of 5-minute syncs cost
+  rows per change, not per sync, and old posts stop growing the table.
+
+It is a MoltbookClient listener (profiles record karma and
+follower_count, listings record per-post upvotes and comment_count), and
+moltbook_sync records into it on every sync.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    import moltbook_timeseries
+
+    series = moltbook_timeseries.TimeSeriesStore()
+    client = moltbook_sdk.MoltbookClient(listeners=[series])
+
+    agent = moltbook_timeseries.agent_key("ClaudeCode_GLM4_7")
+    series.delta(agent, 'karma')                   # change over the last 24h
+    series.rate(agent, 'follower_count', window=7 * 86400)   # per day
+    series.range(agent, 'karma', start, end, step=3600)      # hourly points
+"""
+
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple, Iterable
+
+
+DEFAULT_SERIES_PATH = Path.home() / ".moltbook" / "timeseries.sqlite3"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+AGENT_METRICS = ('karma', 'follower_count')
+POST_METRICS = ('upvotes', 'comment_count')
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entities (
+        id INTEGER PRIMARY KEY,
+        key TEXT NOT NULL UNIQUE
+    );
+    CREATE TABLE IF NOT EXISTS metrics (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+    CREATE TABLE IF NOT EXISTS samples (
+        entity INTEGER NOT NULL,
+        metric INTEGER NOT NULL,
+        ts INTEGER NOT NULL,
+        value NUMERIC NOT NULL,
+        PRIMARY KEY (entity, metric, ts)
+    ) WITHOUT ROWID;
+"""
+
+
+def agent_key(name: str) -> str:
+    """Entity key of an agent"""
+    return f"agent:{name}"
+
+
+def post_key(post_id: str) -> str:
+    """Entity key of a post"""
+    return f"post:{post_id}"
+
+
+class TimeSeriesStore:
+    """
+    Thread-safe change-only time series of agent and post metrics.
+
+    Timestamps are whole epoch seconds. Queries treat each series as a
+    step function: the value at t is the last sample at or before t.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite file (default: ~/.moltbook/timeseries.sqlite3)
+        """
+        if path is None:
+            DEFAULT_SERIES_PATH.parent.mkdir(parents=True, exist_ok=True)
+            path = str(DEFAULT_SERIES_PATH)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+        self._ids: Dict[Tuple[str, str], int] = {}
+        self.stats = {
+            'recorded': 0,
+            'unchanged': 0
+        }
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> 'TimeSeriesStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _id(self, table: str, column: str, value: str,
+            staged: Optional[Dict[Tuple[str, str], int]] = None) -> Optional[int]:
+        """
+        Interned id of an entity key or metric name (caller holds the lock).
+
+        With `staged`, a missing key is inserted and its id goes into
+        `staged` rather than the cache; the caller merges it once the
+        transaction commits, so a rollback never leaves a stale id behind.
+        """
+        cached = self._ids.get((table, value))
+        if cached is None and staged is not None:
+            cached = staged.get((table, value))
+        if cached is not None:
+            return cached
+        row = self._db.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()
+        if row is not None:
+            self._ids[(table, value)] = row[0]
+            return row[0]
+        if staged is None:
+            return None
+        staged[(table, value)] = self._db.execute(
+            f"INSERT INTO {table} ({column}) VALUES (?)", (value,)
+        ).lastrowid
+        return staged[(table, value)]
+
+    def _ids_for(self, entity: str, metric: str,
+                 staged: Optional[Dict[Tuple[str, str], int]] = None) -> Optional[Tuple[int, int]]:
+        entity_id = self._id('entities', 'key', entity, staged)
+        metric_id = self._id('metrics', 'name', metric, staged)
+        if entity_id is None or metric_id is None:
+            return None
+        return entity_id, metric_id
+
+    # -- Recording -----------------------------------------------------------
+
+    def record(self, entity: str, metric: str, value: float, ts: Optional[float] = None) -> bool:
+        """
+        Record one sample if the value changed.
+
+        Returns:
+            True if a row was written
+        """
+        return self.record_many([(entity, metric, value)], ts) > 0
+
+    def record_many(self, samples: Iterable[Tuple[str, str, float]],
+                    ts: Optional[float] = None) -> int:
+        """
+        Record (entity, metric, value) samples taken at `ts` in one transaction.
+
+        Args:
+            samples: (entity key, metric name, value) triples; None values
+                are skipped
+            ts: Sample time (default: now)
+
+        Returns:
+            Rows written (unchanged values are not)
+        """
+        ts = int(time.time() if ts is None else ts)
+        written = unchanged = 0
+        staged: Dict[Tuple[str, str], int] = {}
+        with self._lock:
+            with self._db:
+                for entity, metric, value in samples:
+                    if value is None:
+                        continue
+                    entity_id, metric_id = self._ids_for(entity, metric, staged)
+                    last = self._db.execute(
+                        "SELECT value FROM samples WHERE entity = ? AND metric = ? AND ts <= ? "
+                        "ORDER BY ts DESC LIMIT 1", (entity_id, metric_id, ts)
+                    ).fetchone()
+                    if last is not None and last[0] == value:
+                        unchanged += 1
+                        continue
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO samples (entity, metric, ts, value) VALUES (?, ?, ?, ?)",
+                        (entity_id, metric_id, ts, value)
+                    )
+                    written += 1
+            # Committed: ids inserted by this transaction are now safe to cache
+            self._ids.update(staged)
+            self.stats['recorded'] += written
+            self.stats['unchanged'] += unchanged
+        return written
+
+    def record_agent(self, agent: Dict[str, Any], ts: Optional[float] = None) -> int:
+        """Record an agent dict's karma and follower_count"""
+        if not agent.get('name'):
+            return 0
+        key = agent_key(agent['name'])
+        return self.record_many([(key, metric, agent.get(metric)) for metric in AGENT_METRICS], ts)
+
+    def record_posts(self, posts: Iterable[Dict[str, Any]], ts: Optional[float] = None) -> int:
+        """Record raw post dicts' upvotes and comment_count"""
+        return self.record_many(
+            [(post_key(post['id']), metric, post.get(metric))
+             for post in posts if post.get('id') for metric in POST_METRICS], ts
+        )
+
+    def record_profile(self, profile: Dict[str, Any], ts: Optional[float] = None) -> int:
+        """Record a profile response: the agent and its recent posts"""
+        ts = time.time() if ts is None else ts
+        return (self.record_agent(profile.get('agent') or {}, ts) +
+                self.record_posts(profile.get('recentPosts') or (), ts))
+
+    def __call__(self, endpoint: str, response: Any):
+        """Client listener: record profiles and post listings"""
+        if not isinstance(response, dict):
+            return
+        path = urllib.parse.urlsplit(endpoint).path
+        if path == '/agents/profile':
+            self.record_profile(response)
+        elif re.match(r'^/(submolts/[^/]+|agents/[^/]+/feed)$', path):
+            self.record_posts(response.get('posts') or ())
+
+    # -- Queries -------------------------------------------------------------
+
+    def value_at(self, entity: str, metric: str, ts: Optional[float] = None) -> Optional[float]:
+        """Value at `ts` (default: latest), or None before the first sample"""
+        ts = int(time.time() if ts is None else ts)
+        with self._lock:
+            ids = self._ids_for(entity, metric)
+            if ids is None:
+                return None
+            row = self._db.execute(
+                "SELECT value FROM samples WHERE entity = ? AND metric = ? AND ts <= ? "
+                "ORDER BY ts DESC LIMIT 1", (*ids, ts)
+            ).fetchone()
+        return row[0] if row else None
+
+    def first_sample(self, entity: str, metric: str) -> Optional[Tuple[int, float]]:
+        """(ts, value) of the oldest sample, or None"""
+        with self._lock:
+            ids = self._ids_for(entity, metric)
+            if ids is None:
+                return None
+            return self._db.execute(
+                "SELECT ts, value FROM samples WHERE entity = ? AND metric = ? "
+                "ORDER BY ts LIMIT 1", ids
+            ).fetchone()
+
+    def range(self, entity: str, metric: str, start: float, end: Optional[float] = None,
+              step: Optional[float] = None) -> List[Tuple[int, float]]:
+        """
+        Samples between `start` and `end` (default: now).
+
+        Args:
+            step: Downsample to one point per `step` seconds: the value at
+                the end of each bucket (buckets without a change carry the
+                previous value forward)
+
+        Returns:
+            [(ts, value)] in time order; with `step`, bucket start times
+        """
+        start, end = int(start), int(time.time() if end is None else end)
+        with self._lock:
+            ids = self._ids_for(entity, metric)
+            if ids is None:
+                return []
+            rows = self._db.execute(
+                "SELECT ts, value FROM samples WHERE entity = ? AND metric = ? "
+                "AND ts >= ? AND ts <= ? ORDER BY ts", (*ids, start, end)
+            ).fetchall()
+        if step is None:
+            return rows
+
+        step = int(step)
+        value = self.value_at(entity, metric, start - 1)
+        points = []
+        index = 0
+        for bucket in range(start, end + 1, step):
+            while index < len(rows) and rows[index][0] < bucket + step:
+                value = rows[index][1]
+                index += 1
+            if value is not None:
+                points.append((bucket, value))
+        return points
+
+    def delta(self, entity: str, metric: str, window: float = DAY,
+              end: Optional[float] = None) -> Optional[float]:
+        """
+        Change over the `window` seconds before `end` (default: now).
+
+        When the series starts inside the window, the change since its
+        first sample is returned; None without samples.
+        """
+        end = time.time() if end is None else end
+        latest = self.value_at(entity, metric, end)
+        if latest is None:
+            return None
+        before = self.value_at(entity, metric, end - window)
+        if before is None:
+            before = self.first_sample(entity, metric)[1]
+        return latest - before
+
+    def rate(self, entity: str, metric: str, window: float = DAY,
+             end: Optional[float] = None, per: float = DAY) -> Optional[float]:
+        """
+        Average change per `per` seconds (default: per day) over `window`.
+
+        A series younger than the window is averaged over its own span.
+        """
+        end = time.time() if end is None else end
+        first = self.first_sample(entity, metric)
+        if first is None:
+            return None
+        span = min(window, end - first[0])
+        if span <= 0:
+            return None
+        return self.delta(entity, metric, window, end) * per / span
+
+    def entities(self, prefix: str = '') -> List[str]:
+        """Entity keys starting with `prefix`, e.g. 'agent:'"""
+        with self._lock:
+            return [row[0] for row in self._db.execute(
+                "SELECT key FROM entities WHERE substr(key, 1, ?) = ? ORDER BY key",
+                (len(prefix), prefix)
+            )]
+
+    def counts(self) -> Dict[str, int]:
+        """Rows per table"""
+        with self._lock:
+            return {table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ('entities', 'metrics', 'samples')}
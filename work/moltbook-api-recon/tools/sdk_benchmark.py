@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+"""
+SDK Benchmark - Measure moltbook_sdk performance against a local stub server
+
+Runs entirely offline: a stub Moltbook API is started on 127.0.0.1 and the
+SDK is pointed at it, so numbers reflect client-side cost only.
+
+Author: ClaudeCode_GLM4_7
+Date: 2026-02-05
+
+Usage:
+    python3 sdk_benchmark.py pool                  # urlopen vs pooled transport
+    python3 sdk_benchmark.py pool --requests 2000 --threads 8
+    python3 sdk_benchmark.py hooks                 # observer overhead + phase report
+    python3 sdk_benchmark.py profile --posts 5000  # eager Post lists vs lazy ProfileView
+    python3 sdk_benchmark.py memory                # footprint per 100k posts by model form
+    python3 sdk_benchmark.py stream --posts 5000   # peak memory: whole-body vs streaming decode
+    python3 sdk_benchmark.py json                  # orjson/ujson/json on recorded payloads
+    python3 sdk_benchmark.py json --file ../logs/health_check_*.json
+    python3 sdk_benchmark.py coherence             # read-after-write gate (exit 1 on any failure)
+"""
+
+import sys
+import os
+import gzip
+import json
+import time
+import threading
+import tracemalloc
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import moltbook_sdk
+import moltbook_metrics
+import moltbook_models
+import moltbook_fakeserver
+
+
+# ============================================================================
+# STUB SERVER
+# ============================================================================
+
+def make_profile_payload(agent_name: str = "BenchAgent", posts: int = 20) -> Dict:
+    """Build a profile payload shaped like /agents/profile?name="""
+    return {
+        'success': True,
+        'agent': {
+            'id': 'agent-0',
+            'name': agent_name,
+            'description': 'Synthetic agent used for benchmarks',
+            'karma': 42,
+            'follower_count': 7,
+            'following_count': 3,
+            'created_at': '2026-02-01T12:00:00+00:00',
+            'is_active': True,
+            'is_claimed': True
+        },
+        'recentPosts': [
+            {
+                'id': f'post-{i}',
+                'title': f'Benchmark post {i}',
+                'content': 'Lorem ipsum dolor sit amet. ' * 20,
+                'upvotes': i % 17,
+                'downvotes': i % 3,
+                'comment_count': i % 5,
+                'created_at': f'2026-02-0{1 + i % 5}T{i % 24:02d}:00:00+00:00',
+                'submolt': {'name': 'general'}
+            }
+            for i in range(posts)
+        ],
+        'recentComments': []
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON handler answering every path with the same payload"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    payload = json.dumps(make_profile_payload()).encode('utf-8')
+    gzipped = gzip.compress(payload)
+    etag = '"stub-v1"'
+
+    def _send(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        if self.command == 'GET' and self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = self.payload
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            body = self.gzipped
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _send
+    do_POST = _send
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(handler: type = StubHandler) -> ThreadingHTTPServer:
+    """Start the stub server on a free local port in a daemon thread"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def run_timed(fn: Callable[[], None], requests: int, threads: int) -> float:
+    """Call `fn` `requests` times over `threads` workers, return requests/sec"""
+    start = time.perf_counter()
+    if threads <= 1:
+        for _ in range(requests):
+            fn()
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(fn) for _ in range(requests)]:
+                future.result()
+    return requests / (time.perf_counter() - start)
+
+
+def bench_pool(requests: int, threads: int):
+    """Compare one-connection-per-request urlopen with the pooled client"""
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    url = f"{base_url}/api/v1/agents/profile?name=BenchAgent"
+
+    def urlopen_once():
+        with urllib.request.urlopen(url) as response:
+            json.loads(response.read().decode('utf-8'))
+
+    # Coalescing and compression off: measure the transport alone
+    client = moltbook_sdk.MoltbookClient(base_url=base_url, pool_size=max(threads, 1),
+                                         coalesce_window=None, compression=False)
+
+    def pooled_once():
+        client.get_agent_profile("BenchAgent")
+
+    print(f"⏱️  Pool benchmark: {requests} requests, {threads} thread(s)")
+    print("=" * 60)
+
+    try:
+        baseline = run_timed(urlopen_once, requests, threads)
+        print(f"urllib.urlopen (new connection each): {baseline:8.1f} req/s")
+
+        pooled = run_timed(pooled_once, requests, threads)
+        print(f"MoltbookClient (keep-alive pool):     {pooled:8.1f} req/s")
+
+        print(f"\nSpeedup: {pooled / baseline:.2f}x")
+        print(f"Pool stats: {client.pool.stats}")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def bench_hooks(requests: int):
+    """Measure the cost of the LatencyAggregator observer and print its report"""
+    server = start_stub_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    metrics = moltbook_metrics.LatencyAggregator()
+    plain = moltbook_sdk.MoltbookClient(base_url=base_url, coalesce_window=None)
+    observed = moltbook_sdk.MoltbookClient(base_url=base_url, coalesce_window=None,
+                                           observers=[metrics])
+
+    print(f"⏱️  Instrumentation benchmark: {requests} requests")
+    print("=" * 60)
+
+    try:
+        baseline = run_timed(lambda: plain.get_agent_posts("BenchAgent"), requests, 1)
+        print(f"No observers:       {baseline:8.1f} req/s")
+
+        instrumented = run_timed(lambda: observed.get_agent_posts("BenchAgent"), requests, 1)
+        print(f"LatencyAggregator:  {instrumented:8.1f} req/s")
+
+        # End-to-end rates are dominated by stub-server noise: time the
+        # aggregator alone by replaying the events it has seen
+        events = []
+        observed.observers = [events.append]
+        observed.get_agent_posts("BenchAgent")
+        replay = moltbook_metrics.LatencyAggregator()
+        start = time.perf_counter()
+        for _ in range(requests):
+            for event in events:
+                replay(event)
+        cost = (time.perf_counter() - start) / requests * 1e6
+        print(f"Aggregator cost:    {cost:8.1f}µs per request ({len(events)} events)\n")
+        print(metrics.report())
+    finally:
+        plain.close()
+        observed.close()
+        server.shutdown()
+
+
+def bench_profile(posts: int, rounds: int):
+    """Eager Post/Comment lists vs a lazy ProfileView for totals + top 3 posts"""
+    payload = make_profile_payload(posts=posts)
+    payload['recentComments'] = [
+        {'id': f'comment-{i}', 'content': 'Nice post!', 'upvotes': i % 4,
+         'created_at': '2026-02-03T10:00:00+00:00',
+         'post': {'id': f'post-{i}', 'title': f'Benchmark post {i}', 'submolt': {'name': 'general'}},
+         'author': {'name': 'BenchAgent'}}
+        for i in range(posts // 10)
+    ]
+
+    def eager():
+        post_list = [moltbook_sdk.Post.from_dict(p) for p in payload['recentPosts']]
+        comments = [moltbook_sdk.Comment.from_dict(c) for c in payload['recentComments']]
+        total_upvotes = sum(p.upvotes for p in post_list)
+        total_comments = sum(p.comment_count for p in post_list)
+        top = sorted(post_list, key=lambda p: p.upvotes, reverse=True)[:3]
+        return len(post_list), len(comments), total_upvotes, total_comments, [p.id for p in top]
+
+    def lazy():
+        view = moltbook_sdk.ProfileView(payload)
+        top = view.top_posts(3)
+        return (len(view.posts), len(view.comments), view.total_upvotes,
+                view.total_comments_received, [p.id for p in top])
+
+    assert eager() == lazy()
+
+    print(f"⏱️  Profile benchmark: {posts} posts, {posts // 10} comments, {rounds} rounds")
+    print("=" * 60)
+    results = {}
+    for name, fn in [('Eager Post/Comment lists', eager), ('Lazy ProfileView', lazy)]:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        results[name] = (time.perf_counter() - start) / rounds * 1000
+        print(f"{name:26s} {results[name]:8.3f} ms per profile")
+
+    print(f"\nSpeedup: {results['Eager Post/Comment lists'] / results['Lazy ProfileView']:.1f}x")
+
+
+def measure_allocated(build: Callable[[], object]) -> int:
+    """Bytes still allocated by the object `build` returns"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def bench_memory(posts: int):
+    """Memory footprint of raw dicts, dataclasses, slotted models and PostBatch"""
+    raw = make_profile_payload(posts=posts)['recentPosts']
+    for i, item in enumerate(raw):
+        item['id'] = f'{i:08x}-0000-4000-8000-{i:012x}'   # UUID-shaped, unique
+        item['content'] = item['content'] + str(i)         # unique body per post
+
+    text = json.dumps(raw)
+    del raw
+
+    # Each form is built from a fresh decode and the raw dicts are dropped,
+    # so only what the form itself keeps is counted
+    forms = [
+        ('Raw JSON dicts', lambda: json.loads(text)),
+        ('Post dataclass', lambda: [moltbook_sdk.Post.from_dict(p) for p in json.loads(text)]),
+        ('CompactPost (__slots__)',
+         lambda: [moltbook_models.CompactPost.from_dict(p) for p in json.loads(text)]),
+        ('PostBatch (columnar)', lambda: moltbook_models.PostBatch.from_dicts(json.loads(text))),
+    ]
+
+    print(f"⏱️  Memory benchmark: {posts} posts (reported per 100k posts)")
+    print("=" * 60)
+    print("PostBatch keeps ids and numeric fields only (no title/content).\n")
+    scale = 100_000 / posts
+    for name, build in forms:
+        allocated = measure_allocated(build)
+        print(f"{name:26s} {allocated * scale / 2 ** 20:8.1f} MiB "
+              f"({allocated / posts:6.0f} B/post)")
+
+
+def measure_peak(fn: Callable[[], object]) -> Tuple[int, float]:
+    """Peak traced allocation (bytes) and wall time (seconds) of one call"""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, elapsed
+
+
+def bench_stream(posts: int):
+    """Peak memory of a whole-body profile decode vs streaming decode"""
+    payload = json.dumps(make_profile_payload(posts=posts)).encode('utf-8')
+
+    class LargeProfileHandler(StubHandler):
+        pass
+
+    LargeProfileHandler.payload = payload
+    LargeProfileHandler.gzipped = gzip.compress(payload)
+
+    server = start_stub_server(LargeProfileHandler)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    client = moltbook_sdk.MoltbookClient(base_url=base_url, coalesce_window=None)
+
+    def whole():
+        profile = client.get_agent_profile("BenchAgent")
+        return sum(p.get('upvotes', 0) for p in profile['recentPosts'])
+
+    def streamed():
+        return sum(post.get('upvotes', 0) for key, post in client.stream_profile("BenchAgent")
+                   if key == 'recentPosts')
+
+    print(f"⏱️  Streaming benchmark: {posts} posts, {len(payload) / 2 ** 20:.1f} MiB body")
+    print("=" * 60)
+
+    try:
+        assert whole() == streamed()
+        for name, fn in [('Whole body + json.loads', whole), ('Streaming decode', streamed)]:
+            peak, elapsed = measure_peak(fn)
+            print(f"{name:26s} peak {peak / 2 ** 20:7.2f} MiB  {elapsed * 1000:8.1f} ms")
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def record_payload(posts: int) -> bytes:
+    """Response body of a profile request, as received from the stub server"""
+    payload = json.dumps(make_profile_payload(posts=posts)).encode('utf-8')
+
+    class RecordHandler(StubHandler):
+        pass
+
+    RecordHandler.payload = payload
+    RecordHandler.gzipped = gzip.compress(payload)
+
+    server = start_stub_server(RecordHandler)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/agents/profile?name=BenchAgent"
+        with urllib.request.urlopen(url) as response:
+            return response.read()
+    finally:
+        server.shutdown()
+
+
+def time_per_call(fn: Callable[[], object], rounds: int) -> float:
+    """Seconds per call of `fn`, best of 3 runs of `rounds` calls"""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        best = min(best, (time.perf_counter() - start) / rounds)
+    return best
+
+
+def bench_json(posts: int, files: List[str], rounds: int):
+    """loads/dumps of every installed JSON backend on recorded payloads"""
+    payloads = [(f'profile ({posts} posts)', record_payload(posts))]
+    for path in files:
+        with open(path, 'rb') as f:
+            payloads.append((os.path.basename(path), f.read()))
+
+    backends = [moltbook_sdk._load_json_backend(name)
+                for name in moltbook_sdk.available_json_backends()]
+    missing = sorted(set(moltbook_sdk.JSON_BACKENDS) - {b.name for b in backends})
+
+    print(f"⏱️  JSON benchmark: {', '.join(b.name for b in backends)}"
+          f"{' (not installed: ' + ', '.join(missing) + ')' if missing else ''}")
+    print("=" * 60)
+
+    ops = ['loads', 'dumps', 'dumps indent']
+    for label, body in payloads:
+        obj = json.loads(body)
+        print(f"\n{label}: {len(body) / 1024:.1f} KiB")
+        results: Dict[str, Dict[str, float]] = {}
+        for backend in backends:
+            assert backend.loads(body) == obj
+            assert backend.loads(backend.dumps(obj, True)) == obj
+            results[backend.name] = {
+                'loads': time_per_call(lambda: backend.loads(body), rounds),
+                'dumps': time_per_call(lambda: backend.dumps(obj), rounds),
+                'dumps indent': time_per_call(lambda: backend.dumps(obj, True), rounds),
+            }
+            print(f"  {backend.name:7s} " + "  ".join(
+                f"{op} {results[backend.name][op] * 1000:8.3f}ms" for op in ops
+            ))
+
+        for name in results:
+            if name != 'json':
+                print(f"  {name} speedup over json: " + ", ".join(
+                    f"{op} {results['json'][op] / results[name][op]:.1f}x" for op in ops
+                ))
+
+
+class HeldFakeServer(moltbook_fakeserver.FakeMoltbookServer):
+    """
+    Fake API that can hold one GET after building its response, so the
+    response is stale by the time it is sent if a write runs meanwhile
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._held: Optional[Tuple[str, threading.Event, threading.Event]] = None
+
+    def hold_next(self, path: str) -> Tuple[threading.Event, threading.Event]:
+        """
+        Hold the next GET of `path` (e.g. "/api/v1/agents/profile").
+
+        Returns:
+            (built, release): set once the response is built; set it to send
+        """
+        built, release = threading.Event(), threading.Event()
+        self._held = (path, built, release)
+        return built, release
+
+    def _route(self, method: str, path: str, query: Dict[str, str], raw_body: bytes,
+               token: Optional[str]) -> Tuple[int, Dict]:
+        result = super()._route(method, path, query, raw_body, token)
+        held = self._held
+        if method == 'GET' and held is not None and held[0] == path:
+            self._held = None
+            held[1].set()
+            held[2].wait(10)
+        return result
+
+
+def check_coherence(server: HeldFakeServer, client: moltbook_sdk.MoltbookClient) -> List[str]:
+    """
+    Read, write and read again through `client`, once per kind of write.
+
+    Every step reads first, which primes the client's coalescing and cache,
+    then writes and asserts that the next read matches the server's own
+    state. A failed assertion is a stale read; any other exception fails
+    the step as well.
+
+    Returns:
+        One description per failed step (empty if every step passed)
+    """
+    dataset = server.dataset
+    target = dataset.agent_name(1)
+    me = dataset.agent_name(server.me)
+    submolt = dataset.submolt_name(0)
+    post_id = client.get_agent_profile(target)['recentPosts'][0]['id']
+    post_index = dataset.post_index(post_id)
+    created: Dict[str, str] = {}
+
+    def expect(ok: bool, message: str):
+        # Raised explicitly so the check still runs under python -O
+        if not ok:
+            raise AssertionError(message)
+
+    def followers() -> int:
+        return client.get_agent_profile(target)['agent']['follower_count']
+
+    def post() -> Dict:
+        for item in client.get_agent_profile(target)['recentPosts']:
+            if item['id'] == post_id:
+                return item
+        raise AssertionError(f"post {post_id} missing from the profile")
+
+    def comments() -> Dict[str, Dict]:
+        return {c['id']: c for c in client.iter_post_comments(post_id)}
+
+    def expect_followers(when: str):
+        read, actual = followers(), dataset.agent(1)['follower_count']
+        expect(read == actual, f"follower_count read {read}, server has {actual} {when}")
+
+    def follow():
+        followers()
+        try:
+            client.follow_agent(target)
+            expect_followers("after follow")
+        finally:
+            client.unfollow_agent(target)
+        expect_followers("after unfollow")
+
+    def vote_post():
+        for vote, field in ((client.upvote_post, 'upvotes'), (client.downvote_post, 'downvotes')):
+            post()
+            vote(post_id)
+            read, actual = post()[field], dataset.post(post_index)[field]
+            expect(read == actual, f"{field} read {read}, server has {actual}")
+
+    def create_comment():
+        post(), comments()
+        comment_id = created['comment'] = client.create_comment(post_id, "Coherence check")['comment']['id']
+        read, actual = post()['comment_count'], dataset.post(post_index)['comment_count']
+        expect(read == actual, f"comment_count read {read}, server has {actual}")
+        expect(comment_id in comments(), "new comment missing from the comment listing")
+
+    def vote_comment():
+        expect('comment' in created, "no comment to upvote (create_comment failed)")
+        comment_id = created['comment']
+        comments()
+        client.upvote_comment(comment_id)
+        read = comments().get(comment_id, {}).get('upvotes')
+        actual = dataset.comment(*dataset.comment_ref(comment_id))['upvotes']
+        expect(read == actual, f"comment upvotes read {read}, server has {actual}")
+
+    def create_post():
+        def listed() -> Tuple[set, set]:
+            return ({p['id'] for p in client.get_submolt(submolt, sort='new')['posts']},
+                    {p['id'] for p in client.get_agent_profile(me)['recentPosts']})
+
+        listed()
+        new_id = client.create_post("Coherence check", "Read after write", submolt)['post']['id']
+        in_submolt, in_profile = listed()
+        expect(new_id in in_submolt, f"new post missing from submolt {submolt}")
+        expect(new_id in in_profile, f"new post missing from {me}'s profile")
+
+    def write_during_get():
+        # A GET built before a write and answered after it must neither be
+        # shared with later reads nor cached
+        actual = dataset.agent(1)['follower_count']
+        client.invalidate()  # so the held GET reaches the server
+        built, release = server.hold_next('/api/v1/agents/profile')
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                in_flight = executor.submit(followers)
+                try:
+                    expect(built.wait(10), "held GET never reached the server")
+                    client.follow_agent(target)
+                    expect(dataset.agent(1)['follower_count'] == actual + 1,
+                           "follow did not change the server's follower_count")
+                    expect_followers("while a GET built before the follow was in flight")
+                finally:
+                    release.set()
+                in_flight.result()
+            expect_followers("once the GET built before the follow finished")
+        finally:
+            client.unfollow_agent(target)
+
+    failures = []
+    for label, step in [('follow/unfollow', follow), ('post votes', vote_post),
+                        ('create_comment', create_comment), ('comment vote', vote_comment),
+                        ('create_post', create_post), ('write during GET', write_during_get)]:
+        try:
+            step()
+        except AssertionError as e:
+            failures.append(f"{label}: stale read: {e}")
+        except Exception as e:
+            failures.append(f"{label}: {type(e).__name__}: {e}")
+        else:
+            print(f"  ✓ {label}")
+            continue
+        print(f"  ✗ {failures[-1]}")
+    return failures
+
+
+def bench_coherence() -> bool:
+    """
+    Read-after-write check of every write against the fake API.
+
+    Returns:
+        True if every step passed (main() exits 1 otherwise)
+    """
+    configs = [
+        ('coalescing (default client)', {}),
+        ('coalescing + ResponseCache', {'cache': moltbook_sdk.ResponseCache()}),
+    ]
+
+    print("🔁 Read-after-write coherence against moltbook_fakeserver")
+    print("=" * 60)
+
+    failures = []
+    for label, options in configs:
+        dataset = moltbook_fakeserver.SyntheticDataset(agents=50, posts=2000)
+        with HeldFakeServer(dataset, seed=0) as server:
+            client = moltbook_sdk.MoltbookClient(
+                api_key='coherence', base_url=server.base_url,
+                agent_name=dataset.agent_name(server.me), **options
+            )
+            print(f"\n{label}:")
+            try:
+                failures += [f"{label}: {failure}" for failure in check_coherence(server, client)]
+            except Exception as e:
+                failures.append(f"{label}: setup failed: {type(e).__name__}: {e}")
+                print(f"  ✗ {failures[-1]}")
+            finally:
+                client.close()
+
+    print()
+    if failures:
+        print(f"❌ {len(failures)} failed check(s):")
+        for failure in failures:
+            print(f"  {failure}")
+        return False
+    print("✅ No stale reads")
+    return True
+
+
+def main():
+    """CLI interface"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark moltbook_sdk against a local stub server'
+    )
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    pool_parser = subparsers.add_parser('pool', help='urlopen vs keep-alive pool')
+    pool_parser.add_argument('--requests', type=int, default=500)
+    pool_parser.add_argument('--threads', type=int, default=1)
+
+    hooks_parser = subparsers.add_parser('hooks', help='observer overhead and phase percentiles')
+    hooks_parser.add_argument('--requests', type=int, default=2000)
+
+    profile_parser = subparsers.add_parser('profile', help='eager models vs lazy ProfileView')
+    profile_parser.add_argument('--posts', type=int, default=5000)
+    profile_parser.add_argument('--rounds', type=int, default=50)
+
+    memory_parser = subparsers.add_parser('memory', help='footprint per 100k posts by model form')
+    memory_parser.add_argument('--posts', type=int, default=100_000)
+
+    stream_parser = subparsers.add_parser('stream', help='whole-body vs streaming JSON decode')
+    stream_parser.add_argument('--posts', type=int, default=5000)
+
+    json_parser = subparsers.add_parser('json', help='JSON backends on recorded payloads')
+    json_parser.add_argument('--posts', type=int, default=500)
+    json_parser.add_argument('--rounds', type=int, default=50)
+    json_parser.add_argument('--file', nargs='*', default=[],
+                             help='Extra recorded JSON files (responses, health logs, state)')
+
+    subparsers.add_parser('coherence', help='read-after-write check against the fake API')
+
+    args = parser.parse_args()
+
+    if args.benchmark == 'pool':
+        bench_pool(args.requests, args.threads)
+    elif args.benchmark == 'hooks':
+        bench_hooks(args.requests)
+    elif args.benchmark == 'profile':
+        bench_profile(args.posts, args.rounds)
+    elif args.benchmark == 'memory':
+        bench_memory(args.posts)
+    elif args.benchmark == 'stream':
+        bench_stream(args.posts)
+    elif args.benchmark == 'json':
+        bench_json(args.posts, args.file, args.rounds)
+    elif args.benchmark == 'coherence':
+        if not bench_coherence():
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,12 @@ Date: 2026-02-05
 import sys
 import os
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_ratelimit
+import moltbook_cassette
 
 
 class CommentAnalyzer:
@@ -255,13 +257,15 @@ class BatchDraftGenerator:
         self.responder = SmartResponder(persona)
 
     def generate_for_post(self, post: moltbook_sdk.Post,
-                          comments: List[moltbook_sdk.Comment]) -> List[Dict]:
+                          comments: List[moltbook_sdk.Comment],
+                          author: Optional[str] = None) -> List[Dict]:
         """
         Generate response drafts for all comments on a post.
 
         Args:
             post: The post object
             comments: List of comments on the post
+            author: Post author; their own comments are skipped
 
         Returns:
             List of dicts with comment info and drafted responses
@@ -269,8 +273,8 @@ class BatchDraftGenerator:
         drafts = []
 
         for comment in comments:
-            # Skip if comment is by the post author (probably self-reply)
-            if comment.author == post.submolt:
+            # Skip the author's own comments (self-replies)
+            if author is not None and comment.author == author:
                 continue
 
             draft, reasoning = self.responder.generate_response(
@@ -333,43 +337,47 @@ def analyze_and_suggest(agent_name: str, api_key: str = None,
         api_key: Optional API key
         persona: Response persona to use
     """
-    client = moltbook_sdk.MoltbookClient(api_key=api_key)
+    client = moltbook_sdk.MoltbookClient(api_key=api_key,
+                                         rate_limiter=moltbook_ratelimit.RateLimiter())
     generator = BatchDraftGenerator(persona)
 
     print(f"🤖 Smart Commenter - Analyzing {agent_name}")
     print('=' * 70)
 
     try:
-        profile = client.get_agent_profile(agent_name)
-        posts_data = profile.get('recentPosts', [])
-        posts = [moltbook_sdk.Post.from_dict(p) for p in posts_data]
+        profile = client.get_profile_view(agent_name)
+        posts = {post.id: post for post in profile.posts.where(lambda p: p.get('comment_count', 0) > 0)}
 
         all_drafts = []
 
-        for post in posts:
-            if post.comment_count == 0:
-                continue
-
+        # Comments of every post are fetched in parallel; drafts are only
+        # generated for comments the agent has not replied to yet
+        for result in client.get_comment_trees(posts):
+            post = posts[result.post_id]
             print(f"\n📌 Analyzing: {post.title}")
-            print(f"   💬 {post.comment_count} comments")
+            print(f"   💬 {post.comment_count} comments | Post ID: {post.id}")
 
-            # Note: In a real implementation, we'd fetch all comments for the post
-            # For now, we'll show what we'd do
-            print(f"   (Would fetch {post.comment_count} comments and generate drafts)")
-            print(f"   Post ID: {post.id}")
+            if not result.ok:
+                print(f"   ❌ Could not fetch comments: {result.error}")
+                continue
+
+            comments = [moltbook_sdk.Comment.from_dict(c) for c in result.tree.unreplied(agent_name)]
+            drafts = generator.generate_for_post(post, comments, author=agent_name)
+            print(f"   {len(comments)} without a reply from {agent_name}")
+            if drafts:
+                display_drafts(drafts, post.title)
 
-            # Placeholder for when we have comment fetching
             all_drafts.append({
                 'post': post,
-                'drafts': []  # Would be filled with actual comment data
+                'drafts': drafts
             })
 
         print("\n" + "=" * 70)
         print("📊 SUMMARY")
         print("=" * 70)
         print(f"Posts with comments: {len(all_drafts)}")
+        print(f"Drafts generated: {sum(len(d['drafts']) for d in all_drafts)}")
         print(f"Persona: {persona}")
-        print("\nNote: Full comment fetching requires additional API endpoints.")
 
     except moltbook_sdk.MoltbookAPIError as e:
         print(f"❌ Error: {e}")
@@ -429,7 +437,10 @@ def main():
         action='store_true'
     )
 
+    moltbook_cassette.add_arguments(parser)
+
     args = parser.parse_args()
+    moltbook_cassette.install(args)
 
     if args.demo or not args.agent:
         demo_mode()
@@ -24,7 +24,6 @@ Usage:
 
 import sys
 import os
-import json
 import re
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple, Any
@@ -37,6 +36,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 try:
     import moltbook_sdk as mb
+    import moltbook_ratelimit
+    import moltbook_cassette
 except ImportError:
     print("Error: moltbook_sdk.py not found in same directory")
     sys.exit(1)
@@ -275,7 +276,8 @@ class SmartPoster:
             config_path: Path to config file (default: ~/.moltbook/config.json)
         """
         self.api_key = api_key or self._load_api_key(config_path)
-        self.client = mb.MoltbookClient(api_key=self.api_key)
+        self.client = mb.MoltbookClient(api_key=self.api_key,
+                                        rate_limiter=moltbook_ratelimit.RateLimiter())
         self.scheduled_posts: List[PostDraft] = []
         self.config = self._load_config(config_path)
 
@@ -285,10 +287,9 @@ class SmartPoster:
             config_path = os.path.expanduser("~/.moltbook/config.json")
 
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                return config.get('api_key')
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            config = mb.load_json(config_path)
+            return config.get('api_key')
+        except (FileNotFoundError, ValueError, KeyError):
             return None
 
     def _load_config(self, config_path: Optional[str]) -> Dict[str, Any]:
@@ -297,9 +298,8 @@ class SmartPoster:
             config_path = os.path.expanduser("~/.moltbook/config.json")
 
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            return mb.load_json(config_path)
+        except (FileNotFoundError, ValueError):
             return {
                 "default_submolt": "general",
                 "auto_format": True,
@@ -768,7 +768,10 @@ def main():
     parser.add_argument("--interactive", action="store_true",
                        help="Run interactive wizard")
 
+    moltbook_cassette.add_arguments(parser)
+
     args = parser.parse_args()
+    moltbook_cassette.install(args)
 
     print_banner()
 
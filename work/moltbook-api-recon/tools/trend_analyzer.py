@@ -16,12 +16,16 @@ Date: 2026-02-05
 import sys
 import os
 import re
+import time
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_async
+import moltbook_store
+import moltbook_timeseries
+import moltbook_cassette
 
 
 class ContentAnalyzer:
@@ -41,32 +45,53 @@ class ContentAnalyzer:
         'analysis', 'benchmark', 'comparison', 'vs', 'versus'
     ]
 
+    # Common words ignored by keyword extraction
+    STOPWORDS = {'this', 'that', 'with', 'from', 'have', 'been', 'they',
+                 'their', 'what', 'when', 'where', 'will', 'just', 'like',
+                 'more', 'some', 'time', 'only', 'also', 'into', 'than'}
+
     @staticmethod
-    def extract_keywords(text: str, top_n: int = 10) -> List[Tuple[str, int]]:
-        """Extract top keywords from text"""
+    def count_keywords(text: str, counts: Optional[Counter] = None) -> Counter:
+        """
+        Count keywords in text, adding to `counts` if given.
+
+        Lets callers feed posts one at a time (e.g. from a streamed
+        response) instead of joining all content into one string.
+        """
+        if counts is None:
+            counts = Counter()
         # Simple word extraction (more sophisticated would use NLP)
         words = re.findall(r'\b[a-zA-Z]{4,}\b', text.lower())
+        counts.update(w for w in words if w not in ContentAnalyzer.STOPWORDS)
+        return counts
 
-        # Filter common words
-        stopwords = {'this', 'that', 'with', 'from', 'have', 'been', 'they',
-                    'their', 'what', 'when', 'where', 'will', 'just', 'like',
-                    'more', 'some', 'time', 'only', 'also', 'into', 'than'}
-
-        filtered = [w for w in words if w not in stopwords and len(w) > 3]
-        return Counter(filtered).most_common(top_n)
+    @staticmethod
+    def extract_keywords(text: str, top_n: int = 10) -> List[Tuple[str, int]]:
+        """Extract top keywords from text"""
+        return ContentAnalyzer.count_keywords(text).most_common(top_n)
 
     @staticmethod
     def calculate_content_quality(post: moltbook_sdk.Post) -> Dict:
         """
         Calculate quality score for a post.
 
+        Returns dict with score and breakdown
+        """
+        return ContentAnalyzer.score_content(post.title, post.content)
+
+    @staticmethod
+    def score_content(title: str, content: str) -> Dict:
+        """
+        calculate_content_quality() from a post's title and content, e.g.
+        read from a raw post dict without building a Post.
+
         Returns dict with score and breakdown
         """
         score = 0
         factors = []
 
         # Length factor (substantial content)
-        content_len = len(post.content)
+        content_len = len(content)
         if content_len > 500:
             score += 10
             factors.append('substantial_length')
@@ -75,7 +100,7 @@ class ContentAnalyzer:
             factors.append('decent_length')
 
         # Code snippets
-        code_snippets = len(re.findall(r'```[a-zA-Z]*\n.*?```', post.content, re.DOTALL))
+        code_snippets = len(re.findall(r'```[a-zA-Z]*\n.*?```', content, re.DOTALL))
         if code_snippets >= 2:
             score += 15
             factors.append(f'multiple_code_blocks')
@@ -84,8 +109,10 @@ class ContentAnalyzer:
             factors.append('has_code')
 
         # Technical depth
+        content_lower = content.lower()
+        title_lower = title.lower()
         tech_count = sum(1 for kw in ContentAnalyzer.TECH_KEYWORDS
-                        if kw.lower() in post.content.lower())
+                        if kw.lower() in content_lower)
         if tech_count >= 5:
             score += 15
             factors.append('high_tech_depth')
@@ -95,13 +122,13 @@ class ContentAnalyzer:
 
         # Quality indicators
         quality_count = sum(1 for qi in ContentAnalyzer.QUALITY_INDICATORS
-                           if qi.lower() in post.title.lower() or qi.lower() in post.content.lower())
+                           if qi.lower() in title_lower or qi.lower() in content_lower)
         if quality_count >= 1:
             score += 10
             factors.append('educational_content')
 
         # Title quality
-        if any(c in post.title for c in ['?', ':', '-', '—']):
+        if any(c in title for c in ['?', ':', '-', '—']):
             score += 5
             factors.append('structured_title')
 
@@ -141,61 +168,125 @@ class TrendDetector:
         self.analyzer = ContentAnalyzer()
 
     def analyze_submolt_trends(self, client: moltbook_sdk.MoltbookClient,
-                               submolts: List[str]) -> Dict[str, Dict]:
+                               submolts: List[str], stream: bool = False,
+                               max_posts: Optional[int] = None,
+                               since: Optional[float] = None) -> Dict[str, Dict]:
         """
         Analyze trending topics across multiple submolts.
 
+        Args:
+            client: MoltbookClient instance
+            submolts: Submolt names
+            stream: Decode each submolt's posts as they download, one
+                submolt at a time (bounded memory for huge submolts)
+                instead of fetching all submolts concurrently
+            max_posts: Walk every page of each submolt, up to this many posts
+                (default: first page only)
+            since: Walk newest posts page by page back to this epoch time
+
         Returns dict with submolt -> trending topics
         """
         trends = {}
 
-        for submolt in submolts:
-            try:
-                data = client.get_submolt(submolt, sort='hot')
-                posts_data = data.get('posts', [])
-                posts = [moltbook_sdk.Post.from_dict(p) for p in posts_data]
-
-                # Combine all content
-                all_content = ' '.join(p.title + ' ' + p.content for p in posts)
-                keywords = self.analyzer.extract_keywords(all_content, top_n=15)
-
-                # Calculate average engagement
-                avg_upvotes = sum(p.upvotes for p in posts) / len(posts) if posts else 0
-                avg_comments = sum(p.comment_count for p in posts) / len(posts) if posts else 0
-
-                trends[submolt] = {
-                    'top_keywords': keywords,
-                    'post_count': len(posts),
-                    'avg_upvotes': avg_upvotes,
-                    'avg_comments': avg_comments,
-                    'hot_topics': [kw for kw, _ in keywords[:5]]
-                }
+        if max_posts is not None or since is not None:
+            stop = moltbook_sdk.created_before(since) if since is not None else None
+            for submolt in submolts:
+                try:
+                    posts = client.iter_submolt_posts(
+                        submolt, sort='new' if since is not None else 'hot',
+                        stop=stop, max_items=max_posts
+                    )
+                    trends[submolt] = self._summarize_posts(
+                        moltbook_sdk.Post.from_dict(p) for p in posts
+                    )
+                except moltbook_sdk.MoltbookAPIError as e:
+                    trends[submolt] = {'error': str(e)}
+            return trends
+
+        if stream:
+            for submolt in submolts:
+                try:
+                    posts = (moltbook_sdk.Post.from_dict(item)
+                             for key, item in client.stream_submolt(submolt, sort='hot')
+                             if key == 'posts')
+                    trends[submolt] = self._summarize_posts(posts)
+                except moltbook_sdk.MoltbookAPIError as e:
+                    trends[submolt] = {'error': str(e)}
+            return trends
+
+        responses = moltbook_async.fetch_many(client, 'get_submolt', submolts, sort='hot')
+
+        for submolt, data in zip(submolts, responses):
+            if isinstance(data, moltbook_sdk.MoltbookAPIError):
+                trends[submolt] = {'error': str(data)}
+                continue
 
-            except moltbook_sdk.MoltbookAPIError as e:
-                trends[submolt] = {'error': str(e)}
+            posts_data = data.get('posts', [])
+            trends[submolt] = self._summarize_posts(
+                moltbook_sdk.Post.from_dict(p) for p in posts_data
+            )
 
         return trends
 
+    def analyze_stored_trends(self, store: moltbook_store.MoltbookStore, submolts: List[str],
+                              max_posts: Optional[int] = None,
+                              since: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Analyze trending topics from a local store, without requests.
+
+        Args:
+            store: MoltbookStore holding mirrored posts
+            submolts: Submolt names
+            max_posts: Newest/hottest posts per submolt (default: all stored)
+            since: Only posts created after this epoch time
+
+        Returns dict with submolt -> trending topics
+        """
+        return {
+            submolt: self._summarize_posts(store.posts(
+                submolt=submolt, since=since, sort='new' if since is not None else 'hot',
+                limit=max_posts
+            ))
+            for submolt in submolts
+        }
+
+    def _summarize_posts(self, posts: Iterable[moltbook_sdk.Post]) -> Dict:
+        """Keywords and average engagement, consuming posts one at a time"""
+        counts = Counter()
+        post_count = total_upvotes = total_comments = 0
+
+        for post in posts:
+            self.analyzer.count_keywords(post.title + ' ' + post.content, counts)
+            post_count += 1
+            total_upvotes += post.upvotes
+            total_comments += post.comment_count
+
+        keywords = counts.most_common(15)
+
+        return {
+            'top_keywords': keywords,
+            'post_count': post_count,
+            'avg_upvotes': total_upvotes / post_count if post_count else 0,
+            'avg_comments': total_comments / post_count if post_count else 0,
+            'hot_topics': [kw for kw, _ in keywords[:5]]
+        }
+
     def find_best_posting_times(self, posts: List[moltbook_sdk.Post]) -> Dict:
         """
         Analyze posts to find best times to post.
 
-        Returns dict with hour -> engagement stats
+        Returns dict with UTC hour -> engagement stats
         """
         hourly_stats = defaultdict(lambda: {'upvotes': 0, 'comments': 0, 'count': 0})
 
         for post in posts:
-            try:
-                # Parse timestamp
-                dt = datetime.fromisoformat(post.created_at.replace('+00:00', ''))
-                hour = dt.hour
-                day = dt.strftime('%A')
-
-                hourly_stats[hour]['upvotes'] += post.upvotes
-                hourly_stats[hour]['comments'] += post.comment_count
-                hourly_stats[hour]['count'] += 1
-            except (ValueError, AttributeError):
-                continue
+            if not post.created_ts:
+                continue  # Missing or malformed timestamp
+
+            hour = int(post.created_ts) // 3600 % 24
+            hourly_stats[hour]['upvotes'] += post.upvotes
+            hourly_stats[hour]['comments'] += post.comment_count
+            hourly_stats[hour]['count'] += 1
 
         # Calculate averages
         hourly_avg = {}
@@ -222,8 +313,17 @@ class TrendDetector:
 class GrowthTracker:
     """Track agent growth and benchmark against others"""
 
-    def __init__(self, client: moltbook_sdk.MoltbookClient):
+    def __init__(self, client: moltbook_sdk.MoltbookClient,
+                 series: Optional[moltbook_timeseries.TimeSeriesStore] = None):
+        """
+        Args:
+            client: MoltbookClient, or a moltbook_store.MoltbookStore to
+                analyze mirrored profiles offline
+            series: Optional TimeSeriesStore (filled by moltbook_sync) for
+                karma/follower growth over time
+        """
         self.client = client
+        self.series = series
         self.analyzer = ContentAnalyzer()
 
     def analyze_agent_growth(self, agent_name: str) -> Dict:
@@ -234,52 +334,84 @@ class GrowthTracker:
         """
         try:
             profile = self.client.get_agent_profile(agent_name)
-            agent = profile.get('agent', {})
-            posts_data = profile.get('recentPosts', [])
-            posts = [moltbook_sdk.Post.from_dict(p) for p in posts_data]
-
-            # Basic stats
-            total_upvotes = sum(p.upvotes for p in posts)
-            total_comments = sum(p.comment_count for p in posts)
-            avg_quality = sum(self.analyzer.calculate_content_quality(p)['score']
-                             for p in posts) / len(posts) if posts else 0
-
-            # Content analysis
-            all_content = ' '.join(p.title + ' ' + p.content for p in posts)
-            top_keywords = self.analyzer.extract_keywords(all_content)
-
-            # Engagement rate
-            engagement_rate = (total_upvotes + total_comments * 2) / len(posts) if posts else 0
-
-            # Best performing posts
-            sorted_posts = sorted(posts, key=lambda p: p.upvotes, reverse=True)
-            top_posts = sorted_posts[:3]
-
-            return {
-                'agent_name': agent_name,
-                'karma': agent.get('karma', 0),
-                'followers': agent.get('follower_count', 0),
-                'total_posts': len(posts),
-                'total_upvotes': total_upvotes,
-                'total_comments_received': total_comments,
-                'avg_quality_score': avg_quality,
-                'engagement_rate': engagement_rate,
-                'top_keywords': top_keywords,
-                'best_posts': [
-                    {
-                        'title': p.title,
-                        'upvotes': p.upvotes,
-                        'comments': p.comment_count,
-                        'quality_score': self.analyzer.calculate_content_quality(p)['score']
-                    }
-                    for p in top_posts
-                ],
-                'submolts_posted_in': list(set(p.submolt for p in posts))
-            }
-
         except moltbook_sdk.MoltbookAPIError as e:
             return {'error': str(e)}
 
+        return self._analyze_profile(agent_name, profile)
+
+    def _analyze_profile(self, agent_name: str, profile: Dict) -> Dict:
+        """Build the growth analysis from an already fetched profile"""
+        view = moltbook_sdk.ProfileView(profile)
+        agent = view.get('agent', {})
+        posts = view.posts
+
+        # Basic stats
+        total_upvotes = view.total_upvotes
+        total_comments = view.total_comments_received
+        # Quality and keywords come from the raw dicts; only the reported
+        # best posts are built as Post models
+        quality_total = 0
+        keyword_counts = Counter()
+        for item in posts.raw:
+            title, content = item.get('title') or '', item.get('content') or ''
+            quality_total += self.analyzer.score_content(title, content)['score']
+            self.analyzer.count_keywords(f"{title} {content}", keyword_counts)
+        avg_quality = quality_total / len(posts) if posts else 0
+
+        # Content analysis
+        top_keywords = keyword_counts.most_common(10)
+
+        # Engagement rate
+        engagement_rate = (total_upvotes + total_comments * 2) / len(posts) if posts else 0
+
+        # Best performing posts
+        top_posts = view.top_posts(3)
+
+        analysis = {
+            'agent_name': agent_name,
+            'karma': agent.get('karma', 0),
+            'followers': agent.get('follower_count', 0),
+            'total_posts': len(posts),
+            'total_upvotes': total_upvotes,
+            'total_comments_received': total_comments,
+            'avg_quality_score': avg_quality,
+            'engagement_rate': engagement_rate,
+            'top_keywords': top_keywords,
+            'best_posts': [
+                {
+                    'title': p.title,
+                    'upvotes': p.upvotes,
+                    'comments': p.comment_count,
+                    'quality_score': self.analyzer.calculate_content_quality(p)['score']
+                }
+                for p in top_posts
+            ],
+            'submolts_posted_in': view.submolts
+        }
+        if self.series is not None:
+            analysis['growth'] = self._growth(agent_name, posts)
+        return analysis
+
+    def _growth(self, agent_name: str, posts) -> Dict:
+        """24h change and 7-day daily rate of karma/followers, and the posts rising fastest"""
+        key = moltbook_timeseries.agent_key(agent_name)
+        growth = {
+            metric: {
+                'delta_24h': self.series.delta(key, metric),
+                'per_day_7d': self.series.rate(key, metric, window=7 * moltbook_timeseries.DAY)
+            }
+            for metric in moltbook_timeseries.AGENT_METRICS
+        }
+
+        rising = []
+        for item in posts.raw:
+            gained = self.series.delta(moltbook_timeseries.post_key(item.get('id', '')), 'upvotes')
+            if gained:
+                rising.append({'title': item.get('title', ''), 'upvotes_24h': gained})
+        rising.sort(key=lambda p: p['upvotes_24h'], reverse=True)
+        growth['rising_posts'] = rising[:3]
+        return growth
+
     def benchmark_agents(self, agent_names: List[str]) -> Dict:
         """
         Compare multiple agents across key metrics.
@@ -287,9 +419,11 @@ class GrowthTracker:
         Returns benchmark analysis
         """
         analyses = {}
-
-        for agent_name in agent_names:
-            analyses[agent_name] = self.analyze_agent_growth(agent_name)
+        for result in self.client.get_profiles(agent_names):
+            if result.ok:
+                analyses[result.name] = self._analyze_profile(result.name, result.profile)
+            else:
+                analyses[result.name] = {'error': str(result.error)}
 
         # Calculate rankings
         valid_analyses = {k: v for k, v in analyses.items() if 'error' not in v}
@@ -350,6 +484,19 @@ class GrowthTracker:
                 f"🎯 Leverage your strength: You have credibility on '{top_kw}' - create more content in this area"
             )
 
+        # Growth trend (needs the time series)
+        karma = analysis.get('growth', {}).get('karma', {})
+        if karma.get('per_day_7d') is not None:
+            if karma['per_day_7d'] <= 0:
+                recommendations.append(
+                    "📉 Karma is flat this week: revisit your best posts' topics and post more often"
+                )
+            elif karma['delta_24h'] is not None and karma['delta_24h'] < karma['per_day_7d'] / 2:
+                recommendations.append(
+                    f"⏳ Karma slowed: +{karma['delta_24h']:.0f} today vs "
+                    f"+{karma['per_day_7d']:.0f}/day this week"
+                )
+
         # Timing recommendations (would need more data)
         recommendations.append(
             "⏰ Experiment with timing: Try posting at different times to find your sweet spot"
@@ -392,6 +539,21 @@ def display_growth_analysis(analysis: Dict):
 
     print(f"\n📂 Submolts: {', '.join(analysis.get('submolts_posted_in', []))}")
 
+    growth = analysis.get('growth')
+    if growth:
+        print(f"\n📈 Growth (time series):")
+        for metric, label in (('karma', 'Karma'), ('follower_count', 'Followers')):
+            change = growth[metric]
+            if change['delta_24h'] is None:
+                print(f"  {label}: no samples yet (run moltbook_sync.py)")
+                continue
+            line = f"  {label}: {change['delta_24h']:+.0f} in 24h"
+            if change['per_day_7d'] is not None:
+                line += f" | {change['per_day_7d']:+.1f}/day over 7 days"
+            print(line)
+        for post in growth['rising_posts']:
+            print(f"  ⬆️ +{post['upvotes_24h']:.0f} in 24h: {post['title']}")
+
 
 def display_benchmark(benchmark: Dict):
     """Display benchmark comparison"""
@@ -445,11 +607,53 @@ def main():
         help='Moltbook API key',
         default=os.environ.get('MOLTBOOK_API_KEY')
     )
+    parser.add_argument(
+        '--stream',
+        help='Decode submolt posts while downloading (bounded memory, for --mode trends)',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--max-posts',
+        type=int,
+        help='Page through up to N posts per submolt instead of the first page (for --mode trends)'
+    )
+    parser.add_argument(
+        '--since-hours',
+        type=float,
+        help='Page through posts newer than N hours per submolt (for --mode trends)'
+    )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const='',
+        help='Mirror fetched agents/posts/comments into a local SQLite store '
+             '(default path: ~/.moltbook/store.sqlite3)'
+    )
+    parser.add_argument(
+        '--offline',
+        help='Analyze from the local store only, without API requests',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--series',
+        nargs='?',
+        const='',
+        help='Add karma/follower growth from the time-series store recorded by moltbook_sync.py '
+             '(default path: ~/.moltbook/timeseries.sqlite3)'
+    )
+
+    moltbook_cassette.add_arguments(parser)
 
     args = parser.parse_args()
+    moltbook_cassette.install(args)
 
-    client = moltbook_sdk.MoltbookClient(api_key=args.api_key)
-    tracker = GrowthTracker(client)
+    store = None
+    if args.store is not None or args.offline:
+        store = moltbook_store.MoltbookStore(args.store or None)
+    client = moltbook_sdk.MoltbookClient(api_key=args.api_key,
+                                         listeners=[store] if store else None)
+    series = moltbook_timeseries.TimeSeriesStore(args.series or None) if args.series is not None else None
+    tracker = GrowthTracker(store if args.offline else client, series=series)
 
     if args.mode == 'growth':
         for agent in args.agents:
@@ -470,7 +674,13 @@ def main():
     elif args.mode == 'trends':
         detector = TrendDetector()
         submolts = args.submolts.split(',')
-        trends = detector.analyze_submolt_trends(client, submolts)
+        since = time.time() - args.since_hours * 3600 if args.since_hours is not None else None
+        if args.offline:
+            trends = detector.analyze_stored_trends(store, submolts, max_posts=args.max_posts,
+                                                    since=since)
+        else:
+            trends = detector.analyze_submolt_trends(client, submolts, stream=args.stream,
+                                                     max_posts=args.max_posts, since=since)
 
         print("\n🔥 TRENDING TOPICS BY SUBMOLT")
         print('=' * 70)
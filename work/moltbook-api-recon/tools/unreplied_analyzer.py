@@ -15,31 +15,44 @@ import os
 # Add the tools directory to path to import moltbook_sdk
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import moltbook_sdk
+import moltbook_store
+import moltbook_cassette
 
 
-def analyze_post_for_replies(post, all_comments):
+def analyze_post_for_replies(post, all_comments, tree=None, agent_name=None):
     """
     Analyze a single post to identify comments that might need replies.
 
     Args:
         post: Post object
         all_comments: All comments by the agent (to find which posts they commented on)
+        tree: Optional CommentTree of the post; when given, unreplied
+            comments are counted exactly instead of guessed
+        agent_name: Post author (required with `tree`)
 
     Returns:
         Dict with analysis results
     """
-    post_comments = [c for c in all_comments if c.post_id == post.id]
+    if tree is not None:
+        unreplied_count = len(tree.unreplied(agent_name))
+        has_self_reply = any(tree.author(c) == agent_name for c in tree)
+        needs_reply = unreplied_count > 0
+    else:
+        post_comments = [c for c in all_comments if c.post_id == post.id]
 
-    # Check if agent has replied to their own post
-    has_self_reply = any(c.author == post.submolt for c in post_comments)  # Simplified
+        # Check if agent has replied to their own post
+        has_self_reply = any(c.author == post.submolt for c in post_comments)  # Simplified
+        unreplied_count = None
+        needs_reply = post.comment_count > 0 and not has_self_reply
 
     return {
         'post_id': post.id,
         'title': post.title,
         'comment_count': post.comment_count,
+        'unreplied_count': unreplied_count,
         'has_self_reply': has_self_reply,
         'upvotes': post.upvotes,
-        'needs_reply': post.comment_count > 0 and not has_self_reply,
+        'needs_reply': needs_reply,
         'priority': calculate_priority(post)
     }
 
@@ -71,25 +84,30 @@ def format_comment(comment):
     return f"[{comment.upvotes}↑] {preview}"
 
 
-def analyze_agent(agent_name, api_key=None):
+def analyze_agent(agent_name, api_key=None, profile=None, client=None):
     """
     Full analysis of an agent's posts for unreplied comments.
 
     Args:
         agent_name: Agent name to analyze
         api_key: Optional API key for authenticated requests
+        profile: Optional already fetched profile (skips the request)
+        client: Optional MoltbookClient to reuse, or a
+            moltbook_store.MoltbookStore to analyze mirrored data offline
 
     Returns:
         Analysis results dict
     """
-    client = moltbook_sdk.MoltbookClient(api_key=api_key)
-
     print(f"🔍 Analyzing: {agent_name}")
     print("=" * 60)
 
     try:
         # Get agent data
-        profile = client.get_agent_profile(agent_name)
+        if client is None:
+            client = moltbook_sdk.MoltbookClient(api_key=api_key)
+        if profile is None:
+            profile = client.get_agent_profile(agent_name)
+
         agent = profile.get('agent', {})
         posts_data = profile.get('recentPosts', [])
         comments_data = profile.get('recentComments', [])
@@ -102,10 +120,18 @@ def analyze_agent(agent_name, api_key=None):
         print(f"Posts: {len(posts)}")
         print(f"Recent comments: {len(comments)}\n")
 
+        # Fetch the comments of every commented post in parallel
+        trees = {}
+        for fetched in client.get_comment_trees(p.id for p in posts if p.comment_count > 0):
+            if fetched.ok:
+                trees[fetched.post_id] = fetched.tree
+            else:
+                print(f"⚠️  Comments of {fetched.post_id} unavailable ({fetched.error}), guessing")
+
         # Analyze posts
         results = []
         for post in posts:
-            analysis = analyze_post_for_replies(post, comments)
+            analysis = analyze_post_for_replies(post, comments, trees.get(post.id), agent_name)
             results.append(analysis)
 
         # Sort by priority
@@ -124,6 +150,8 @@ def analyze_agent(agent_name, api_key=None):
             for i, r in enumerate(high_priority, 1):
                 print(f"{i}. {r['title']}")
                 print(f"   💬 {r['comment_count']} comments | ⬆️ {r['upvotes']} upvotes | Priority: {r['priority']}")
+                if r['unreplied_count'] is not None:
+                    print(f"   Unreplied: {r['unreplied_count']}")
                 print(f"   ID: {r['post_id']}\n")
 
         if medium_priority:
@@ -172,13 +200,14 @@ def analyze_agent(agent_name, api_key=None):
         return None
 
 
-def batch_analyze(agent_names, api_key=None):
+def batch_analyze(agent_names, api_key=None, client=None):
     """
     Analyze multiple agents and compare their engagement.
 
     Args:
         agent_names: List of agent names
         api_key: Optional API key
+        client: Optional MoltbookClient or moltbook_store.MoltbookStore
 
     Returns:
         Comparison results
@@ -189,12 +218,20 @@ def batch_analyze(agent_names, api_key=None):
 
     results = []
 
-    for agent_name in agent_names:
+    # Fetch every profile concurrently, analyzing each as it arrives
+    if client is None:
+        client = moltbook_sdk.MoltbookClient(api_key=api_key)
+
+    for fetched in client.get_profiles(agent_names):
         print(f"\n{'=' * 60}")
-        print(f"Analyzing: {agent_name}")
+        print(f"Analyzing: {fetched.name}")
         print('=' * 60)
 
-        result = analyze_agent(agent_name, api_key)
+        if not fetched.ok:
+            print(f"❌ API Error: {fetched.error}")
+            continue
+
+        result = analyze_agent(fetched.name, api_key, profile=fetched.profile, client=client)
         if result:
             results.append(result)
 
@@ -231,15 +268,39 @@ def main():
         help='Moltbook API key (optional, for authenticated requests)',
         default=None
     )
+    parser.add_argument(
+        '--store',
+        nargs='?',
+        const='',
+        help='Mirror fetched agents/posts/comments into a local SQLite store '
+             '(default path: ~/.moltbook/store.sqlite3)'
+    )
+    parser.add_argument(
+        '--offline',
+        help='Analyze from the local store only, without API requests',
+        action='store_true'
+    )
+
+    moltbook_cassette.add_arguments(parser)
 
     args = parser.parse_args()
+    moltbook_cassette.install(args)
+
+    store = None
+    if args.store is not None or args.offline:
+        store = moltbook_store.MoltbookStore(args.store or None)
+    if args.offline:
+        client = store
+    else:
+        client = moltbook_sdk.MoltbookClient(api_key=args.api_key,
+                                             listeners=[store] if store else None)
 
     # Check if batch mode
     if ',' in args.agent:
         agents = [a.strip() for a in args.agent.split(',')]
-        batch_analyze(agents, args.api_key)
+        batch_analyze(agents, args.api_key, client=client)
     else:
-        analyze_agent(args.agent, args.api_key)
+        analyze_agent(args.agent, args.api_key, client=client)
 
 
 if __name__ == "__main__":